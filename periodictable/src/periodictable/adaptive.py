@@ -0,0 +1,288 @@
+"""
+Adaptive Testing
+Computerized adaptive testing under the Rasch (one-parameter logistic) model. Item
+difficulties start from the element's difficulty level and question type, and are
+calibrated from the recorded answer history with vectorized Newton steps over every
+answer at once. During a session the ability estimate and its standard error are
+updated online after each answer, and the next question is the unasked item with the
+most Fisher information at the current estimate. The session stops once the ability
+is known to the target precision.
+"""
+
+import time
+
+import numpy as np
+
+try:
+    from .quiz_engine import element_difficulty, EASY, MEDIUM, HARD, EXPERT
+except ImportError:
+    from quiz_engine import element_difficulty, EASY, MEDIUM, HARD, EXPERT
+
+# Prior difficulty (logits) of each element difficulty level and question type offset
+LEVEL_DIFFICULTY = {EASY: -1.0, MEDIUM: 0.0, HARD: 1.0, EXPERT: 2.0}
+TYPE_OFFSET = {
+    "symbol": -0.5,
+    "atomic_number": 0.0,
+    "electron_config": 0.5,
+    "electron_config_reverse": 1.0,
+    "production": 0.5,
+    "production_reverse": 0.5,
+}
+
+# Precision (1 / variance) of the difficulty and ability priors during calibration
+PRIOR_PRECISION = 1.0
+CALIBRATION_ITERATIONS = 20
+
+# Session defaults: stop at this standard error, within these question counts
+TARGET_SE = 0.6
+MIN_QUESTIONS = 5
+MAX_QUESTIONS = 20
+
+# Next item drawn among this many most informative items, so sessions vary
+TOP_K = 3
+
+
+def probability(theta, difficulty):
+    """
+    Rasch probability of a correct answer.
+
+    Args:
+        theta (float or ndarray): Ability in logits
+        difficulty (float or ndarray): Item difficulty in logits
+
+    Returns:
+        float or ndarray: 1 / (1 + exp(difficulty - theta))
+    """
+    return 1.0 / (1.0 + np.exp(difficulty - theta))
+
+
+def prior_difficulty(element, question_type):
+    """
+    Difficulty of an item before any answer is recorded.
+
+    Args:
+        element (dict): Element entry from elements_data
+        question_type (str): Question type
+
+    Returns:
+        float: Level difficulty plus the question type offset, in logits
+    """
+    return LEVEL_DIFFICULTY[element_difficulty(element)] + TYPE_OFFSET.get(question_type, 0.0)
+
+
+class ItemBank:
+    """
+    Calibrated (symbol, question type) items.
+
+    Attributes:
+        items (list): (symbol, question type) keys
+        index (dict): Key -> position in the arrays
+        prior (ndarray): Prior difficulty of each item
+        difficulty (ndarray): Calibrated difficulty of each item
+        answers (ndarray): Number of recorded answers per item
+    """
+
+    def __init__(self, items, prior):
+        """
+        Create a bank at its prior difficulties.
+
+        Args:
+            items (iterable): (symbol, question type) keys
+            prior (iterable): Prior difficulty of each item, in logits
+        """
+        self.items = list(items)
+        self.index = {item: i for i, item in enumerate(self.items)}
+        self.prior = np.asarray(prior, dtype=float)
+        self.difficulty = self.prior.copy()
+        self.answers = np.zeros(len(self.items), dtype=np.int64)
+
+    @classmethod
+    def from_engine(cls, engine):
+        """
+        Bank of every question in a quiz engine's pool.
+
+        Args:
+            engine (QuizEngine): Engine whose pool is used
+
+        Returns:
+            ItemBank: Uncalibrated bank
+        """
+        return cls(engine.pool, [prior_difficulty(engine.elements[symbol], question_type)
+                                 for symbol, question_type in engine.pool])
+
+    def __len__(self):
+        return len(self.items)
+
+    def calibrate(self, history, iterations=CALIBRATION_ITERATIONS):
+        """
+        Estimate item difficulties from recorded answers.
+
+        Abilities of every student and difficulties of every item are fitted
+        jointly by alternating Newton steps on the penalized Rasch likelihood;
+        each step is a handful of array operations over the whole history.
+        Items nobody answered keep their prior difficulty.
+
+        Args:
+            history (iterable): (student, symbol, question type, correct, ...) rows,
+                as returned by ProgressStore.history()
+            iterations (int): Number of Newton steps
+
+        Returns:
+            ItemBank: self
+        """
+        students, rows, items, correct = {}, [], [], []
+        for student, symbol, question_type, answer_correct, *_ in history:
+            i = self.index.get((symbol, question_type))
+            if i is not None:
+                rows.append(students.setdefault(student, len(students)))
+                items.append(i)
+                correct.append(answer_correct)
+        if not items:
+            return self
+        student = np.asarray(rows)
+        item = np.asarray(items)
+        x = np.asarray(correct, dtype=float)
+        self.answers = np.bincount(item, minlength=len(self.items))
+
+        theta = np.zeros(len(students))
+        b = self.difficulty.copy()
+        n_items = len(self.items)
+        for _ in range(iterations):
+            p = probability(theta[student], b[item])
+            w = p * (1 - p)
+            residual = np.bincount(student, x - p, len(theta)) - PRIOR_PRECISION * theta
+            theta += residual / (np.bincount(student, w, len(theta)) + PRIOR_PRECISION)
+
+            p = probability(theta[student], b[item])
+            w = p * (1 - p)
+            residual = np.bincount(item, p - x, n_items) - PRIOR_PRECISION * (b - self.prior)
+            b += residual / (np.bincount(item, w, n_items) + PRIOR_PRECISION)
+        self.difficulty = b
+        return self
+
+    def information(self, theta):
+        """
+        Fisher information of every item at an ability.
+
+        Args:
+            theta (float): Ability in logits
+
+        Returns:
+            ndarray: p * (1 - p) for each item
+        """
+        p = probability(theta, self.difficulty)
+        return p * (1 - p)
+
+
+class AdaptiveSession:
+    """
+    One adaptive test.
+
+    The ability starts at the prior mean 0 with unit precision. After each
+    answer one Newton step on the log posterior moves the estimate by
+    (correct - p) / information and the item's information p * (1 - p) is
+    added, so the standard error 1 / sqrt(information) shrinks with every
+    question.
+
+    Attributes:
+        bank (ItemBank): Items to choose from
+        theta (float): Current ability estimate in logits
+        precision (float): Test information including the prior
+        asked (ndarray): Boolean mask of items already asked
+        responses (list): (item, correct) pairs in order
+    """
+
+    def __init__(self, bank, target_se=TARGET_SE, min_questions=MIN_QUESTIONS,
+                 max_questions=MAX_QUESTIONS, top_k=TOP_K, rng=None):
+        """
+        Start a session.
+
+        Args:
+            bank (ItemBank): Calibrated item bank
+            target_se (float): Standard error at which the session stops
+            min_questions (int): Questions asked before stopping is considered
+            max_questions (int): Questions asked at most
+            top_k (int): Draw the next item among this many most informative ones
+            rng (numpy.random.Generator): Source of the draw (defaults to a fresh one)
+        """
+        self.bank = bank
+        self.target_se = target_se
+        self.min_questions = min_questions
+        self.max_questions = max_questions
+        self.top_k = top_k
+        self.rng = np.random.default_rng() if rng is None else rng
+        self.theta = 0.0
+        self.precision = PRIOR_PRECISION
+        self.asked = np.zeros(len(bank), dtype=bool)
+        self.responses = []
+
+    @property
+    def standard_error(self):
+        """Standard error of the ability estimate."""
+        return 1.0 / np.sqrt(self.precision)
+
+    @property
+    def finished(self):
+        """Whether the target precision, the question limit or the bank is exhausted."""
+        count = len(self.responses)
+        if count >= self.max_questions or count >= len(self.bank):
+            return True
+        return count >= self.min_questions and self.standard_error <= self.target_se
+
+    def next_item(self):
+        """
+        Select the most informative unasked item.
+
+        Returns:
+            tuple: (symbol, question type), or None when the session is finished
+        """
+        if self.finished:
+            return None
+        information = self.bank.information(self.theta)
+        information[self.asked] = -1.0
+        k = min(self.top_k, len(information) - int(self.asked.sum()))
+        best = np.argpartition(information, -k)[-k:]
+        return self.bank.items[int(self.rng.choice(best))]
+
+    def record(self, item, correct):
+        """
+        Update the ability estimate with an answer.
+
+        Args:
+            item (tuple): (symbol, question type) returned by next_item
+            correct (bool): Whether the answer was correct
+        """
+        i = self.bank.index[item]
+        self.asked[i] = True
+        p = probability(self.theta, self.bank.difficulty[i])
+        self.precision += p * (1 - p)
+        self.theta += (float(correct) - p) / self.precision
+        self.responses.append((item, bool(correct)))
+
+
+def benchmark(size=5000, questions=MAX_QUESTIONS, seed=0):
+    """
+    Measure item selection time over a synthetic bank.
+
+    Args:
+        size (int): Number of items in the bank
+        questions (int): Questions asked per session
+        seed (int): Random seed
+
+    Returns:
+        float: Mean seconds per next_item() call
+    """
+    rng = np.random.default_rng(seed)
+    bank = ItemBank([(str(i), "symbol") for i in range(size)], rng.normal(size=size))
+    session = AdaptiveSession(bank, target_se=0.0, max_questions=questions, rng=rng)
+    elapsed = 0.0
+    for _ in range(questions):
+        start = time.perf_counter()
+        item = session.next_item()
+        elapsed += time.perf_counter() - start
+        session.record(item, rng.random() < 0.5)
+    return elapsed / questions
+
+
+if __name__ == "__main__":
+    print(f"{benchmark() * 1e6:.0f} µs per item selection over 5,000 items")
@@ -0,0 +1,140 @@
+"""
+Widget Lifecycle Diagnostics
+Counts live QObjects, widgets, dialogs and displayed pixmaps under a root object, plus
+the bytes held by the structure image cache, and samples them over time so that
+leaked dialog trees show up as steady growth in tests or long sessions.
+"""
+
+import time
+from collections import deque, namedtuple
+
+from PyQt5.QtCore import QObject, QTimer, pyqtSignal
+from PyQt5.QtWidgets import QWidget, QDialog, QLabel
+
+# One measurement of the live object population
+MemorySnapshot = namedtuple("MemorySnapshot", [
+    "time", "objects", "widgets", "dialogs", "pixmaps", "pixmap_cache_bytes"
+])
+
+
+def pixmap_bytes(pixmap):
+    """
+    Approximate memory used by a pixmap.
+
+    Args:
+        pixmap (QPixmap): Pixmap to measure
+
+    Returns:
+        int: width * height * depth / 8, or 0 for a null pixmap
+    """
+    if pixmap is None or pixmap.isNull():
+        return 0
+    return pixmap.width() * pixmap.height() * pixmap.depth() // 8
+
+
+def take_snapshot(root, image_loader=None):
+    """
+    Count the live objects below a root object.
+
+    Args:
+        root (QObject): Object whose descendants are counted (e.g. the main window)
+        image_loader (StructureImageLoader): Loader whose cache size is reported
+
+    Returns:
+        MemorySnapshot: Current counts
+    """
+    children = root.findChildren(QObject)
+    widgets = [obj for obj in children if isinstance(obj, QWidget)]
+    pixmaps = sum(1 for widget in widgets
+                  if isinstance(widget, QLabel) and widget.pixmap() is not None
+                  and not widget.pixmap().isNull())
+    return MemorySnapshot(
+        time=time.monotonic(),
+        objects=len(children) + 1,
+        widgets=len(widgets),
+        dialogs=sum(1 for widget in widgets if isinstance(widget, QDialog)),
+        pixmaps=pixmaps,
+        pixmap_cache_bytes=image_loader.cache_bytes() if image_loader is not None else 0,
+    )
+
+
+def format_snapshot(snapshot):
+    """
+    One-line text form of a snapshot.
+
+    Args:
+        snapshot (MemorySnapshot): Snapshot to format
+
+    Returns:
+        str: e.g. 'objects=412 widgets=150 dialogs=1 pixmaps=1 pixmap_cache=625.0 KiB'
+    """
+    return (f"objects={snapshot.objects} widgets={snapshot.widgets} "
+            f"dialogs={snapshot.dialogs} pixmaps={snapshot.pixmaps} "
+            f"pixmap_cache={snapshot.pixmap_cache_bytes / 1024:.1f} KiB")
+
+
+class MemoryMonitor(QObject):
+    """
+    Periodically samples live object counts into a bounded history.
+
+    Signals:
+        sampled (object): Emitted with each new MemorySnapshot
+
+    Attributes:
+        history (deque): Most recent snapshots, oldest first
+    """
+
+    sampled = pyqtSignal(object)
+
+    def __init__(self, root, image_loader=None, interval_ms=10000, history=360):
+        """
+        Create a stopped monitor.
+
+        Args:
+            root (QObject): Object whose descendants are counted
+            image_loader (StructureImageLoader): Loader whose cache size is reported
+            interval_ms (int): Sampling period in milliseconds
+            history (int): Number of snapshots kept
+        """
+        super().__init__(root)
+        self.root = root
+        self.image_loader = image_loader
+        self.history = deque(maxlen=history)
+        self.timer = QTimer(self)
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self.sample)
+
+    def start(self):
+        """Take a first sample and start periodic sampling."""
+        self.sample()
+        self.timer.start()
+
+    def stop(self):
+        """Stop periodic sampling."""
+        self.timer.stop()
+
+    def sample(self):
+        """
+        Record and emit a snapshot now.
+
+        Returns:
+            MemorySnapshot: The new snapshot
+        """
+        snapshot = take_snapshot(self.root, self.image_loader)
+        self.history.append(snapshot)
+        self.sampled.emit(snapshot)
+        return snapshot
+
+    def growth(self, field="objects"):
+        """
+        Change of one counter between the oldest and newest snapshot.
+
+        Args:
+            field (str): MemorySnapshot field name
+
+        Returns:
+            int: Newest minus oldest value (0 with fewer than two samples)
+        """
+        if len(self.history) < 2:
+            return 0
+        return getattr(self.history[-1], field) - getattr(self.history[0], field)
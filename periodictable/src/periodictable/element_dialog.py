@@ -0,0 +1,195 @@
+"""
+Element Information Dialog
+A single persistent dialog that displays element details, fed from an LRU cache of
+prepared content bundles (properties HTML, production HTML) keyed by element symbol,
+so repeated clicks only swap label contents. Structure images arrive separately from
+the asynchronous loader in image_loader.py.
+"""
+
+import os
+from collections import OrderedDict, namedtuple
+
+from PyQt5.QtWidgets import QDialog, QVBoxLayout, QLabel
+from PyQt5.QtCore import Qt
+
+# Prepared text content of the element dialog
+ElementContent = namedtuple("ElementContent", ["symbol", "title", "info_html", "production_html"])
+
+# Side length of the structure image in the dialog
+IMAGE_SIZE = 400
+
+
+def structure_image_path(symbol):
+    """
+    Path of the generated atomic structure image of an element.
+
+    Args:
+        symbol (str): Chemical symbol of the element
+
+    Returns:
+        str: Absolute path to '<symbol>_scientific.png' in scientific_structures/
+    """
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    return os.path.normpath(os.path.join(current_dir, "..", "..", "scientific_structures",
+                                         f"{symbol}_scientific.png"))
+
+
+class LRUCache:
+    """
+    Least-recently-used cache with a fixed number of entries.
+
+    Attributes:
+        maxsize (int): Maximum number of entries kept
+        hits (int): Number of successful lookups
+        misses (int): Number of failed lookups
+    """
+
+    def __init__(self, maxsize=32):
+        """
+        Create an empty cache.
+
+        Args:
+            maxsize (int): Maximum number of entries kept (at least 1)
+        """
+        self.maxsize = max(1, maxsize)
+        self.hits = 0
+        self.misses = 0
+        self._data = OrderedDict()
+
+    def __len__(self):
+        return len(self._data)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def get(self, key, default=None):
+        """
+        Return a cached value and mark it as most recently used.
+
+        Args:
+            key: Cache key
+            default: Value returned on a miss
+
+        Returns:
+            Cached value or default
+        """
+        try:
+            value = self._data[key]
+        except KeyError:
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key, value):
+        """
+        Store a value, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key
+            value: Value to store
+        """
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def clear(self):
+        """Remove every entry."""
+        self._data.clear()
+
+
+class ElementInfoDialog(QDialog):
+    """
+    Persistent dialog showing the details of one element at a time.
+
+    The widgets are created once; show_content only replaces their text, so
+    opening the dialog for another element builds no widgets. The structure
+    image is set later through set_pixmap once it has been decoded.
+    """
+
+    def __init__(self, parent=None):
+        """
+        Build the dialog widgets.
+
+        Args:
+            parent (QWidget): Parent widget
+        """
+        super().__init__(parent)
+        self.setFixedSize(600, 700)
+        layout = QVBoxLayout(self)
+
+        # Atomic structure image display
+        self.img_label = QLabel()
+        self.img_label.setAlignment(Qt.AlignCenter)
+        layout.addWidget(self.img_label)
+
+        # Element properties information
+        self.info_label = QLabel()
+        self.info_label.setObjectName("elementInfo")
+        layout.addWidget(self.info_label)
+
+        # Production methods and reaction network
+        self.production_header = QLabel("<b>Production Methods:</b>")
+        self.production_header.setObjectName("sectionHeader")
+        layout.addWidget(self.production_header)
+        self.production_label = QLabel()
+        self.production_label.setObjectName("sectionContent")
+        self.production_label.setWordWrap(True)
+        layout.addWidget(self.production_label)
+        layout.addStretch()
+
+        self.symbol = None
+
+    def show_content(self, content, pixmap=None):
+        """
+        Display a prepared content bundle.
+
+        Args:
+            content (ElementContent): Bundle to display
+            pixmap (QPixmap): Structure image if already decoded; otherwise a
+                loading placeholder is shown until set_pixmap is called
+        """
+        self.symbol = content.symbol
+        self.setWindowTitle(content.title)
+        if pixmap is None:
+            self.set_loading()
+        else:
+            self.set_pixmap(content.symbol, pixmap)
+        self.info_label.setText(content.info_html)
+        self.production_label.setText(content.production_html)
+        self.production_header.setVisible(bool(content.production_html))
+        self.production_label.setVisible(bool(content.production_html))
+
+    def set_loading(self):
+        """Show a placeholder while the structure image is being decoded."""
+        self.img_label.setObjectName("imageFallback")
+        self.img_label.setText("<i>Loading atomic structure…</i>")
+        self._repolish_image()
+
+    def set_pixmap(self, symbol, pixmap):
+        """
+        Show a structure image, or the fallback text when there is none.
+
+        Images for another element than the one displayed are ignored, so a
+        late decode result cannot overwrite the current element.
+
+        Args:
+            symbol (str): Element symbol the image belongs to
+            pixmap (QPixmap): Scaled structure image, or None/null if missing
+        """
+        if symbol != self.symbol:
+            return
+        if pixmap is not None and not pixmap.isNull():
+            self.img_label.setObjectName("")
+            self.img_label.setPixmap(pixmap)
+        else:
+            self.img_label.setObjectName("imageFallback")
+            self.img_label.setText(f"<i>Atomic structure for {symbol} not available</i>")
+        self._repolish_image()
+
+    def _repolish_image(self):
+        """Re-apply the stylesheet after the image label's object name changed."""
+        self.img_label.style().unpolish(self.img_label)
+        self.img_label.style().polish(self.img_label)
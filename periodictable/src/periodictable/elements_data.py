@@ -238,6 +238,215 @@ elements = {
            "state": "Gaz", "electron_config": "[Rn] 5f¹⁴ 6d¹⁰ 7s² 7p⁶", "isotopes": ["²⁹⁴Og"]}
 }
 
+# structured isotope table of each element: (display string, mass number, exact mass in u, natural abundance)
+# the display strings are the ones listed in `elements`, naturally occurring isotopes missing from those lists
+# are added so the abundances of each element sum to one; exact mass is None when it is not tabulated
+isotope_data = {
+    "H": [("¹H (protium)", 1, 1.0078250319, 0.999855), ("²H (deuterium)", 2, 2.01410177784, 0.000145),
+          ("³H (tritium)", 3, 3.01604928132, 0.0)],
+    "He": [("³He", 3, 3.01602932197, 2e-06), ("⁴He", 4, 4.00260325413, 0.999998)],
+    "Li": [("⁶Li", 6, 6.0151228874, 0.0485), ("⁷Li", 7, 7.016003434, 0.9515)],
+    "Be": [("⁹Be", 9, 9.01218306, 1.0)],
+    "B": [("¹⁰B", 10, 10.012936862, 0.1965), ("¹¹B", 11, 11.009305167, 0.8035)],
+    "C": [("¹²C", 12, 12.0, 0.9894), ("¹³C", 13, 13.00335483534, 0.0106), ("¹⁴C", 14, 14.003241989, 0.0)],
+    "N": [("¹⁴N", 14, 14.00307400425, 0.996337), ("¹⁵N", 15, 15.0001088983, 0.003663)],
+    "O": [("¹⁶O", 16, 15.9949146193, 0.9975715), ("¹⁷O", 17, 16.999131756, 0.0003835),
+          ("¹⁸O", 18, 17.9991596121, 0.002045)],
+    "F": [("¹⁹F", 19, 18.9984031621, 1.0)],
+    "Ne": [("²⁰Ne", 20, 19.9924401753, 0.9048), ("²¹Ne", 21, 20.99384669, 0.0027),
+           ("²²Ne", 22, 21.991385114, 0.0925)],
+    "Na": [("²³Na", 23, 22.989769282, 1.0), ("²⁴Na", 24, 23.990963012, 0.0)],
+    "Mg": [("²⁴Mg", 24, 23.985041689, 0.7896421), ("²⁵Mg", 25, 24.98583697, 0.100109),
+           ("²⁶Mg", 26, 25.98259297, 0.1102489)],
+    "Al": [("²⁷Al", 27, 26.98153841, 1.0)],
+    "Si": [("²⁸Si", 28, 27.9769265344, 0.922545), ("²⁹Si", 29, 28.9764946643, 0.04672),
+           ("³⁰Si", 30, 29.973770137, 0.030735)],
+    "P": [("³¹P", 31, 30.9737619977, 1.0)],
+    "S": [("³²S", 32, 31.9720711735, 0.94855881), ("³³S", 33, 32.9714589086, 0.00763047),
+          ("³⁴S", 34, 33.96786701, 0.04365271), ("³⁶S", 36, 35.96708069, 0.00015801)],
+    "Cl": [("³⁵Cl", 35, 34.96885269, 0.758), ("³⁷Cl", 37, 36.96590257, 0.242)],
+    "Ar": [("³⁶Ar", 36, 35.967545106, 0.0033361), ("³⁸Ar", 38, 37.9627321, 0.0006289),
+           ("⁴⁰Ar", 40, 39.962383122, 0.996035)],
+    "K": [("³⁹K", 39, 38.963706485, 0.932581), ("⁴⁰K", 40, 39.96399817, 0.000117),
+          ("⁴¹K", 41, 40.961825256, 0.067302)],
+    "Ca": [("⁴⁰Ca", 40, 39.962590851, 0.96941), ("⁴¹Ca", 41, 40.96227791, 0.0),
+           ("⁴²Ca", 42, 41.95861778, 0.00647), ("⁴³Ca", 43, 42.95876638, 0.00135),
+           ("⁴⁴Ca", 44, 43.9554815, 0.02086), ("⁴⁶Ca", 46, 45.9536877, 4e-05),
+           ("⁴⁸Ca", 48, 47.952522654, 0.00187)],
+    "Sc": [("⁴⁵Sc", 45, 44.9559071, 1.0)],
+    "Ti": [("⁴⁶Ti", 46, 45.95262636, 0.0825), ("⁴⁷Ti", 47, 46.95175749, 0.0744),
+           ("⁴⁸Ti", 48, 47.94794068, 0.7372), ("⁴⁹Ti", 49, 48.94786439, 0.0541),
+           ("⁵⁰Ti", 50, 49.94478562, 0.0518)],
+    "V": [("⁵⁰V", 50, 49.94715668, 0.0025), ("⁵¹V", 51, 50.94395766, 0.9975)],
+    "Cr": [("⁵⁰Cr", 50, 49.94604221, 0.04345), ("⁵²Cr", 52, 51.94050471, 0.83789),
+           ("⁵³Cr", 53, 52.9406463, 0.09501), ("⁵⁴Cr", 54, 53.93887736, 0.02365)],
+    "Mn": [("⁵⁵Mn", 55, 54.93804304, 1.0)],
+    "Fe": [("⁵⁴Fe", 54, 53.9396082, 0.05845), ("⁵⁶Fe", 56, 55.93493554, 0.91754),
+           ("⁵⁷Fe", 57, 56.93539195, 0.02119), ("⁵⁸Fe", 58, 57.9332736, 0.00282)],
+    "Co": [("⁵⁹Co", 59, 58.9331935, 1.0)],
+    "Ni": [("⁵⁸Ni", 58, 57.9353417, 0.680769), ("⁶⁰Ni", 60, 59.9307851, 0.262231),
+           ("⁶¹Ni", 61, 60.9310548, 0.011399), ("⁶²Ni", 62, 61.9283448, 0.036345),
+           ("⁶⁴Ni", 64, 63.9279662, 0.009256)],
+    "Cu": [("⁶³Cu", 63, 62.9295971, 0.6915), ("⁶⁵Cu", 65, 64.9277895, 0.3085)],
+    "Zn": [("⁶⁴Zn", 64, 63.9291418, 0.4917), ("⁶⁶Zn", 66, 65.9260336, 0.2773),
+           ("⁶⁷Zn", 67, 66.9271274, 0.0404), ("⁶⁸Zn", 68, 67.9248442, 0.1845),
+           ("⁷⁰Zn", 70, 69.9253192, 0.0061)],
+    "Ga": [("⁶⁹Ga", 69, 68.9255735, 0.60108), ("⁷¹Ga", 71, 70.9247026, 0.39892)],
+    "Ge": [("⁷⁰Ge", 70, 69.9242485, 0.2052), ("⁷²Ge", 72, 71.92207582, 0.2745),
+           ("⁷³Ge", 73, 72.92345895, 0.0776), ("⁷⁴Ge", 74, 73.921177761, 0.3652),
+           ("⁷⁶Ge", 76, 75.921402725, 0.0775)],
+    "As": [("⁷⁵As", 75, 74.9215946, 1.0)],
+    "Se": [("⁷⁴Se", 74, 73.922475934, 0.0086), ("⁷⁶Se", 76, 75.919213703, 0.0923),
+           ("⁷⁷Se", 77, 76.91991415, 0.076), ("⁷⁸Se", 78, 77.91730924, 0.2369),
+           ("⁸⁰Se", 80, 79.9165218, 0.498), ("⁸²Se", 82, 81.9166995, 0.0882)],
+    "Br": [("79Br", 79, 78.9183376, 0.5065), ("81Br", 81, 80.9162882, 0.4935)],
+    "Kr": [("⁷⁸Kr", 78, 77.9203663, 0.00355), ("⁸⁰Kr", 80, 79.9163779, 0.02286),
+           ("⁸²Kr", 82, 81.913481154, 0.11593), ("⁸³Kr", 83, 82.914126517, 0.115),
+           ("⁸⁴Kr", 84, 83.911497727, 0.56987), ("⁸⁶Kr", 86, 85.910610625, 0.17279)],
+    "Rb": [("⁸⁵Rb", 85, 84.911789736, 0.7217), ("⁸⁷Rb", 87, 86.909180529, 0.2783)],
+    "Sr": [("⁸⁴Sr", 84, 83.9134191, 0.0056), ("⁸⁶Sr", 86, 85.909260725, 0.0986),
+           ("⁸⁷Sr", 87, 86.908877495, 0.07), ("⁸⁸Sr", 88, 87.905612254, 0.8258)],
+    "Y": [("⁸⁹Y", 89, 88.9058382, 1.0)],
+    "Zr": [("⁹⁰Zr", 90, 89.90469876, 0.5145), ("⁹¹Zr", 91, 90.90564021, 0.1122),
+           ("⁹²Zr", 92, 91.90503534, 0.1715), ("⁹⁴Zr", 94, 93.90631252, 0.1738),
+           ("⁹⁶Zr", 96, 95.90827762, 0.028)],
+    "Nb": [("⁹³Nb", 93, 92.9063732, 1.0)],
+    "Mo": [("⁹²Mo", 92, 91.90680715, 0.14649), ("⁹⁴Mo", 94, 93.90508359, 0.09187),
+           ("⁹⁵Mo", 95, 94.90583744, 0.15873), ("⁹⁶Mo", 96, 95.90467477, 0.16673),
+           ("⁹⁷Mo", 97, 96.9060169, 0.09582), ("⁹⁸Mo", 98, 97.90540361, 0.24292),
+           ("¹⁰⁰Mo", 100, 99.907468, 0.09744)],
+    "Tc": [("⁹⁷Tc", 97, 96.906361, 0.0), ("⁹⁸Tc", 98, 97.907211, 0.0)],
+    "Ru": [("⁹⁶Ru", 96, 95.90758891, 0.0554), ("⁹⁸Ru", 98, 97.905287, 0.0187),
+           ("⁹⁹Ru", 99, 98.9059303, 0.1276), ("¹⁰⁰Ru", 100, 99.9042105, 0.126),
+           ("¹⁰¹Ru", 101, 100.9055731, 0.1706), ("¹⁰²Ru", 102, 101.9043403, 0.3155),
+           ("¹⁰⁴Ru", 104, 103.9054253, 0.1862)],
+    "Rh": [("¹⁰³Rh", 103, 102.9054941, 1.0)],
+    "Pd": [("¹⁰²Pd", 102, 101.9056323, 0.0102), ("¹⁰⁴Pd", 104, 103.9040304, 0.1114),
+           ("¹⁰⁵Pd", 105, 104.9050795, 0.2233), ("¹⁰⁶Pd", 106, 105.9034803, 0.2733),
+           ("¹⁰⁸Pd", 108, 107.9038918, 0.2646), ("¹¹⁰Pd", 110, 109.9051729, 0.1172)],
+    "Ag": [("¹⁰⁷Ag", 107, 106.9050915, 0.51839), ("¹⁰⁹Ag", 109, 108.9047558, 0.48161)],
+    "Cd": [("¹⁰⁶Cd", 106, 105.9064598, 0.01245), ("¹⁰⁸Cd", 108, 107.9041836, 0.00888),
+           ("¹¹⁰Cd", 110, 109.9030075, 0.1247), ("¹¹¹Cd", 111, 110.9041838, 0.12795),
+           ("¹¹²Cd", 112, 111.9027639, 0.24109), ("¹¹³Cd", 113, 112.90440811, 0.12227),
+           ("¹¹⁴Cd", 114, 113.903365, 0.28754), ("¹¹⁶Cd", 116, 115.90476323, 0.07512)],
+    "In": [("¹¹³In", 113, 112.90406045, 0.04281), ("¹¹⁵In", 115, 114.903878773, 0.95719)],
+    "Sn": [("¹¹²Sn", 112, 111.9048249, 0.0097), ("¹¹⁴Sn", 114, 113.90278013, 0.0066),
+           ("¹¹⁵Sn", 115, 114.903344696, 0.0034), ("¹¹⁶Sn", 116, 115.90174283, 0.1454),
+           ("¹¹⁷Sn", 117, 116.902954, 0.0768), ("¹¹⁸Sn", 118, 117.9016066, 0.2422),
+           ("¹¹⁹Sn", 119, 118.9033113, 0.0859), ("¹²⁰Sn", 120, 119.9022026, 0.3258),
+           ("¹²²Sn", 122, 121.9034455, 0.0463), ("¹²⁴Sn", 124, 123.9052796, 0.0579)],
+    "Sb": [("¹²¹Sb", 121, 120.9038114, 0.5721), ("¹²³Sb", 123, 122.9042153, 0.4279)],
+    "Te": [("¹²⁰Te", 120, 119.9040658, 0.0009), ("¹²²Te", 122, 121.9030447, 0.0255),
+           ("¹²³Te", 123, 122.904271, 0.0089), ("¹²⁴Te", 124, 123.9028183, 0.0474),
+           ("¹²⁵Te", 125, 124.9044312, 0.0707), ("¹²⁶Te", 126, 125.9033121, 0.1884),
+           ("¹²⁸Te", 128, 127.9044612, 0.3174), ("¹³⁰Te", 130, 129.906222745, 0.3408)],
+    "I": [("¹²⁷I", 127, 126.904473, 1.0)],
+    "Xe": [("¹²⁴Xe", 124, 123.9058852, 0.00095), ("¹²⁶Xe", 126, 125.904297422, 0.00089),
+           ("¹²⁸Xe", 128, 127.903530753, 0.0191), ("¹²⁹Xe", 129, 128.904780857, 0.26401),
+           ("¹³⁰Xe", 130, 129.903509347, 0.04071), ("¹³¹Xe", 131, 130.905084128, 0.21232),
+           ("¹³²Xe", 132, 131.904155083, 0.26909), ("¹³⁴Xe", 134, 133.90539303, 0.10436),
+           ("¹³⁶Xe", 136, 135.907214474, 0.08857)],
+    "Cs": [("¹³³Cs", 133, 132.905451959, 1.0)],
+    "Ba": [("¹³⁰Ba", 130, 129.906326, 0.0011), ("¹³²Ba", 132, 131.9050612, 0.001),
+           ("¹³⁴Ba", 134, 133.90450825, 0.0242), ("¹³⁵Ba", 135, 134.90568845, 0.0659),
+           ("¹³⁶Ba", 136, 135.9045758, 0.0785), ("¹³⁷Ba", 137, 136.90582721, 0.1123),
+           ("¹³⁸Ba", 138, 137.90524706, 0.717)],
+    "La": [("¹³⁸La", 138, 137.907124, 0.0008881), ("¹³⁹La", 139, 138.9063629, 0.9991119)],
+    "Ce": [("¹³⁶Ce", 136, 135.9071293, 0.00185), ("¹³⁸Ce", 138, 137.9059942, 0.00251),
+           ("¹⁴⁰Ce", 140, 139.9054484, 0.8845), ("¹⁴²Ce", 142, 141.9092502, 0.11114)],
+    "Pr": [("¹⁴¹Pr", 141, 140.9076596, 1.0)],
+    "Nd": [("¹⁴²Nd", 142, 141.9077288, 0.27152), ("¹⁴³Nd", 143, 142.9098198, 0.12174),
+           ("¹⁴⁴Nd", 144, 143.9100928, 0.23798), ("¹⁴⁵Nd", 145, 144.9125792, 0.08293),
+           ("¹⁴⁶Nd", 146, 145.9131225, 0.17189), ("¹⁴⁸Nd", 148, 147.916899, 0.05756),
+           ("¹⁵⁰Nd", 150, 149.9209013, 0.05638)],
+    "Pm": [("¹⁴⁵Pm", 145, 144.912756, 0.0), ("¹⁴⁷Pm", 147, 146.9151449, 0.0)],
+    "Sm": [("¹⁴⁴Sm", 144, 143.9120063, 0.0308), ("¹⁴⁷Sm", 147, 146.9149044, 0.15),
+           ("¹⁴⁸Sm", 148, 147.9148292, 0.1125), ("¹⁴⁹Sm", 149, 148.9171912, 0.1382),
+           ("¹⁵⁰Sm", 150, 149.917282, 0.0737), ("¹⁵²Sm", 152, 151.9197386, 0.2674),
+           ("¹⁵⁴Sm", 154, 153.9222158, 0.2274)],
+    "Eu": [("¹⁵¹Eu", 151, 150.9198566, 0.4781), ("¹⁵³Eu", 153, 152.9212368, 0.5219)],
+    "Gd": [("¹⁵²Gd", 152, 151.9197984, 0.002), ("¹⁵⁴Gd", 154, 153.920873, 0.0218),
+           ("¹⁵⁵Gd", 155, 154.9226294, 0.148), ("¹⁵⁶Gd", 156, 155.9221301, 0.2047),
+           ("¹⁵⁷Gd", 157, 156.9239674, 0.1565), ("¹⁵⁸Gd", 158, 157.9241112, 0.2484),
+           ("¹⁶⁰Gd", 160, 159.9270612, 0.2186)],
+    "Tb": [("¹⁵⁹Tb", 159, 158.9253537, 1.0)],
+    "Dy": [("¹⁵⁶Dy", 156, 155.9242836, 0.00056), ("¹⁵⁸Dy", 158, 157.9244148, 0.00095),
+           ("¹⁶⁰Dy", 160, 159.9252036, 0.02329), ("¹⁶¹Dy", 161, 160.9269394, 0.18889),
+           ("¹⁶²Dy", 162, 161.9268045, 0.25475), ("¹⁶³Dy", 163, 162.9287372, 0.24896),
+           ("¹⁶⁴Dy", 164, 163.9291808, 0.2826)],
+    "Ho": [("¹⁶⁵Ho", 165, 164.9303291, 1.0)],
+    "Er": [("¹⁶²Er", 162, 161.9287873, 0.00139), ("¹⁶⁴Er", 164, 163.9292077, 0.01601),
+           ("¹⁶⁶Er", 166, 165.9303011, 0.33503), ("¹⁶⁷Er", 167, 166.9320562, 0.22869),
+           ("¹⁶⁸Er", 168, 167.93237828, 0.26978), ("¹⁷⁰Er", 170, 169.9354719, 0.1491)],
+    "Tm": [("¹⁶⁹Tm", 169, 168.934219, 1.0)],
+    "Yb": [("¹⁶⁸Yb", 168, 167.9338913, 0.00126), ("¹⁷⁰Yb", 170, 169.934767243, 0.03023),
+           ("¹⁷¹Yb", 171, 170.936331515, 0.14216), ("¹⁷²Yb", 172, 171.936386654, 0.21754),
+           ("¹⁷³Yb", 173, 172.938216212, 0.16098), ("¹⁷⁴Yb", 174, 173.938867546, 0.31896),
+           ("¹⁷⁶Yb", 176, 175.942574706, 0.12887)],
+    "Lu": [("¹⁷⁵Lu", 175, 174.9407772, 0.97401), ("¹⁷⁶Lu", 176, 175.9426917, 0.02599)],
+    "Hf": [("¹⁷⁴Hf", 174, 173.9400484, 0.00160982), ("¹⁷⁶Hf", 176, 175.9414098, 0.05239424),
+           ("¹⁷⁷Hf", 177, 176.9432302, 0.18577956), ("¹⁷⁸Hf", 178, 177.9437083, 0.27277),
+           ("¹⁷⁹Hf", 179, 178.9458257, 0.13628501), ("¹⁸⁰Hf", 180, 179.9465595, 0.35116137)],
+    "Ta": [("¹⁸⁰Ta", 180, 179.9474676, 0.0001176), ("¹⁸¹Ta", 181, 180.9479985, 0.9998824)],
+    "W": [("¹⁸⁰W", 180, 179.9467133, 0.0012), ("¹⁸²W", 182, 181.9482056, 0.265),
+          ("¹⁸³W", 183, 182.9502244, 0.1431), ("¹⁸⁴W", 184, 183.9509332, 0.3064),
+          ("¹⁸⁶W", 186, 185.9543651, 0.2843)],
+    "Re": [("¹⁸⁵Re", 185, 184.9529583, 0.374), ("¹⁸⁷Re", 187, 186.9557522, 0.626)],
+    "Os": [("¹⁸⁴Os", 184, 183.9524929, 0.0002), ("¹⁸⁶Os", 186, 185.9538376, 0.0159),
+           ("¹⁸⁷Os", 187, 186.9557496, 0.0196), ("¹⁸⁸Os", 188, 187.9558373, 0.1324),
+           ("¹⁸⁹Os", 189, 188.9581459, 0.1615), ("¹⁹⁰Os", 190, 189.9584454, 0.2626),
+           ("¹⁹²Os", 192, 191.9614788, 0.4078)],
+    "Ir": [("¹⁹¹Ir", 191, 190.9605915, 0.3723), ("¹⁹³Ir", 193, 192.9629238, 0.6277)],
+    "Pt": [("¹⁹⁰Pt", 190, 189.9599498, 0.00012), ("¹⁹²Pt", 192, 191.9610427, 0.00782),
+           ("¹⁹⁴Pt", 194, 193.9626835, 0.32864), ("¹⁹⁵Pt", 195, 194.9647943, 0.33775),
+           ("¹⁹⁶Pt", 196, 195.9649546, 0.25211), ("¹⁹⁸Pt", 198, 197.9678967, 0.07356)],
+    "Au": [("¹⁹⁷Au", 197, 196.9665701, 1.0)],
+    "Hg": [("¹⁹⁶Hg", 196, 195.965833, 0.0015), ("¹⁹⁸Hg", 198, 197.9667692, 0.1004),
+           ("¹⁹⁹Hg", 199, 198.968281, 0.1694), ("²⁰⁰Hg", 200, 199.9683269, 0.2314),
+           ("²⁰¹Hg", 201, 200.9703031, 0.1317), ("²⁰²Hg", 202, 201.9706436, 0.2974),
+           ("²⁰⁴Hg", 204, 203.973494, 0.0682)],
+    "Tl": [("²⁰³Tl", 203, 202.9723441, 0.29515), ("²⁰⁵Tl", 205, 204.9744273, 0.70485)],
+    "Pb": [("²⁰⁴Pb", 204, 203.9730435, 0.014), ("²⁰⁶Pb", 206, 205.9744652, 0.241),
+           ("²⁰⁷Pb", 207, 206.9758968, 0.221), ("²⁰⁸Pb", 208, 207.976652, 0.524)],
+    "Bi": [("²⁰⁹Bi", 209, 208.9803986, 1.0)],
+    "Po": [("²¹⁰Po", 210, 209.9828737, 0.0)],
+    "At": [("²¹⁰At", 210, 209.987147, 0.0), ("²¹¹At", 211, 210.9874962, 0.0)],
+    "Rn": [("²²²Rn", 222, 222.017576, 0.0)],
+    "Fr": [("²²³Fr", 223, 223.0197342, 0.0)],
+    "Ra": [("²²⁶Ra", 226, 226.0254082, 0.0)],
+    "Ac": [("²²⁷Ac", 227, 227.0277506, 0.0)],
+    "Th": [("²³⁰Th", 230, 230.0331323, 0.0002), ("²³²Th", 232, 232.0380536, 0.9998)],
+    "Pa": [("²³¹Pa", 231, 231.0358825, 1.0)],
+    "U": [("²³⁴U", 234, 234.0409523, 5.4e-05), ("²³⁵U", 235, 235.0439301, 0.007204),
+          ("²³⁸U", 238, 238.0507869, 0.992742)],
+    "Np": [("²³⁷Np", 237, 237.0481716, 0.0)],
+    "Pu": [("²³⁹Pu", 239, 239.0521616, 0.0), ("²⁴⁰Pu", 240, 240.0538117, 0.0)],
+    "Am": [("²⁴¹Am", 241, 241.0568273, 0.0)],
+    "Cm": [("²⁴⁴Cm", 244, 244.0627506, 0.0)],
+    "Bk": [("²⁴⁷Bk", 247, 247.070306, 0.0)],
+    "Cf": [("²⁵²Cf", 252, 252.0816265, 0.0)],
+    "Es": [("²⁵²Es", 252, 252.08298, 0.0)],
+    "Fm": [("²⁵⁷Fm", 257, 257.095105, 0.0)],
+    "Md": [("²⁵⁸Md", 258, 258.098434, 0.0)],
+    "No": [("²⁵⁹No", 259, 259.100998, 0.0)],
+    "Lr": [("²⁶²Lr", 262, 262.10962, 0.0)],
+    "Rf": [("²⁶³Rf", 263, 263.11246, 0.0)],
+    "Db": [("²⁶⁸Db", 268, None, 0.0)],
+    "Sg": [("²⁶⁹Sg", 269, None, 0.0)],
+    "Bh": [("²⁷⁰Bh", 270, None, 0.0)],
+    "Hs": [("²⁷⁰Hs", 270, None, 0.0)],
+    "Mt": [("²⁷⁶Mt", 276, None, 0.0)],
+    "Ds": [("²⁸¹Ds", 281, 281.16455, 0.0)],
+    "Rg": [("²⁸²Rg", 282, None, 0.0)],
+    "Cn": [("²⁸⁵Cn", 285, 285.17723, 0.0)],
+    "Nh": [("²⁸⁴Nh", 284, None, 0.0)],
+    "Fl": [("²⁸⁹Fl", 289, 289.19052, 0.0)],
+    "Mc": [("²⁸⁸Mc", 288, None, 0.0)],
+    "Lv": [("²⁹³Lv", 293, 293.20458, 0.0)],
+    "Ts": [("²⁹⁴Ts", 294, 294.21084, 0.0)],
+    "Og": [("²⁹⁴Og", 294, 294.21398, 0.0)]
+}
+
 # position of each element in the periodic table
 positions = {
     "H": (0, 0), "He": (0, 17),
@@ -0,0 +1,310 @@
+"""
+Quiz Event Log
+Append-only log of every quiz answer, skip and timeout for teaching staff. Events are
+queued by the quiz without blocking and written to SQLite in batches by a background
+thread; triggers reject any update or deletion. The reporting functions load the log
+into pandas and compute per-element and per-question-type error rates with group-bys.
+"""
+
+import os
+import queue
+import sqlite3
+import sys
+import threading
+from collections import namedtuple
+from contextlib import closing
+
+import pandas as pd
+
+# One quiz event; outcome is 'answer', 'skip' or 'timeout', response_time in seconds
+AnswerEvent = namedtuple("AnswerEvent", ["session", "student", "symbol", "question_type", "mode",
+                                         "outcome", "correct", "response_time", "timestamp"])
+
+OUTCOMES = ("answer", "skip", "timeout")
+
+DEFAULT_EVENT_LOG = os.path.join(os.path.expanduser("~"), ".periodictable", "events.sqlite3")
+
+BATCH_SIZE = 256
+FLUSH_INTERVAL = 1.0
+
+# Seconds between checks that the writer thread is still alive while flushing
+WAIT_INTERVAL = 0.5
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    id INTEGER PRIMARY KEY,
+    session TEXT NOT NULL,
+    student TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    question_type TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    correct INTEGER NOT NULL,
+    response_time REAL,
+    timestamp REAL NOT NULL
+);
+CREATE TRIGGER IF NOT EXISTS events_no_update BEFORE UPDATE ON events
+BEGIN SELECT RAISE(ABORT, 'the event log is append-only'); END;
+CREATE TRIGGER IF NOT EXISTS events_no_delete BEFORE DELETE ON events
+BEGIN SELECT RAISE(ABORT, 'the event log is append-only'); END;
+"""
+
+# Queue item that makes the writer flush its pending batch
+_TICK = object()
+
+
+class EventLog:
+    """
+    Asynchronous, batched writer of quiz events.
+
+    log() only puts the event on a queue; a daemon thread owns the SQLite
+    connection and inserts pending events in one transaction once
+    batch_size are queued, flush_interval seconds after the last event,
+    on flush() or on close(). A batch that fails to write is dropped and
+    the writer carries on; flush() and close() raise the error so lost
+    events are never unnoticed.
+
+    Attributes:
+        path (str): Database file
+        written (int): Events written so far
+        lost (int): Events that could not be written
+        error (Exception): Last error of the writer thread, or None
+    """
+
+    def __init__(self, path=DEFAULT_EVENT_LOG, batch_size=BATCH_SIZE, flush_interval=FLUSH_INTERVAL):
+        """
+        Open (and create if needed) the log and start the writer thread.
+
+        Args:
+            path (str): Database file
+            batch_size (int): Queued events that trigger a write
+            flush_interval (float): Seconds of inactivity after which pending events are written
+
+        Raises:
+            sqlite3.Error: If the database cannot be opened or created
+        """
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.written = 0
+        self.lost = 0
+        self.error = None
+        self._reported = 0
+        self.queue = queue.Queue()
+        ready = threading.Event()
+        self._thread = threading.Thread(target=self._run, args=(ready,), name="EventLogWriter",
+                                        daemon=True)
+        self._thread.start()
+        ready.wait()
+        if self.error is not None:
+            raise self.error
+
+    def log(self, event):
+        """
+        Queue an event (never blocks on the database).
+
+        Args:
+            event (AnswerEvent): Event to append
+        """
+        self.queue.put(event)
+
+    def flush(self):
+        """
+        Block until every event queued so far is written.
+
+        Raises:
+            sqlite3.Error: If events were lost since the last flush or close
+        """
+        done = threading.Event()
+        self.queue.put(done)
+        while not done.wait(WAIT_INTERVAL):
+            if not self._thread.is_alive():
+                self._drain()
+                break
+        self._check()
+
+    def close(self):
+        """
+        Write pending events and stop the writer thread.
+
+        Raises:
+            sqlite3.Error: If events were lost since the last flush or close
+        """
+        self.queue.put(None)
+        self._thread.join()
+        self._drain()
+        self._check()
+
+    def _drain(self):
+        """Count the events left on the queue of a stopped writer as lost."""
+        while True:
+            try:
+                item = self.queue.get_nowait()
+            except queue.Empty:
+                return
+            if isinstance(item, AnswerEvent):
+                self.lost += 1
+            elif isinstance(item, threading.Event):
+                item.set()
+
+    def _check(self):
+        """Raise the writer's last error if events were lost since the last check."""
+        if self.lost > self._reported:
+            self._reported = self.lost
+            raise self.error
+
+    def _run(self, ready):
+        """Writer thread: open the database, then serve the queue until closed."""
+        try:
+            with closing(sqlite3.connect(self.path)) as connection:
+                connection.execute("PRAGMA journal_mode=WAL")
+                connection.executescript(SCHEMA)
+                ready.set()
+                self._serve(connection)
+        except Exception as error:
+            self.error = error
+        finally:
+            ready.set()
+
+    def _serve(self, connection):
+        """Batch queued events into transactions."""
+        pending, waiters = [], []
+        try:
+            while True:
+                try:
+                    item = self.queue.get(timeout=self.flush_interval if pending else None)
+                except queue.Empty:
+                    item = _TICK
+                if isinstance(item, AnswerEvent):
+                    pending.append(item)
+                elif isinstance(item, threading.Event):
+                    waiters.append(item)
+                if len(pending) >= self.batch_size or not isinstance(item, AnswerEvent):
+                    try:
+                        self._write(connection, pending)
+                    except sqlite3.Error as error:
+                        # A locked or full database loses this batch, not the log
+                        self.error = error
+                        self.lost += len(pending)
+                        print(f"Event log: {len(pending)} events not written: {error}",
+                              file=sys.stderr)
+                    pending.clear()
+                    for waiter in waiters:
+                        waiter.set()
+                    waiters.clear()
+                if item is None:
+                    return
+        except Exception as error:
+            # Recorded before the waiters are released, so flush() can report it
+            self.error = error
+            raise
+        finally:
+            self.lost += len(pending)
+            for waiter in waiters:
+                waiter.set()
+
+    def _write(self, connection, events):
+        """Insert a batch of events in one transaction."""
+        if not events:
+            return
+        with connection:
+            connection.executemany(
+                "INSERT INTO events (session, student, symbol, question_type, mode, outcome, "
+                "correct, response_time, timestamp) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(*event[:6], int(bool(event.correct)), *event[7:]) for event in events])
+        self.written += len(events)
+
+# ======================================================================================
+# REPORTING
+# ======================================================================================
+
+
+def load_events(path=DEFAULT_EVENT_LOG, since=None):
+    """
+    Load the event log into a DataFrame.
+
+    Args:
+        path (str): Database file
+        since (float): Only events at or after this epoch time
+
+    Returns:
+        pandas.DataFrame: One row per event; symbol, question_type, mode and
+        outcome are categoricals and correct is boolean
+    """
+    query = ("SELECT session, student, symbol, question_type, mode, outcome, correct, "
+             "response_time, timestamp FROM events")
+    params = ()
+    if since is not None:
+        query += " WHERE timestamp >= ?"
+        params = (since,)
+    with closing(sqlite3.connect(path)) as connection:
+        events = pd.read_sql_query(query, connection, params=params)
+    for column in ("symbol", "question_type", "mode", "outcome"):
+        events[column] = events[column].astype("category")
+    events["correct"] = events["correct"].astype(bool)
+    return events
+
+
+def error_rates(events, by):
+    """
+    Error statistics per group.
+
+    Skips and timeouts count as errors, as in the quiz score.
+
+    Args:
+        events (pandas.DataFrame): Events from load_events
+        by (str or list): Column(s) to group by
+
+    Returns:
+        pandas.DataFrame: attempts, errors, timeouts, skips, sessions,
+        mean_response_time and error_rate per group, highest error rate first
+    """
+    table = events.assign(
+        error=~events["correct"],
+        timeout=events["outcome"] == "timeout",
+        skip=events["outcome"] == "skip",
+    ).groupby(by, observed=True).agg(
+        attempts=("correct", "size"),
+        errors=("error", "sum"),
+        timeouts=("timeout", "sum"),
+        skips=("skip", "sum"),
+        sessions=("session", "nunique"),
+        mean_response_time=("response_time", "mean"),
+    )
+    table["error_rate"] = table["errors"] / table["attempts"]
+    return table.sort_values(["error_rate", "attempts"], ascending=False)
+
+
+def element_error_rates(events):
+    """
+    Error statistics per element.
+
+    Args:
+        events (pandas.DataFrame): Events from load_events
+
+    Returns:
+        pandas.DataFrame: See error_rates, indexed by symbol
+    """
+    return error_rates(events, "symbol")
+
+
+def question_type_error_rates(events):
+    """
+    Error statistics per question type.
+
+    Args:
+        events (pandas.DataFrame): Events from load_events
+
+    Returns:
+        pandas.DataFrame: See error_rates, indexed by question type
+    """
+    return error_rates(events, "question_type")
+
+
+if __name__ == "__main__":
+    log_path = sys.argv[1] if len(sys.argv) > 1 else DEFAULT_EVENT_LOG
+    all_events = load_events(log_path)
+    print(f"{len(all_events)} events in {all_events['session'].nunique()} sessions\n")
+    print(question_type_error_rates(all_events).to_string(), end="\n\n")
+    print(element_error_rates(all_events).head(20).to_string())
@@ -0,0 +1,224 @@
+"""
+Question Bank Export
+Streams every (element, question type, answer variant) question of the quiz engine,
+with its multiple choice distractors, to JSON lines, CSV or Moodle XML for printing
+and LMS import. Questions come from a generator and are written one at a time, so
+memory use does not depend on the bank size, and the output is identical for a given
+seed.
+"""
+
+import argparse
+import csv
+import json
+import re
+import sys
+import time
+from collections import namedtuple
+from xml.sax.saxutils import escape
+
+try:
+    from .quiz_engine import (QuizEngine, QUESTION_TYPES, FAMILY_CATEGORIES,
+                              element_category, element_difficulty)
+except ImportError:
+    from quiz_engine import (QuizEngine, QUESTION_TYPES, FAMILY_CATEGORIES,
+                             element_category, element_difficulty)
+
+# One exported question; options is None for free response banks
+BankItem = namedtuple("BankItem", ["id", "symbol", "question_type", "category", "difficulty",
+                                   "prompt", "answer", "options"])
+
+FORMATS = ("jsonl", "csv", "xml")
+
+ALL_CATEGORIES = tuple(sorted(set(FAMILY_CATEGORIES.values())))
+
+CSV_COLUMNS = ["id", "symbol", "question_type", "category", "difficulty", "prompt", "answer",
+               "option_1", "option_2", "option_3", "option_4"]
+
+TAG = re.compile(r"<[^>]+>")
+
+
+def plain_text(html):
+    """
+    Strip the markup of a question prompt.
+
+    Args:
+        html (str): Prompt with <b> and <br> tags
+
+    Returns:
+        str: Text with line breaks for <br> and no other tags
+    """
+    return TAG.sub("", html.replace("<br>", "\n"))
+
+
+def iter_bank(seed=0, categories=ALL_CATEGORIES, multiple_choice=True, question_types=QUESTION_TYPES,
+              engine=None):
+    """
+    Generate every question of the bank.
+
+    Questions are ordered by question type, then atomic number, then answer
+    variant; distractors are drawn from the engine's seeded generator in
+    that order, so a seed always gives the same bank.
+
+    Args:
+        seed: Seed of the distractor draws
+        categories (iterable): Element categories included
+        multiple_choice (bool): Include answer options
+        question_types (iterable): Question types included
+        engine (QuizEngine): Engine to export (overrides the other options)
+
+    Yields:
+        BankItem: One question at a time
+    """
+    if engine is None:
+        engine = QuizEngine(seed=seed, categories=categories, question_types=question_types)
+    number = 0
+    for question_type in question_types:
+        for symbol in sorted(engine.symbols, key=lambda s: engine.elements[s]["num"]):
+            element = engine.elements[symbol]
+            for prompt, answer in engine.payloads.get((symbol, question_type), ()):
+                number += 1
+                options = engine.options(question_type, answer, symbol) if multiple_choice else None
+                yield BankItem(f"{question_type}-{symbol}-{number}", symbol, question_type,
+                               element_category(element), element_difficulty(element),
+                               prompt, answer, options)
+
+# ======================================================================================
+# WRITERS
+# ======================================================================================
+
+
+def write_jsonl(items, stream):
+    """
+    Write one JSON object per question.
+
+    Args:
+        items (iterable): BankItem records
+        stream: Text stream
+
+    Returns:
+        int: Number of questions written
+    """
+    count = 0
+    for item in items:
+        stream.write(json.dumps(item._asdict(), ensure_ascii=False) + "\n")
+        count += 1
+    return count
+
+
+def write_csv(items, stream):
+    """
+    Write one CSV row per question, with plain text prompts.
+
+    Args:
+        items (iterable): BankItem records
+        stream: Text stream (opened with newline='')
+
+    Returns:
+        int: Number of questions written
+    """
+    writer = csv.writer(stream)
+    writer.writerow(CSV_COLUMNS)
+    count = 0
+    for item in items:
+        options = list(item.options or [])
+        options += [""] * (len(CSV_COLUMNS) - 7 - len(options))
+        writer.writerow([item.id, item.symbol, item.question_type, item.category, item.difficulty,
+                         plain_text(item.prompt), item.answer, *options])
+        count += 1
+    return count
+
+
+def _cdata(text):
+    """Wrap text in a CDATA section (splitting any ']]>' it contains)."""
+    return "<![CDATA[" + text.replace("]]>", "]]]]><![CDATA[>") + "]]>"
+
+
+def write_moodle_xml(items, stream):
+    """
+    Write a Moodle XML quiz: multichoice questions, or shortanswer for free response.
+
+    A category entry is written before the first question of each
+    question type, so the import creates one category per type.
+
+    Args:
+        items (iterable): BankItem records
+        stream: Text stream
+
+    Returns:
+        int: Number of questions written
+    """
+    stream.write('<?xml version="1.0" encoding="UTF-8"?>\n<quiz>\n')
+    count = 0
+    category = None
+    for item in items:
+        if item.question_type != category:
+            category = item.question_type
+            stream.write(f'  <question type="category">\n    <category><text>$course$/Periodic table/'
+                         f'{escape(category)}</text></category>\n  </question>\n')
+        kind = "shortanswer" if item.options is None else "multichoice"
+        parts = [f'  <question type="{kind}">\n',
+                 f'    <name><text>{escape(item.id)}</text></name>\n',
+                 f'    <questiontext format="html"><text>{_cdata(item.prompt)}</text></questiontext>\n',
+                 f'    <tags><tag><text>{escape(item.symbol)}</text></tag>'
+                 f'<tag><text>{escape(item.category)}</text></tag></tags>\n']
+        if item.options is None:
+            parts.append('    <usecase>0</usecase>\n')
+            parts.append(f'    <answer fraction="100"><text>{escape(item.answer)}</text></answer>\n')
+        else:
+            parts.append('    <single>true</single>\n    <shuffleanswers>1</shuffleanswers>\n')
+            for option in item.options:
+                fraction = 100 if option == item.answer else 0
+                parts.append(f'    <answer fraction="{fraction}"><text>{escape(option)}</text></answer>\n')
+        parts.append('  </question>\n')
+        stream.write("".join(parts))
+        count += 1
+    stream.write("</quiz>\n")
+    return count
+
+
+WRITERS = {"jsonl": write_jsonl, "csv": write_csv, "xml": write_moodle_xml}
+
+
+def export(path, fmt=None, **options):
+    """
+    Export the question bank to a file.
+
+    Args:
+        path (str): Output file
+        fmt (str): 'jsonl', 'csv' or 'xml' (defaults to the file extension)
+        **options: iter_bank keyword arguments
+
+    Returns:
+        int: Number of questions written
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    fmt = fmt or path.rsplit(".", 1)[-1].lower()
+    if fmt not in WRITERS:
+        raise ValueError(f"Unknown export format {fmt!r} (expected one of {', '.join(FORMATS)})")
+    with open(path, "w", encoding="utf-8", newline="" if fmt == "csv" else None) as stream:
+        return WRITERS[fmt](iter_bank(**options), stream)
+
+
+def main():
+    """Command line entry point of the question bank export."""
+    parser = argparse.ArgumentParser(description="Export the quiz question bank")
+    parser.add_argument("output", help="Output file (.jsonl, .csv or .xml), or - for stdout")
+    parser.add_argument("--format", choices=FORMATS, help="Output format (defaults to the extension)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--categories", nargs="+", choices=ALL_CATEGORIES, default=ALL_CATEGORIES)
+    parser.add_argument("--free-response", action="store_true", help="Omit answer options")
+    args = parser.parse_args()
+
+    options = dict(seed=args.seed, categories=args.categories, multiple_choice=not args.free_response)
+    start = time.perf_counter()
+    if args.output == "-":
+        count = WRITERS[args.format or "jsonl"](iter_bank(**options), sys.stdout)
+    else:
+        count = export(args.output, args.format, **options)
+    print(f"{count} questions exported in {time.perf_counter() - start:.2f} s", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
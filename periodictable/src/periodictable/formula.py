@@ -0,0 +1,146 @@
+"""
+Chemical Formula Parsing
+Converts formula strings as they are written in elements_data.py (e.g. 'H₂O', 'Ca(OH)₂',
+'(NH₄)₂Cr₂O₇', 'NI₃⋅NH₃', 'Ca²⁺', 'Na(s)') into element counts and a net charge.
+"""
+
+import re
+from collections import Counter
+
+try:
+    from .elements_data import elements
+except ImportError:
+    from elements_data import elements
+
+# Unicode subscripts/superscripts folded to plain ASCII digits and signs
+SUBSCRIPTS = str.maketrans("₀₁₂₃₄₅₆₇₈₉", "0123456789")
+SUPERSCRIPTS = str.maketrans("⁰¹²³⁴⁵⁶⁷⁸⁹⁺⁻", "0123456789+-")
+
+# Physical state suffixes that carry no composition information
+STATE_SUFFIX = re.compile(r"\((?:s|l|g|aq)\)$")
+
+# Hydrate / adduct separators ('CuSO₄·5H₂O', 'NI₃⋅NH₃')
+ADDUCT_SEPARATORS = re.compile(r"[·⋅•*]")
+
+CHARGE = re.compile(r"(?:([⁰¹²³⁴⁵⁶⁷⁸⁹]*)([⁺⁻])|\^(\d*)([+-]))$")
+
+TOKEN = re.compile(r"([A-Z][a-z]?)|(\d+)|([(\[])|([)\]])")
+
+
+def split_charge(text):
+    """
+    Separate the trailing charge from a species string.
+
+    Accepts superscript notation ('Ca²⁺', 'OH⁻') as well as ASCII caret
+    notation ('Ca^2+', 'OH^-').
+
+    Args:
+        text (str): Species string, possibly ending with a charge
+
+    Returns:
+        tuple: (species string without charge, charge as int)
+    """
+    match = CHARGE.search(text)
+    if not match:
+        return text, 0
+    digits = (match.group(1) or match.group(3) or "").translate(SUPERSCRIPTS)
+    sign = (match.group(2) or match.group(4)).translate(SUPERSCRIPTS)
+    magnitude = int(digits) if digits else 1
+    return text[:match.start()], magnitude if sign == "+" else -magnitude
+
+
+def _parse_group(formula):
+    """
+    Parse a formula without charge or adduct separators into element counts.
+
+    Args:
+        formula (str): Plain formula with ASCII digits (e.g. 'Ca(OH)2')
+
+    Returns:
+        Counter: Element symbol -> atom count
+
+    Raises:
+        ValueError: If the formula contains unknown symbols or unbalanced brackets
+    """
+    stack = [Counter()]
+    position = 0
+    last = None  # Counter or symbol that a following count multiplies
+    while position < len(formula):
+        match = TOKEN.match(formula, position)
+        if not match:
+            raise ValueError(f"Unexpected character {formula[position]!r} in formula {formula!r}")
+        symbol, count, opening, closing = match.groups()
+        if symbol:
+            if symbol not in elements:
+                raise ValueError(f"Unknown element symbol {symbol!r} in formula {formula!r}")
+            stack[-1][symbol] += 1
+            last = symbol
+        elif count:
+            if last is None:
+                raise ValueError(f"Count without element in formula {formula!r}")
+            if isinstance(last, Counter):
+                for sym, n in last.items():
+                    stack[-1][sym] += n * (int(count) - 1)
+            else:
+                stack[-1][last] += int(count) - 1
+            last = None
+        elif opening:
+            stack.append(Counter())
+            last = None
+        else:
+            if len(stack) == 1:
+                raise ValueError(f"Unbalanced brackets in formula {formula!r}")
+            group = stack.pop()
+            stack[-1].update(group)
+            last = group
+        position = match.end()
+    if len(stack) != 1:
+        raise ValueError(f"Unbalanced brackets in formula {formula!r}")
+    return stack[0]
+
+
+def parse_species(text):
+    """
+    Parse a chemical species into element counts and net charge.
+
+    The electron ('e⁻') is recognised as a species with no atoms and charge -1.
+
+    Args:
+        text (str): Species string (e.g. 'Ca²⁺', '(NH₄)₂Cr₂O₇', 'H2O(l)')
+
+    Returns:
+        tuple: (Counter of element symbol -> count, charge as int)
+
+    Raises:
+        ValueError: If the string is not a valid formula
+    """
+    text = STATE_SUFFIX.sub("", text.strip())
+    text, charge = split_charge(text)
+    text = text.translate(SUBSCRIPTS)
+    if text == "e":
+        return Counter(), charge or -1
+    if not text:
+        raise ValueError("Empty formula")
+
+    counts = Counter()
+    for part in ADDUCT_SEPARATORS.split(text):
+        multiplier = re.match(r"\d*", part).group()
+        part = part[len(multiplier):]
+        if not part:
+            raise ValueError(f"Empty adduct in formula {text!r}")
+        for symbol, n in _parse_group(part).items():
+            counts[symbol] += n * (int(multiplier) if multiplier else 1)
+    return counts, charge
+
+
+def parse_formula(text):
+    """
+    Parse a chemical formula into element counts, ignoring any charge.
+
+    Args:
+        text (str): Formula string (e.g. 'C6H12O6', 'H₂SO₄')
+
+    Returns:
+        Counter: Element symbol -> atom count
+    """
+    return parse_species(text)[0]
@@ -0,0 +1,313 @@
+"""
+Bulk Answer Grading
+Grades free-response answer sheets (CSV rows of student, question id, answer) offline
+against the question bank. Expected answers are folded once into normalised keys, so
+each response costs a single fold and a comparison; repeated responses are folded only
+once per worker. Sheets are read in chunks, graded in-process or, for very large runs,
+across a process pool, and the partial tallies are merged into per-student scores and
+per-item statistics.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+from collections import Counter, namedtuple
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from functools import lru_cache
+
+try:
+    from .matching import fold_answer
+    from .export import iter_bank
+except ImportError:
+    from matching import fold_answer
+    from export import iter_bank
+
+# Expected answer of one question, with its folded form
+KeyEntry = namedtuple("KeyEntry", ["symbol", "question_type", "answer", "folded"])
+
+# Per-student result
+StudentScore = namedtuple("StudentScore", ["student", "answered", "correct", "blank", "score"])
+
+# Per-question result; facility is the fraction of correct attempts
+ItemStats = namedtuple("ItemStats", ["id", "symbol", "question_type", "attempts", "correct",
+                                     "blank", "facility", "common_wrong"])
+
+# Merged outcome of a grading run
+GradeReport = namedtuple("GradeReport", ["students", "items", "rows", "unknown"])
+
+SHEET_COLUMNS = ("student", "question", "answer")
+
+CHUNK_SIZE = 20000
+
+# Sheets smaller than this in total are graded in-process unless workers are
+# requested: pickling chunks to worker processes costs about as much as grading them
+POOL_MIN_BYTES = 64 * 1024 * 1024
+
+# Distinct wrong answers kept per item (the most frequent ones are reported)
+WRONG_ANSWERS = 3
+
+# Answer key of the worker process, set by _init_worker
+_KEY = {}
+
+
+def key_from_bank(**options):
+    """
+    Answer key of the exported question bank.
+
+    Args:
+        **options: iter_bank keyword arguments
+
+    Returns:
+        dict: Question id -> KeyEntry
+    """
+    options.setdefault("multiple_choice", False)
+    return {item.id: KeyEntry(item.symbol, item.question_type, item.answer, fold_answer(item.answer))
+            for item in iter_bank(**options)}
+
+
+def load_key(path):
+    """
+    Read an answer key written by periodictable.export.
+
+    Args:
+        path (str): .jsonl or .csv bank file
+
+    Returns:
+        dict: Question id -> KeyEntry
+
+    Raises:
+        ValueError: If the file is neither JSON lines nor CSV
+    """
+    with open(path, encoding="utf-8", newline="") as f:
+        if path.endswith(".jsonl"):
+            rows = (json.loads(line) for line in f if line.strip())
+        elif path.endswith(".csv"):
+            rows = csv.DictReader(f)
+        else:
+            raise ValueError(f"Answer keys must be .jsonl or .csv files, not {path!r}")
+        return {row["id"]: KeyEntry(row["symbol"], row["question_type"], row["answer"],
+                                    fold_answer(row["answer"])) for row in rows}
+
+
+def read_chunks(paths, chunk_size=CHUNK_SIZE):
+    """
+    Read answer sheets in chunks.
+
+    Args:
+        paths (iterable): CSV files with student, question and answer columns
+        chunk_size (int): Rows per chunk
+
+    Yields:
+        list: Up to chunk_size (student, question, answer) tuples
+
+    Raises:
+        ValueError: If a sheet lacks one of the columns
+    """
+    chunk = []
+    for path in paths:
+        with open(path, encoding="utf-8", newline="") as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            try:
+                columns = [header.index(name) for name in SHEET_COLUMNS]
+            except ValueError:
+                raise ValueError(f"{path}: answer sheets need the columns "
+                                 f"{', '.join(SHEET_COLUMNS)}") from None
+            width = max(columns) + 1
+            for row in reader:
+                if len(row) >= width:
+                    chunk.append(tuple(row[i] for i in columns))
+                    if len(chunk) >= chunk_size:
+                        yield chunk
+                        chunk = []
+    if chunk:
+        yield chunk
+
+# ======================================================================================
+# GRADING
+# ======================================================================================
+
+
+def _init_worker(key):
+    """Install the answer key in a worker process."""
+    global _KEY
+    _KEY = key
+    _fold.cache_clear()
+
+
+@lru_cache(maxsize=65536)
+def _fold(answer):
+    """fold_answer with a per-process cache: most responses repeat."""
+    return fold_answer(answer)
+
+
+def grade_chunk(rows, key=None):
+    """
+    Grade a chunk of responses.
+
+    Args:
+        rows (iterable): (student, question, answer) tuples
+        key (dict): Answer key (defaults to the worker's key)
+
+    Returns:
+        tuple: (students, items, unknown) partial tallies: student ->
+        [answered, correct, blank], question -> [attempts, correct, blank,
+        Counter of wrong answers] and a Counter of unknown question ids
+    """
+    key = _KEY if key is None else key
+    students, items, unknown = {}, {}, Counter()
+    for student, question, answer in rows:
+        entry = key.get(question)
+        if entry is None:
+            unknown[question] += 1
+            continue
+        folded = _fold(answer)
+        correct = folded == entry.folded
+        blank = not folded
+        tally = students.get(student)
+        if tally is None:
+            tally = students[student] = [0, 0, 0]
+        item = items.get(question)
+        if item is None:
+            item = items[question] = [0, 0, 0, Counter()]
+        tally[0] += 1
+        item[0] += 1
+        if correct:
+            tally[1] += 1
+            item[1] += 1
+        elif blank:
+            tally[2] += 1
+            item[2] += 1
+        else:
+            item[3][answer.strip()] += 1
+    return students, items, unknown
+
+
+def _merge(total, part):
+    """Add partial tallies from grade_chunk into the running totals."""
+    students, items, unknown = total
+    part_students, part_items, part_unknown = part
+    for student, tally in part_students.items():
+        into = students.setdefault(student, [0, 0, 0])
+        for i in range(3):
+            into[i] += tally[i]
+    for question, tally in part_items.items():
+        into = items.setdefault(question, [0, 0, 0, Counter()])
+        for i in range(3):
+            into[i] += tally[i]
+        into[3].update(tally[3])
+    unknown.update(part_unknown)
+
+
+def grade(paths, key, workers=None, chunk_size=CHUNK_SIZE):
+    """
+    Grade answer sheets.
+
+    With several workers, chunks are submitted to a process pool with at
+    most two per worker in flight, so memory stays bounded however large the
+    sheets are.
+
+    Args:
+        paths (iterable): Answer sheet CSV files
+        key (dict): Question id -> KeyEntry
+        workers (int): Worker processes; 1 grades in-process, which is the default
+            for sheets under POOL_MIN_BYTES (larger ones use the CPU count)
+        chunk_size (int): Rows per chunk
+
+    Returns:
+        GradeReport: Student scores and item statistics sorted by student and question id,
+        the number of graded rows and a Counter of question ids missing from the key
+    """
+    paths = list(paths)
+    if not workers:
+        size = sum(os.path.getsize(path) for path in paths)
+        workers = (os.cpu_count() or 1) if size >= POOL_MIN_BYTES else 1
+    total = ({}, {}, Counter())
+    chunks = read_chunks(paths, chunk_size)
+    if workers == 1:
+        for chunk in chunks:
+            _merge(total, grade_chunk(chunk, key))
+    else:
+        with ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(key,)) as pool:
+            pending = set()
+            for chunk in chunks:
+                if len(pending) >= 2 * workers:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        _merge(total, future.result())
+                pending.add(pool.submit(grade_chunk, chunk))
+            for future in pending:
+                _merge(total, future.result())
+    return make_report(key, *total)
+
+
+def make_report(key, students, items, unknown):
+    """
+    Turn merged tallies into a report.
+
+    Args:
+        key (dict): Answer key
+        students (dict): Student -> [answered, correct, blank]
+        items (dict): Question -> [attempts, correct, blank, wrong answer Counter]
+        unknown (Counter): Question ids missing from the key
+
+    Returns:
+        GradeReport: See grade()
+    """
+    scores = [StudentScore(student, answered, correct, blank, correct / answered)
+              for student, (answered, correct, blank) in sorted(students.items())]
+    stats = []
+    for question, (attempts, correct, blank, wrong) in sorted(items.items()):
+        entry = key[question]
+        common = "; ".join(f"{text} ({count})" for text, count in wrong.most_common(WRONG_ANSWERS))
+        stats.append(ItemStats(question, entry.symbol, entry.question_type, attempts, correct, blank,
+                               correct / attempts, common))
+    return GradeReport(scores, stats, sum(score.answered for score in scores), unknown)
+
+
+def write_table(records, path):
+    """
+    Write namedtuple records to a CSV file.
+
+    Args:
+        records (list): StudentScore or ItemStats records
+        path (str): Output file
+    """
+    if not records:
+        return
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(records[0]._fields)
+        writer.writerows(records)
+
+
+def main():
+    """Command line entry point of the bulk grader."""
+    parser = argparse.ArgumentParser(description="Grade free-response answer sheets")
+    parser.add_argument("sheets", nargs="+", help="CSV files with student, question and answer columns")
+    parser.add_argument("--key", help="Question bank exported with periodictable.export "
+                                      "(defaults to the full bank)")
+    parser.add_argument("--scores", default="scores.csv", help="Per-student output")
+    parser.add_argument("--items", default="item_stats.csv", help="Per-question output")
+    parser.add_argument("--workers", type=int, help="Worker processes (defaults to in-process grading, "
+                                           "or the CPU count for sheets over 64 MiB)")
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    key = load_key(args.key) if args.key else key_from_bank()
+    report = grade(args.sheets, key, args.workers, args.chunk_size)
+    write_table(report.students, args.scores)
+    write_table(report.items, args.items)
+    print(f"{report.rows} answers of {len(report.students)} students graded in "
+          f"{time.perf_counter() - start:.2f} s", file=sys.stderr)
+    if report.unknown:
+        print(f"{sum(report.unknown.values())} answers to {len(report.unknown)} questions "
+              f"missing from the key were skipped", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,207 @@
+"""
+Property Heatmaps
+Numeric element properties (atomic mass, Slater effective nuclear charge, isotope count,
+quiz error rate) as arrays over every tile of the table, and a vectorized colormap that
+turns a whole property into RGB colours in one NumPy evaluation, so the table widget can
+be recoloured with a single repaint.
+"""
+
+import os
+import re
+from collections import namedtuple
+
+import numpy as np
+
+try:
+    from .elements_data import elements, positions, isotope_data
+    from .normalization import fold_scripts
+    from .events import load_events, element_error_rates
+except ImportError:
+    from elements_data import elements, positions, isotope_data
+    from normalization import fold_scripts
+    from events import load_events, element_error_rates
+
+# Tiles in a fixed order; every property array is aligned with it
+SYMBOLS = tuple(positions)
+
+# Colormap stops (position, RGB), a perceptually ordered dark blue to yellow ramp
+COLORMAP = (
+    (0.00, (68, 1, 84)),
+    (0.25, (59, 82, 139)),
+    (0.50, (33, 145, 140)),
+    (0.75, (94, 201, 98)),
+    (1.00, (253, 231, 37)),
+)
+
+# A property evaluated over SYMBOLS; values are NaN where unknown (known is False),
+# colors are (n, 3) uint8
+Heatmap = namedtuple("Heatmap", ["name", "label", "values", "known", "colors", "vmin", "vmax"])
+
+SUBSHELL = re.compile(r"(\d)([spdf])(\d+)")
+CORE = re.compile(r"\[(\w+)\]")
+
+
+def colormap(values, vmin=None, vmax=None, stops=COLORMAP):
+    """
+    Map values to colours by linear interpolation between stops.
+
+    Args:
+        values (ndarray): Values, NaN where missing
+        vmin (float): Value mapped to the first stop (defaults to the smallest value)
+        vmax (float): Value mapped to the last stop (defaults to the largest value)
+        stops (tuple): (position in [0, 1], (r, g, b)) pairs in increasing order
+
+    Returns:
+        ndarray: (len(values), 3) uint8 colours; rows of missing values are 0
+    """
+    values = np.asarray(values, dtype=float)
+    known = ~np.isnan(values)
+    if not known.any():
+        return np.zeros((len(values), 3), dtype=np.uint8)
+    vmin = np.nanmin(values) if vmin is None else vmin
+    vmax = np.nanmax(values) if vmax is None else vmax
+    span = vmax - vmin if vmax > vmin else 1.0
+    t = np.clip((np.where(known, values, vmin) - vmin) / span, 0.0, 1.0)
+    where = np.array([position for position, _ in stops])
+    rgb = np.array([color for _, color in stops], dtype=float)
+    colors = np.stack([np.interp(t, where, rgb[:, channel]) for channel in range(3)], axis=1)
+    colors[~known] = 0
+    return np.rint(colors).astype(np.uint8)
+
+
+def make_heatmap(name, label, values):
+    """
+    Colour a property over SYMBOLS.
+
+    Args:
+        name (str): Property key
+        label (str): Legend title
+        values (ndarray): Value per symbol of SYMBOLS, NaN where unknown
+
+    Returns:
+        Heatmap: Values with their colours and range
+    """
+    values = np.asarray(values, dtype=float)
+    known = ~np.isnan(values)
+    vmin, vmax = (float(values[known].min()), float(values[known].max())) if known.any() else (0.0, 0.0)
+    return Heatmap(name, label, values, known, colormap(values, vmin, vmax), vmin, vmax)
+
+# ======================================================================================
+# PROPERTIES
+# ======================================================================================
+
+
+def full_configuration(symbol):
+    """
+    Electron configuration with noble gas cores expanded.
+
+    Args:
+        symbol (str): Element symbol
+
+    Returns:
+        list: (n, subshell letter, electrons) tuples
+    """
+    config = fold_scripts(elements[symbol]["electron_config"])
+    core = CORE.match(config)
+    subshells = full_configuration(core.group(1)) if core else []
+    return subshells + [(int(n), letter, int(count)) for n, letter, count in SUBSHELL.findall(config)]
+
+
+def slater_zeff(symbol):
+    """
+    Effective nuclear charge felt by the outermost electron, by Slater's rules.
+
+    Electrons are grouped (1s)(2s,2p)(3s,3p)(3d)(4s,4p)(4d)(4f)...; other
+    electrons of the same group shield 0.35 (0.30 within 1s). For an s or p
+    electron, the shell below shields 0.85 and deeper shells 1.00; for a d
+    or f electron every lower group shields 1.00.
+
+    Args:
+        symbol (str): Element symbol
+
+    Returns:
+        float: Z - S
+    """
+    groups = {}
+    for n, letter, count in full_configuration(symbol):
+        key = (n, 0 if letter in "sp" else "_df".index(letter))
+        groups[key] = groups.get(key, 0) + count
+    # Groups in Slater order: by shell, s/p before d before f
+    outer = max(groups)
+    n, kind = outer
+    shielding = (groups[outer] - 1) * (0.30 if outer == (1, 0) else 0.35)
+    for key, count in groups.items():
+        if key >= outer:
+            continue
+        if kind == 0 and key[0] == n - 1:
+            shielding += 0.85 * count
+        else:
+            shielding += count
+    return elements[symbol]["num"] - shielding
+
+
+def atomic_masses():
+    """Standard atomic mass of each tile, in u."""
+    return np.array([elements[symbol]["masse"] for symbol in SYMBOLS], dtype=float)
+
+
+def effective_charges():
+    """Slater effective nuclear charge of each tile's outermost electron."""
+    return np.array([slater_zeff(symbol) for symbol in SYMBOLS])
+
+
+def isotope_counts():
+    """Number of tabulated isotopes of each tile."""
+    return np.array([len(isotope_data.get(symbol, ())) for symbol in SYMBOLS], dtype=float)
+
+
+def quiz_error_rates(path):
+    """
+    Fraction of quiz answers about each element that were wrong.
+
+    Args:
+        path (str): Event log database (see periodictable.events)
+
+    Returns:
+        ndarray: Error rate per tile, NaN for elements never asked
+    """
+    if not os.path.exists(path):
+        return np.full(len(SYMBOLS), np.nan)
+    rates = element_error_rates(load_events(path))["error_rate"]
+    return rates.reindex(SYMBOLS).to_numpy(dtype=float)
+
+
+# Property key -> legend title
+PROPERTIES = {
+    "mass": "Atomic mass (u)",
+    "z_eff": "Effective nuclear charge (Slater)",
+    "isotopes": "Tabulated isotopes",
+    "error_rate": "Quiz error rate",
+}
+
+
+def property_heatmap(name, event_log=None):
+    """
+    Evaluate and colour one property over every tile.
+
+    Args:
+        name (str): Key of PROPERTIES
+        event_log (str): Event log database, for 'error_rate'
+
+    Returns:
+        Heatmap: The coloured property
+
+    Raises:
+        ValueError: If the property is unknown
+    """
+    if name == "mass":
+        values = atomic_masses()
+    elif name == "z_eff":
+        values = effective_charges()
+    elif name == "isotopes":
+        values = isotope_counts()
+    elif name == "error_rate":
+        values = quiz_error_rates(event_log)
+    else:
+        raise ValueError(f"Unknown heatmap property {name!r}")
+    return make_heatmap(name, PROPERTIES[name], values)
@@ -0,0 +1,222 @@
+"""
+Asynchronous Structure Image Loading
+Decodes atomic structure images on QThreadPool workers with QImageReader, scaling
+during decode, and hands them back to the GUI thread through signals. Decoded pixmaps
+are kept in QPixmapCache (which evicts by size), and neighbouring tiles in `positions`
+can be prefetched while the user hovers or browses.
+"""
+
+import os
+
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, QSize, Qt, pyqtSignal
+from PyQt5.QtGui import QImage, QImageReader, QPixmap, QPixmapCache
+
+try:
+    from .elements_data import positions
+    from .element_dialog import structure_image_path, IMAGE_SIZE
+    from .diagnostics import pixmap_bytes
+except ImportError:
+    from elements_data import positions
+    from element_dialog import structure_image_path, IMAGE_SIZE
+    from diagnostics import pixmap_bytes
+
+# QPixmapCache budget for structure images, in kilobytes
+DEFAULT_CACHE_LIMIT_KB = 32 * 1024
+
+_GRID = {(row, col): symbol for symbol, (row, col) in positions.items()}
+
+
+def neighbours(symbol):
+    """
+    Return the symbols of the tiles surrounding an element in `positions`.
+
+    Args:
+        symbol (str): Chemical symbol of the element
+
+    Returns:
+        list: Symbols of up to eight adjacent tiles
+    """
+    row, col = positions[symbol]
+    return [
+        _GRID[(row + dr, col + dc)]
+        for dr in (-1, 0, 1) for dc in (-1, 0, 1)
+        if (dr or dc) and (row + dr, col + dc) in _GRID
+    ]
+
+
+class _TaskSignals(QObject):
+    """Signals of an ImageLoadTask (QRunnable is not a QObject)."""
+
+    finished = pyqtSignal(str, QImage)
+
+
+class ImageLoadTask(QRunnable):
+    """
+    Worker that decodes one image at its target size.
+
+    QImageReader.setScaledSize lets the decoder produce the scaled image
+    directly instead of decoding at full resolution and scaling afterwards.
+    """
+
+    def __init__(self, symbol, path, size):
+        """
+        Create the task.
+
+        Args:
+            symbol (str): Element symbol the image belongs to
+            path (str): Image file path
+            size (int): Bounding box side length in pixels
+        """
+        super().__init__()
+        self.symbol = symbol
+        self.path = path
+        self.size = size
+        self.signals = _TaskSignals()
+
+    def run(self):
+        """Decode the image (null QImage if missing or unreadable) and emit finished."""
+        image = QImage()
+        if os.path.exists(self.path):
+            reader = QImageReader(self.path)
+            original = reader.size()
+            if original.isValid():
+                reader.setScaledSize(original.scaled(QSize(self.size, self.size), Qt.KeepAspectRatio))
+            image = reader.read()
+        self.signals.finished.emit(self.symbol, image)
+
+
+class StructureImageLoader(QObject):
+    """
+    Loads structure images off the GUI thread and caches the resulting pixmaps.
+
+    Signals:
+        imageReady (str, QPixmap): Emitted on the GUI thread when an image is
+            available; the pixmap is null when the element has no image
+    """
+
+    imageReady = pyqtSignal(str, QPixmap)
+
+    def __init__(self, parent=None, size=IMAGE_SIZE, path_for=structure_image_path,
+                 cache_limit_kb=DEFAULT_CACHE_LIMIT_KB, pool=None):
+        """
+        Create the loader.
+
+        Args:
+            parent (QObject): Parent object
+            size (int): Bounding box side length of decoded images
+            path_for (callable): Maps an element symbol to its image path
+            cache_limit_kb (int): QPixmapCache limit in kilobytes
+            pool (QThreadPool): Worker pool (defaults to the global pool)
+        """
+        super().__init__(parent)
+        self.size = size
+        self.path_for = path_for
+        self.pool = pool or QThreadPool.globalInstance()
+        self.missing = set()
+        self._pending = {}
+        self._cached_symbols = set()
+        QPixmapCache.setCacheLimit(max(QPixmapCache.cacheLimit(), cache_limit_kb))
+
+    def cache_key(self, symbol):
+        """Key of an element image in QPixmapCache."""
+        return f"structure:{symbol}:{self.size}"
+
+    def cached(self, symbol):
+        """
+        Return the cached pixmap of an element, if any.
+
+        Args:
+            symbol (str): Element symbol
+
+        Returns:
+            QPixmap: Cached pixmap, or None if it is not cached
+        """
+        pixmap = QPixmapCache.find(self.cache_key(symbol))
+        return pixmap if pixmap is not None and not pixmap.isNull() else None
+
+    def cache_bytes(self):
+        """
+        Approximate bytes held by this loader's pixmaps in QPixmapCache.
+
+        Symbols evicted by QPixmapCache are forgotten along the way.
+
+        Returns:
+            int: Sum of the cached pixmap sizes
+        """
+        total = 0
+        for symbol in list(self._cached_symbols):
+            pixmap = self.cached(symbol)
+            if pixmap is None:
+                self._cached_symbols.discard(symbol)
+            else:
+                total += pixmap_bytes(pixmap)
+        return total
+
+    def request(self, symbol):
+        """
+        Ask for an element image; imageReady is emitted when it is available.
+
+        Cached and known-missing images are answered immediately; otherwise a
+        decode task is queued unless one is already pending.
+
+        Args:
+            symbol (str): Element symbol
+
+        Returns:
+            QPixmap: The pixmap if it was already cached, otherwise None
+        """
+        pixmap = self.cached(symbol)
+        if pixmap is not None:
+            self.imageReady.emit(symbol, pixmap)
+            return pixmap
+        if symbol in self.missing:
+            self.imageReady.emit(symbol, QPixmap())
+            return None
+        self._start(symbol)
+        return None
+
+    def prefetch(self, symbols):
+        """
+        Decode images in the background without emitting for cached ones.
+
+        Args:
+            symbols (iterable): Element symbols to warm the cache with
+        """
+        for symbol in symbols:
+            if symbol not in self.missing and self.cached(symbol) is None:
+                self._start(symbol)
+
+    def prefetch_neighbours(self, symbol):
+        """
+        Prefetch an element and the tiles surrounding it.
+
+        Args:
+            symbol (str): Element symbol under the cursor or on display
+        """
+        self.prefetch([symbol] + neighbours(symbol))
+
+    def wait_for_done(self, msecs=-1):
+        """Block until queued decode tasks finish (used by tests and shutdown)."""
+        return self.pool.waitForDone(msecs)
+
+    def _start(self, symbol):
+        """Queue a decode task for a symbol unless one is already pending."""
+        if symbol in self._pending:
+            return
+        task = ImageLoadTask(symbol, self.path_for(symbol), self.size)
+        task.setAutoDelete(False)
+        task.signals.finished.connect(self._on_finished, Qt.QueuedConnection)
+        self._pending[symbol] = task
+        self.pool.start(task)
+
+    def _on_finished(self, symbol, image):
+        """Convert the decoded image to a pixmap on the GUI thread and cache it."""
+        self._pending.pop(symbol, None)
+        if image.isNull():
+            self.missing.add(symbol)
+            self.imageReady.emit(symbol, QPixmap())
+            return
+        pixmap = QPixmap.fromImage(image)
+        QPixmapCache.insert(self.cache_key(symbol), pixmap)
+        self._cached_symbols.add(symbol)
+        self.imageReady.emit(symbol, pixmap)
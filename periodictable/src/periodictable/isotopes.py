@@ -0,0 +1,150 @@
+"""
+Isotope Table and Isotope Pattern Calculation
+Builds a structured isotope table (mass number, exact mass, natural abundance) from
+elements_data.py and computes the isotope distribution of a molecular formula by
+FFT convolution of per-element distributions binned by nominal mass.
+"""
+
+from collections import namedtuple
+
+import numpy as np
+from scipy import fft
+
+try:
+    from .elements_data import isotope_data
+    from .formula import parse_formula
+except ImportError:
+    from elements_data import isotope_data
+    from formula import parse_formula
+
+# One row of the isotope table; `display` is the string shown in the element dialog
+Isotope = namedtuple("Isotope", ["display", "mass_number", "mass", "abundance"])
+
+# Element symbol -> tuple of Isotope sorted by mass number
+isotope_table = {
+    symbol: tuple(Isotope(*row) for row in rows)
+    for symbol, rows in isotope_data.items()
+}
+
+# Peaks below this fraction of the most intense peak are pruned from patterns
+DEFAULT_THRESHOLD = 1e-6
+
+
+def natural_isotopes(symbol):
+    """
+    Return the naturally occurring isotopes of an element.
+
+    Args:
+        symbol (str): Chemical symbol of the element (e.g., "Cl")
+
+    Returns:
+        tuple: Isotope rows with a non-zero natural abundance
+    """
+    return tuple(iso for iso in isotope_table[symbol] if iso.abundance > 0)
+
+
+def _element_spectrum(symbol):
+    """
+    Bin the natural isotopes of an element by mass number.
+
+    Args:
+        symbol (str): Chemical symbol of the element
+
+    Returns:
+        tuple: (lowest mass number, abundance per bin, abundance-weighted exact mass per bin)
+
+    Raises:
+        ValueError: If the element has no naturally occurring isotopes
+    """
+    isotopes = natural_isotopes(symbol)
+    if not isotopes:
+        raise ValueError(f"{symbol} has no naturally occurring isotopes")
+    low = isotopes[0].mass_number
+    width = isotopes[-1].mass_number - low + 1
+    abundance = np.zeros(width)
+    weighted_mass = np.zeros(width)
+    for iso in isotopes:
+        abundance[iso.mass_number - low] += iso.abundance
+        weighted_mass[iso.mass_number - low] += iso.abundance * iso.mass
+    total = abundance.sum()
+    return low, abundance / total, weighted_mass / total
+
+
+def isotope_distribution(formula, threshold=DEFAULT_THRESHOLD):
+    """
+    Compute the isotope pattern of a molecular formula.
+
+    Each element contributes a distribution over nominal-mass offsets; the
+    molecule's distribution is their convolution, raised to the atom counts
+    in Fourier space so cost grows with the pattern width rather than with the
+    number of isotopic combinations. The exact mass of each nominal-mass peak
+    is its abundance-weighted mean, obtained from the derivative of the
+    generating function (sum over elements of n * M_e * P_e^(n-1) * others).
+
+    Args:
+        formula (str or dict): Formula string (e.g., 'C6H12O6') or symbol -> count mapping
+        threshold (float): Peaks below this fraction of the base peak are pruned
+
+    Returns:
+        tuple: (masses, abundances) as numpy arrays sorted by mass; abundances
+               are probabilities summing to one before pruning
+    """
+    counts = parse_formula(formula) if isinstance(formula, str) else dict(formula)
+    counts = {symbol: n for symbol, n in counts.items() if n}
+    if not counts:
+        raise ValueError("Formula contains no atoms")
+
+    spectra = {symbol: _element_spectrum(symbol) for symbol in counts}
+    offset = sum(n * spectra[symbol][0] for symbol, n in counts.items())
+    width = sum(n * (len(spectra[symbol][1]) - 1) for symbol, n in counts.items()) + 1
+    size = fft.next_fast_len(width, real=True)
+
+    # Transform each element once; P^n and n * M * P^(n-1) per element
+    powers, derivatives = [], []
+    for symbol, n in counts.items():
+        _, abundance, weighted_mass = spectra[symbol]
+        p_hat = fft.rfft(abundance, size)
+        m_hat = fft.rfft(weighted_mass, size)
+        p_prev = p_hat ** (n - 1)
+        powers.append(p_prev * p_hat)
+        derivatives.append(n * m_hat * p_prev)
+
+    # Prefix/suffix products avoid dividing by P_e where it vanishes
+    k = len(powers)
+    prefix = [np.ones_like(powers[0])]
+    for p in powers:
+        prefix.append(prefix[-1] * p)
+    suffix = [np.ones_like(powers[0])]
+    for p in reversed(powers):
+        suffix.append(suffix[-1] * p)
+    suffix.reverse()
+
+    total_hat = prefix[-1]
+    mass_hat = sum(prefix[i] * derivatives[i] * suffix[i + 1] for i in range(k))
+
+    abundance = fft.irfft(total_hat, size)[:width]
+    weighted = fft.irfft(mass_hat, size)[:width]
+
+    keep = abundance > threshold * abundance.max()
+    nominal = np.nonzero(keep)[0]
+    abundances = abundance[keep]
+    masses = weighted[keep] / abundances
+    order = np.argsort(nominal + offset)
+    return masses[order], abundances[order]
+
+
+def monoisotopic_mass(formula):
+    """
+    Compute the monoisotopic mass of a formula (most abundant isotope of each element).
+
+    Args:
+        formula (str or dict): Formula string or symbol -> count mapping
+
+    Returns:
+        float: Monoisotopic mass in u
+    """
+    counts = parse_formula(formula) if isinstance(formula, str) else formula
+    return sum(
+        n * max(natural_isotopes(symbol), key=lambda iso: iso.abundance).mass
+        for symbol, n in counts.items()
+    )
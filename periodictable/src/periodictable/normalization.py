@@ -0,0 +1,73 @@
+"""
+Text Normalization
+Shared folding rules used for answer comparison, search tokenisation and matching:
+accents stripped, case folded, Unicode subscripts/superscripts mapped to ASCII.
+"""
+
+import re
+import unicodedata
+
+# Subscript and superscript digits/signs folded to their ASCII equivalents
+SCRIPT_FOLD = str.maketrans("₀₁₂₃₄₅₆₇₈₉⁰¹²³⁴⁵⁶⁷⁸⁹⁺⁻", "01234567890123456789+-")
+
+WORD = re.compile(r"[^\W_]+")
+
+
+def strip_accents(text):
+    """
+    Remove combining accents from text.
+
+    Args:
+        text (str): Text to fold
+
+    Returns:
+        str: Text with accents removed ('Néon' -> 'Neon')
+    """
+    return ''.join(c for c in unicodedata.normalize('NFD', text)
+                   if unicodedata.category(c) != 'Mn')
+
+
+def fold_scripts(text):
+    """
+    Replace subscript and superscript digits and signs with ASCII characters.
+
+    Args:
+        text (str): Text to fold
+
+    Returns:
+        str: Folded text ('H₂O' -> 'H2O', '2p⁴' -> '2p4')
+    """
+    return text.translate(SCRIPT_FOLD)
+
+
+def normalize_text(text):
+    """
+    Normalize text for accurate answer comparison.
+
+    Removes accents, converts to lowercase, and removes spaces to
+    enable flexible answer matching that ignores formatting differences
+    and minor spelling variations.
+
+    Args:
+        text (str): The text to normalize
+
+    Returns:
+        str: Normalized text with accents removed, lowercase, no spaces
+    """
+    return strip_accents(text).lower().replace(" ", "")
+
+
+def tokenize(text):
+    """
+    Split text into normalised search tokens.
+
+    Subscripts and superscripts are folded, accents stripped and case
+    folded, so 'Cl₂', 'cl2' and 'CL2' all produce the token 'cl2'.
+
+    Args:
+        text (str): Text to tokenise
+
+    Returns:
+        list: Lowercase ASCII-folded word tokens
+    """
+    return WORD.findall(strip_accents(fold_scripts(text)).lower())
@@ -0,0 +1,690 @@
+"""
+Chart of Nuclides
+Interactive N-versus-Z chart of every tabulated isotope plus the nuclides the liquid-drop
+mass formula predicts to be bound, several thousand cells in all. The chart is one
+custom-painted widget: cell fills come from an image holding one pixel per nuclide,
+drawn in a single call under the view transform, while borders and labels are drawn
+only for the cells inside the viewport, found through a row-bucketed spatial index
+that also answers hover lookups. Detail is added as the user zooms in.
+"""
+
+import math
+import sys
+import time
+from collections import namedtuple
+
+import numpy as np
+from PyQt5.QtWidgets import QApplication, QWidget, QVBoxLayout, QLabel, QSizePolicy
+from PyQt5.QtCore import Qt, QRectF, QPointF, QLineF, QSize, pyqtSignal
+from PyQt5.QtGui import QPainter, QColor, QPen, QFont, QImage
+
+try:
+    from .elements_data import elements
+    from .isotopes import isotope_table
+except ImportError:
+    from elements_data import elements
+    from isotopes import isotope_table
+
+# One chart cell; abundance is None for predicted nuclides, binding_energy in MeV
+Nuclide = namedtuple("Nuclide", ["z", "n", "symbol", "mass_number", "abundance", "kind",
+                                 "binding_energy"])
+
+# Cell kinds: naturally occurring, tabulated but not natural, predicted bound
+NATURAL = "natural"
+TABULATED = "tabulated"
+PREDICTED = "predicted"
+
+KIND_COLORS = {NATURAL: "#1F3B73", TABULATED: "#E8A33D", PREDICTED: "#BFD7EA"}
+KIND_LABELS = {NATURAL: "Natural", TABULATED: "Tabulated, not natural", PREDICTED: "Predicted bound"}
+
+# Liquid-drop (Weizsäcker) coefficients in MeV: volume, surface, Coulomb, asymmetry, pairing
+VOLUME, SURFACE, COULOMB, ASYMMETRY, PAIRING = 15.75, 17.8, 0.711, 23.7, 11.18
+
+# Lightest mass number whose liquid-drop binding energy is shown (the model is
+# meaningless for the hydrogen isotopes below it)
+MIN_MODEL_MASS = 3
+
+MAX_Z = max(element["num"] for element in elements.values())
+MAX_N = 320
+
+SYMBOL_BY_Z = {element["num"]: symbol for symbol, element in elements.items()}
+
+
+def binding_energy(z, n):
+    """
+    Liquid-drop binding energy of nuclei.
+
+    Args:
+        z (int or ndarray): Proton numbers
+        n (int or ndarray): Neutron numbers
+
+    Returns:
+        ndarray: Binding energy in MeV, 0 where there is no nucleus (Z < 1)
+    """
+    z = np.asarray(z, dtype=float)
+    n = np.asarray(n, dtype=float)
+    a = np.maximum(z + n, 1.0)
+    energy = (VOLUME * a - SURFACE * a ** (2 / 3) - COULOMB * z * (z - 1) / a ** (1 / 3)
+              - ASYMMETRY * (n - z) ** 2 / a)
+    parity = np.where((z % 2 == 0) & (n % 2 == 0), 1.0, np.where((z % 2 == 1) & (n % 2 == 1), -1.0, 0.0))
+    energy += parity * PAIRING / np.sqrt(a)
+    return np.where(z >= 1, energy, 0.0)
+
+
+def predicted_bound(max_z=MAX_Z, max_n=MAX_N):
+    """
+    Nuclides bound against two-neutron and two-proton emission.
+
+    Args:
+        max_z (int): Highest proton number
+        max_n (int): Highest neutron number considered
+
+    Returns:
+        tuple: (z, n) arrays of the predicted bound nuclides, sorted by Z then N
+    """
+    z, n = np.meshgrid(np.arange(1, max_z + 1), np.arange(0, max_n + 1), indexing="ij")
+    energy = binding_energy(z, n)
+    bound = ((energy > 0) & (energy - binding_energy(z, n - 2) > 0)
+             & (energy - binding_energy(z - 2, n) > 0))
+    return z[bound], n[bound]
+
+
+def nuclide_table():
+    """
+    Every nuclide of the chart.
+
+    Tabulated isotopes come from the isotope table; predicted bound
+    nuclides fill in the rest of the chart between the drip lines.
+
+    Returns:
+        list: Nuclide records sorted by Z then N
+    """
+    cells = {(int(z), int(n)): (None, PREDICTED) for z, n in zip(*predicted_bound())}
+    for symbol, isotopes in isotope_table.items():
+        z = elements[symbol]["num"]
+        for isotope in isotopes:
+            kind = NATURAL if isotope.abundance > 0 else TABULATED
+            cells[(z, isotope.mass_number - z)] = (isotope.abundance, kind)
+    keys = sorted(cells)
+    energies = binding_energy([z for z, _ in keys], [n for _, n in keys]).tolist()
+    return [Nuclide(z, n, SYMBOL_BY_Z[z], z + n, *cells[(z, n)], energy)
+            for (z, n), energy in zip(keys, energies)]
+
+
+def runs(values):
+    """
+    Split sorted integers into runs of consecutive values.
+
+    Args:
+        values (iterable): Sorted integers
+
+    Returns:
+        list: (first, last) pairs
+    """
+    found = []
+    for value in values:
+        if found and value == found[-1][1] + 1:
+            found[-1][1] = value
+        else:
+            found.append([value, value])
+    return [tuple(run) for run in found]
+
+
+class NuclideIndex:
+    """
+    Spatial index of chart cells.
+
+    Cells lie on the integer (N, Z) lattice, so each Z row keeps its sorted
+    N values: a viewport query binary-searches the visible N range of each
+    visible row, and a point lookup is one dictionary access.
+
+    Attributes:
+        nuclides (list): Nuclide records
+        cells (dict): (n, z) -> position in nuclides
+        n (ndarray): Neutron number of each nuclide
+        z (ndarray): Proton number of each nuclide
+        rows (dict): z -> (sorted N array, matching positions array)
+        row_edges (dict): z -> QLineF top and bottom edges of the row's runs of cells,
+            in lattice units with Z growing downwards from the top row
+        column_edges (dict): n -> QLineF left and right edges of the column's runs of cells
+        max_n (int): Largest neutron number
+        max_z (int): Largest proton number
+    """
+
+    def __init__(self, nuclides):
+        """
+        Index a list of nuclides.
+
+        Args:
+            nuclides (list): Nuclide records
+        """
+        self.nuclides = list(nuclides)
+        self.cells = {(nuclide.n, nuclide.z): i for i, nuclide in enumerate(self.nuclides)}
+        self.n = np.array([nuclide.n for nuclide in self.nuclides])
+        self.z = np.array([nuclide.z for nuclide in self.nuclides])
+        rows = {}
+        for i, nuclide in enumerate(self.nuclides):
+            rows.setdefault(nuclide.z, []).append((nuclide.n, i))
+        self.rows = {}
+        for z, entries in rows.items():
+            entries.sort()
+            self.rows[z] = (np.array([n for n, _ in entries]), np.array([i for _, i in entries]))
+        self.max_n = max(nuclide.n for nuclide in self.nuclides)
+        self.max_z = max(nuclide.z for nuclide in self.nuclides)
+
+        # Cell borders as the outlines of runs of adjacent cells: a few lines per
+        # row and column instead of four per cell
+        columns = {}
+        for nuclide in self.nuclides:
+            columns.setdefault(nuclide.n, []).append(nuclide.z)
+        self.row_edges, self.column_edges = {}, {}
+        for z, (ns, _) in self.rows.items():
+            top = self.max_z - z
+            self.row_edges[z] = [QLineF(first, y, last + 1, y) for first, last in runs(ns.tolist())
+                                 for y in (top, top + 1)]
+        for n, zs in columns.items():
+            self.column_edges[n] = [QLineF(x, self.max_z - last, x, self.max_z + 1 - first)
+                                    for first, last in runs(sorted(zs)) for x in (n, n + 1)]
+
+    def __len__(self):
+        return len(self.nuclides)
+
+    def at(self, n, z):
+        """
+        Nuclide of a cell.
+
+        Args:
+            n (int): Neutron number
+            z (int): Proton number
+
+        Returns:
+            Nuclide: The cell's nuclide, or None for an empty cell
+        """
+        i = self.cells.get((n, z))
+        return None if i is None else self.nuclides[i]
+
+    def edges(self, n0, n1, z0, z1):
+        """
+        Border lines of the cells inside a rectangle of the chart.
+
+        Args:
+            n0 (int): Smallest neutron number
+            n1 (int): Largest neutron number
+            z0 (int): Smallest proton number
+            z1 (int): Largest proton number
+
+        Returns:
+            list: QLineF in image coordinates (see cell_image)
+        """
+        lines = []
+        for z in range(max(z0, 0), min(z1, self.max_z) + 1):
+            lines.extend(self.row_edges.get(z, ()))
+        for n in range(max(n0, 0), min(n1, self.max_n) + 1):
+            lines.extend(self.column_edges.get(n, ()))
+        return lines
+
+    def visible(self, n0, n1, z0, z1):
+        """
+        Positions of the nuclides inside a rectangle of the chart.
+
+        Args:
+            n0 (int): Smallest neutron number
+            n1 (int): Largest neutron number
+            z0 (int): Smallest proton number
+            z1 (int): Largest proton number
+
+        Returns:
+            list: Positions in nuclides
+        """
+        found = []
+        for z in range(max(z0, 0), min(z1, self.max_z) + 1):
+            row = self.rows.get(z)
+            if row is not None:
+                ns, positions = row
+                found.extend(positions[np.searchsorted(ns, n0):np.searchsorted(ns, n1, side="right")])
+        return found
+
+# ======================================================================================
+# CHART WIDGET
+# ======================================================================================
+
+
+class NuclideChartView(QWidget):
+    """
+    Pannable, zoomable chart of nuclides.
+
+    Neutron number grows to the right and proton number upwards. The view
+    is a scale in pixels per cell and the widget position of the chart
+    origin (N = 0, Z = 0 bottom-left corner). Drag to pan, use the wheel or
+    +/- to zoom about the cursor, Home to fit the whole chart.
+
+    Signals:
+        nuclideHovered (object): Emitted with the Nuclide under the cursor (None off the cells)
+
+    Attributes:
+        index (NuclideIndex): Cells and their spatial index
+        scale (float): Pixels per cell
+        origin (QPointF): Widget position of the chart origin
+        hovered (Nuclide): Nuclide under the cursor
+    """
+
+    nuclideHovered = pyqtSignal(object)
+
+    # Cell sizes (pixels) from which borders, one-line and two-line labels are drawn
+    BORDER_LOD = 6
+    LABEL_LOD = 22
+    DETAIL_LOD = 44
+    MAX_SCALE = 120
+    ZOOM_STEP = 1.25
+
+    def __init__(self, nuclides=None, parent=None):
+        """
+        Build the index and the cell image.
+
+        Args:
+            nuclides (list): Nuclide records (defaults to nuclide_table())
+            parent (QWidget): Parent widget
+        """
+        super().__init__(parent)
+        self.index = NuclideIndex(nuclide_table() if nuclides is None else nuclides)
+        self.image = self.cell_image()
+        self.scale = 1.0
+        self.origin = QPointF(0, 0)
+        self.fitted = False
+        self.hovered = None
+        self.drag_start = None
+
+        self.border_pen = QPen(QColor("#555555"), 0)  # cosmetic: one pixel at any zoom
+        self.hover_pen = QPen(QColor("#D62828"), 2)
+        self.text_pens = {kind: QPen(QColor("#FFFFFF" if kind == NATURAL else "#000000"))
+                          for kind in KIND_COLORS}
+        self.fonts = {}
+        # Label strings per nuclide position, and their widths at the current font size
+        self.label_texts = [self.label_lines(nuclide) for nuclide in self.index.nuclides]
+        self.label_size = None
+        self.label_widths = {}
+
+        self.setMouseTracking(True)
+        self.setFocusPolicy(Qt.StrongFocus)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.setMinimumSize(300, 200)
+
+    def sizeHint(self):
+        """Preferred size: the whole chart at three pixels per cell."""
+        return QSize(3 * (self.index.max_n + 1), 3 * (self.index.max_z + 1))
+
+    def cell_image(self):
+        """
+        Render every cell as one pixel, empty cells transparent.
+
+        Returns:
+            QImage: (max_n + 1) x (max_z + 1) image, row 0 holding the highest Z
+        """
+        width, height = self.index.max_n + 1, self.index.max_z + 1
+        pixels = np.zeros((height, width), dtype=np.uint32)
+        argb = {kind: np.uint32(QColor(color).rgba()) for kind, color in KIND_COLORS.items()}
+        for nuclide in self.index.nuclides:
+            pixels[self.index.max_z - nuclide.z, nuclide.n] = argb[nuclide.kind]
+        image = QImage(pixels.data, width, height, 4 * width, QImage.Format_ARGB32_Premultiplied)
+        return image.copy()
+
+    # ==================================================================================
+    # VIEW
+    # ==================================================================================
+
+    def fit(self):
+        """Zoom and centre so the whole chart fits the widget."""
+        cols, rows = self.index.max_n + 1, self.index.max_z + 1
+        self.scale = max(0.25, min(self.width() / cols, self.height() / rows))
+        self.origin = QPointF((self.width() - cols * self.scale) / 2,
+                              (self.height() + rows * self.scale) / 2)
+        self.update()
+
+    def cell_rect(self, n, z):
+        """
+        Widget rectangle of a cell.
+
+        Args:
+            n (int): Neutron number
+            z (int): Proton number
+
+        Returns:
+            QRectF: Cell rectangle
+        """
+        return QRectF(self.origin.x() + n * self.scale, self.origin.y() - (z + 1) * self.scale,
+                      self.scale, self.scale)
+
+    def cell_at(self, x, y):
+        """
+        Cell under a widget position.
+
+        Args:
+            x (float): Horizontal widget position
+            y (float): Vertical widget position
+
+        Returns:
+            tuple: (n, z) lattice coordinates
+        """
+        return (math.floor((x - self.origin.x()) / self.scale),
+                math.floor((self.origin.y() - y) / self.scale))
+
+    def visible_range(self):
+        """
+        Lattice rectangle covered by the widget.
+
+        Returns:
+            tuple: (n0, n1, z0, z1)
+        """
+        n0, z1 = self.cell_at(0, 0)
+        n1, z0 = self.cell_at(self.width(), self.height())
+        return n0, n1, z0, z1
+
+    def zoom(self, factor, anchor=None):
+        """
+        Zoom about a widget position, keeping the cell under it in place.
+
+        Args:
+            factor (float): Scale multiplier
+            anchor (QPointF): Fixed point (defaults to the widget centre)
+        """
+        anchor = QPointF(self.width() / 2, self.height() / 2) if anchor is None else anchor
+        fit_scale = min(self.width() / (self.index.max_n + 1), self.height() / (self.index.max_z + 1))
+        scale = min(self.MAX_SCALE, max(min(fit_scale, 1.0) / 2, self.scale * factor))
+        self.origin = anchor + (self.origin - anchor) * (scale / self.scale)
+        self.scale = scale
+        self.fitted = True
+        self.update()
+
+    def pan(self, dx, dy):
+        """
+        Move the chart by a number of pixels.
+
+        Args:
+            dx (float): Horizontal shift
+            dy (float): Vertical shift
+        """
+        self.origin += QPointF(dx, dy)
+        self.fitted = True
+        self.update()
+
+    def center_on(self, n, z):
+        """
+        Centre the view on a cell.
+
+        Args:
+            n (int): Neutron number
+            z (int): Proton number
+        """
+        center = self.cell_rect(n, z).center()
+        self.pan(self.width() / 2 - center.x(), self.height() / 2 - center.y())
+
+    # ==================================================================================
+    # PAINTING
+    # ==================================================================================
+
+    def font_for(self, size):
+        """Cached bold label font of a pixel size."""
+        font = self.fonts.get(size)
+        if font is None:
+            font = self.fonts[size] = QFont("Arial")
+            font.setBold(True)
+            font.setPixelSize(size)
+        return font
+
+    def paintEvent(self, event):
+        """
+        Paint the visible part of the chart.
+
+        Fills are one scaled draw of the cell image; borders and labels are
+        only drawn for the cells the spatial index reports in the viewport,
+        once the cells are large enough for them.
+        """
+        painter = QPainter(self)
+        painter.fillRect(self.rect(), QColor("#FFFFFF"))
+
+        visible_range = self.visible_range()
+        painter.save()
+        painter.translate(self.origin.x(), self.origin.y() - (self.index.max_z + 1) * self.scale)
+        painter.scale(self.scale, self.scale)
+        painter.drawImage(0, 0, self.image)
+        if self.scale >= self.BORDER_LOD:
+            painter.setPen(self.border_pen)
+            painter.drawLines(self.index.edges(*visible_range))
+        painter.restore()
+
+        if self.scale >= self.LABEL_LOD:
+            self.paint_labels(painter, self.index.visible(*visible_range))
+
+        if self.hovered is not None:
+            painter.setPen(self.hover_pen)
+            painter.setBrush(Qt.NoBrush)
+            painter.drawRect(self.cell_rect(self.hovered.n, self.hovered.z))
+        self.paint_legend(painter)
+        painter.end()
+
+    def paint_labels(self, painter, visible):
+        """
+        Label cells with their mass number and symbol (and abundance when zoomed in).
+
+        Label strings are built once per nuclide and their widths once per
+        font size; cell centres are computed for all visible cells in one
+        array operation.
+
+        Args:
+            painter (QPainter): Active painter
+            visible (list): Positions of the visible nuclides
+        """
+        detail = self.scale >= self.DETAIL_LOD
+        size = max(7, int(self.scale * (0.22 if detail else 0.26)))
+        painter.setFont(self.font_for(size))
+        metrics = painter.fontMetrics()
+        if size != self.label_size:
+            self.label_size, self.label_widths = size, {}
+        middle = (metrics.ascent() - metrics.descent()) / 2
+        baselines = (middle - metrics.height() / 2, middle + metrics.height() / 2) if detail else (middle,)
+
+        visible = np.asarray(visible, dtype=np.int64)
+        xs = (self.origin.x() + (self.index.n[visible] + 0.5) * self.scale).tolist()
+        ys = (self.origin.y() - (self.index.z[visible] + 0.5) * self.scale).tolist()
+        current = None
+        for i, x, y in zip(visible.tolist(), xs, ys):
+            texts = self.label_texts[i]
+            widths = self.label_widths.get(i)
+            if widths is None:
+                widths = self.label_widths[i] = [metrics.horizontalAdvance(text) for text in texts]
+            pen = self.text_pens[self.index.nuclides[i].kind]
+            if pen is not current:
+                painter.setPen(pen)
+                current = pen
+            for text, width, baseline in zip(texts, widths, baselines):
+                painter.drawText(QPointF(x - width / 2, y + baseline), text)
+
+    @staticmethod
+    def label_lines(nuclide):
+        """
+        Label of a cell.
+
+        Args:
+            nuclide (Nuclide): Labelled nuclide
+
+        Returns:
+            tuple: Mass number and symbol, then the abundance (or 'pred.')
+        """
+        second = "pred." if nuclide.abundance is None else f"{100 * nuclide.abundance:.3g}%"
+        return f"{nuclide.mass_number}{nuclide.symbol}", second
+
+    def paint_legend(self, painter):
+        """Swatches of the cell kinds in the top-left corner."""
+        painter.setFont(self.font_for(11))
+        painter.setPen(self.border_pen)
+        painter.setBrush(QColor(255, 255, 255, 220))
+        painter.drawRect(QRectF(2, 2, 170, 18 * len(KIND_COLORS) + 8))
+        y = 8
+        for kind, color in KIND_COLORS.items():
+            painter.setPen(self.border_pen)
+            painter.setBrush(QColor(color))
+            painter.drawRect(QRectF(8, y, 12, 12))
+            painter.setPen(QColor("#000000"))
+            painter.drawText(QRectF(26, y - 2, 200, 16), Qt.AlignLeft | Qt.AlignVCenter, KIND_LABELS[kind])
+            y += 18
+
+    # ==================================================================================
+    # EVENTS
+    # ==================================================================================
+
+    def resizeEvent(self, event):
+        """Keep the whole chart fitted until the user pans or zooms."""
+        if not self.fitted:
+            self.fit()
+        super().resizeEvent(event)
+
+    def wheelEvent(self, event):
+        """Zoom about the cursor, one ZOOM_STEP per wheel notch."""
+        notches = event.angleDelta().y() / 120
+        if notches:
+            self.zoom(self.ZOOM_STEP ** notches, QPointF(event.pos()))
+        event.accept()
+
+    def mousePressEvent(self, event):
+        """Start dragging the chart."""
+        if event.button() == Qt.LeftButton:
+            self.drag_start = event.pos()
+        super().mousePressEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        """Stop dragging the chart."""
+        if event.button() == Qt.LeftButton:
+            self.drag_start = None
+        super().mouseReleaseEvent(event)
+
+    def mouseMoveEvent(self, event):
+        """Pan while dragging, otherwise look up the hovered cell."""
+        if self.drag_start is not None:
+            delta = event.pos() - self.drag_start
+            self.drag_start = event.pos()
+            self.pan(delta.x(), delta.y())
+        nuclide = self.index.at(*self.cell_at(event.x(), event.y()))
+        if nuclide != self.hovered:
+            previous, self.hovered = self.hovered, nuclide
+            for cell in (previous, nuclide):
+                if cell is not None:
+                    self.update(self.cell_rect(cell.n, cell.z).toAlignedRect().adjusted(-2, -2, 2, 2))
+            self.nuclideHovered.emit(nuclide)
+        super().mouseMoveEvent(event)
+
+    def keyPressEvent(self, event):
+        """+/- zoom, arrows pan, Home fits the chart."""
+        key = event.key()
+        step = max(40, self.width() / 8)
+        if key in (Qt.Key_Plus, Qt.Key_Equal):
+            self.zoom(self.ZOOM_STEP)
+        elif key == Qt.Key_Minus:
+            self.zoom(1 / self.ZOOM_STEP)
+        elif key == Qt.Key_Home:
+            self.fit()
+        elif key == Qt.Key_Left:
+            self.pan(step, 0)
+        elif key == Qt.Key_Right:
+            self.pan(-step, 0)
+        elif key == Qt.Key_Up:
+            self.pan(0, step)
+        elif key == Qt.Key_Down:
+            self.pan(0, -step)
+        else:
+            super().keyPressEvent(event)
+
+
+def describe(nuclide):
+    """
+    One-line description of a nuclide for the status line.
+
+    Args:
+        nuclide (Nuclide): Hovered nuclide
+
+    Returns:
+        str: Name, Z, N, abundance or kind and, where the model gives a bound
+        nucleus, the liquid-drop binding energy per nucleon
+    """
+    name = f"{elements[nuclide.symbol]['nom']}-{nuclide.mass_number}"
+    status = (f"abundance {100 * nuclide.abundance:.4g}%" if nuclide.kind == NATURAL
+              else KIND_LABELS[nuclide.kind].lower())
+    text = f"{name}   Z = {nuclide.z}   N = {nuclide.n}   {status}"
+    if nuclide.mass_number >= MIN_MODEL_MASS and nuclide.binding_energy > 0:
+        text += f"   B/A ≈ {nuclide.binding_energy / nuclide.mass_number:.2f} MeV (liquid-drop model)"
+    return text
+
+
+class NuclideChartWindow(QWidget):
+    """
+    Window holding the chart and a status line describing the hovered nuclide.
+
+    Attributes:
+        view (NuclideChartView): The chart
+        status (QLabel): Hovered nuclide description
+    """
+
+    def __init__(self, parent=None):
+        """
+        Create the window.
+
+        Args:
+            parent (QWidget): Owner window (the chart opens as its own window)
+        """
+        super().__init__(parent, Qt.Window)
+        self.setWindowTitle("Chart of Nuclides ☢")
+        self.view = NuclideChartView()
+        self.status = QLabel(f"{len(self.view.index)} nuclides — drag to pan, wheel or +/- to zoom, "
+                             f"Home to fit")
+        self.view.nuclideHovered.connect(self.show_nuclide)
+        layout = QVBoxLayout()
+        layout.addWidget(self.view, 1)
+        layout.addWidget(self.status)
+        self.setLayout(layout)
+        self.resize(1000, 520)
+
+    def show_nuclide(self, nuclide):
+        """Describe the hovered nuclide in the status line."""
+        if nuclide is not None:
+            self.status.setText(describe(nuclide))
+
+
+def benchmark(frames=30, size=(1280, 800)):
+    """
+    Measure paint time of the full chart at each level of detail.
+
+    Args:
+        frames (int): Frames rendered per zoom level
+        size (tuple): Widget size in pixels
+
+    Returns:
+        dict: Cell size in pixels -> mean seconds per frame
+    """
+    view = NuclideChartView()
+    view.resize(*size)
+    view.fit()
+    image = QImage(view.size(), QImage.Format_ARGB32_Premultiplied)
+    results = {}
+    for scale in (view.scale, view.BORDER_LOD, view.LABEL_LOD, view.DETAIL_LOD):
+        view.zoom(scale / view.scale)
+        view.center_on(view.index.max_n // 2, view.index.max_z // 2)
+        start = time.perf_counter()
+        for _ in range(frames):
+            view.render(image)
+        results[round(scale, 1)] = (time.perf_counter() - start) / frames
+    return results
+
+
+def main():
+    """Open the chart of nuclides on its own, or print frame times with --benchmark."""
+    app = QApplication.instance() or QApplication(sys.argv)
+    if "--benchmark" in sys.argv:
+        for scale, seconds in benchmark().items():
+            print(f"{scale:6.1f} px cells: {seconds * 1000:6.2f} ms per frame")
+        return
+    window = NuclideChartWindow()
+    window.show()
+    sys.exit(app.exec_())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Persistent Quiz Dialog
+One quiz window created for the whole session and repopulated for every question.
+User actions are reported through signals; the quiz flow itself lives in the
+application's state machine, so no nested event loop or recursion is needed.
+"""
+
+from PyQt5.QtWidgets import QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton, QLineEdit
+from PyQt5.QtCore import Qt, pyqtSignal
+
+# Number of multiple choice buttons kept in the dialog
+OPTION_COUNT = 4
+
+
+class QuizDialog(QDialog):
+    """
+    Reusable quiz question window.
+
+    Signals:
+        answerSubmitted (str): An option was clicked or a free answer was submitted
+        skipRequested: The user asked for a new question
+        exitRequested: The user left the quiz (button, Escape or window close)
+
+    Attributes:
+        question_label (QLabel): Question text
+        option_buttons (list): Multiple choice buttons, reused for every question
+        answer_input (QLineEdit): Free response input
+    """
+
+    answerSubmitted = pyqtSignal(str)
+    skipRequested = pyqtSignal()
+    exitRequested = pyqtSignal()
+
+    def __init__(self, parent=None):
+        """
+        Build the dialog widgets once.
+
+        Args:
+            parent (QWidget): Parent widget
+        """
+        super().__init__(parent)
+        self.setWindowTitle("Element Quiz 🎲 (30s)")
+        self.setMinimumSize(400, 200)
+        layout = QVBoxLayout(self)
+
+        # Question display
+        self.question_label = QLabel()
+        self.question_label.setObjectName("questionLabel")
+        self.question_label.setAlignment(Qt.AlignCenter)
+        self.question_label.setWordWrap(True)
+        layout.addWidget(self.question_label)
+
+        # Multiple choice options
+        self.option_buttons = []
+        for _ in range(OPTION_COUNT):
+            btn = QPushButton()
+            btn.setObjectName("optionButton")
+            btn.clicked.connect(lambda _, b=btn: self.answerSubmitted.emit(b.text()))
+            layout.addWidget(btn)
+            self.option_buttons.append(btn)
+
+        # Free response input field
+        self.answer_input = QLineEdit()
+        self.answer_input.setObjectName("answerInput")
+        self.answer_input.returnPressed.connect(self.submit_free_answer)
+        layout.addWidget(self.answer_input)
+
+        # Control buttons
+        control_layout = QHBoxLayout()
+        self.submit_btn = QPushButton("Submit")
+        self.submit_btn.setObjectName("submitButton")
+        self.submit_btn.clicked.connect(self.submit_free_answer)
+        self.exit_btn = QPushButton("Exit Quiz")
+        self.exit_btn.setObjectName("exitButton")
+        self.exit_btn.clicked.connect(self.exitRequested)
+        self.new_btn = QPushButton("New Question")
+        self.new_btn.setObjectName("newButton")
+        self.new_btn.clicked.connect(self.skipRequested)
+        control_layout.addWidget(self.submit_btn)
+        control_layout.addWidget(self.exit_btn)
+        control_layout.addWidget(self.new_btn)
+        control_layout.addStretch()
+        layout.addLayout(control_layout)
+
+        # Enter in the answer field is handled by returnPressed alone; a default
+        # button would click as well and grade the next question's empty input
+        for btn in self.option_buttons + [self.submit_btn, self.exit_btn, self.new_btn]:
+            btn.setAutoDefault(False)
+            btn.setDefault(False)
+
+    def show_question(self, prompt, options=None):
+        """
+        Repopulate the dialog with a new question.
+
+        Args:
+            prompt (str): Question text (HTML allowed)
+            options (list): Multiple choice options, or None for free response
+        """
+        self.question_label.setText(prompt)
+        multiple_choice = options is not None
+        for btn, option in zip(self.option_buttons, list(options or []) + [None] * OPTION_COUNT):
+            btn.setText(option or "")
+            btn.setVisible(multiple_choice and option is not None)
+        self.answer_input.setVisible(not multiple_choice)
+        self.submit_btn.setVisible(not multiple_choice)
+        self.answer_input.clear()
+        if not multiple_choice:
+            self.answer_input.setFocus()
+
+    def submit_free_answer(self):
+        """Emit answerSubmitted with the free response text."""
+        self.answerSubmitted.emit(self.answer_input.text())
+
+    def reject(self):
+        """Treat Escape and closing the window as leaving the quiz."""
+        self.exitRequested.emit()
@@ -0,0 +1,394 @@
+"""
+Headless Quiz Engine
+Generates quiz questions from the element and production data and grades answers
+without any Qt dependency, so question sets can be pre-generated, served by other
+front ends, or benchmarked. All randomness comes from one seeded random.Random.
+Every valid (symbol, question type) pair and its answer payloads are precomputed
+once, so drawing a question is a constant-time choice with no retries, and
+distractors come from a precomputed similarity ranking (see similarity.py).
+"""
+
+import random
+import time
+from collections import namedtuple
+
+try:
+    from .elements_data import elements, production_methods
+    from .normalization import normalize_text
+    from .similarity import SimilarityIndex
+    from .matching import AnswerMatcher, DEFAULT_THRESHOLD
+except ImportError:
+    from elements_data import elements, production_methods
+    from normalization import normalize_text
+    from similarity import SimilarityIndex
+    from matching import AnswerMatcher, DEFAULT_THRESHOLD
+
+# One quiz question; options is None for free response
+Question = namedtuple("Question", ["prompt", "answer", "options", "type", "symbol"])
+
+# Question types
+QUESTION_TYPES = ("symbol", "atomic_number", "electron_config",
+                  "electron_config_reverse", "production", "production_reverse")
+
+# Quiz category of each family of elements_data (French names)
+FAMILY_CATEGORIES = {
+    "métal alcalin": "main_group",
+    "métal alcalino-terreux": "main_group",
+    "métal pauvre": "main_group",
+    "métalloïde": "main_group",
+    "non-métal": "main_group",
+    "chalcogène": "main_group",
+    "halogène": "main_group",
+    "gaz noble": "main_group",
+    "métal de transition": "transition",
+    "lanthanide": "rare_earth",
+    "actinide": "rare_earth",
+}
+
+# Default quiz scope: complex transition metals and rare earths are left out
+DEFAULT_CATEGORIES = ("main_group",)
+
+# Difficulty levels, from the first twenty elements up to the rare earths
+EASY, MEDIUM, HARD, EXPERT = 1, 2, 3, 4
+CATEGORY_DIFFICULTY = {"main_group": MEDIUM, "transition": HARD, "rare_earth": EXPERT}
+
+OPTION_COUNT = 4
+
+
+def production_texts(entries):
+    """
+    Flatten one element's production methods into display strings.
+
+    Args:
+        entries (dict): Method name -> string, list of strings or
+            {'reaction': ..., 'conditions': ...}
+
+    Returns:
+        list: Reaction or description strings
+    """
+    texts = []
+    for details in (entries or {}).values():
+        if isinstance(details, list):
+            texts.extend(details)
+        elif isinstance(details, dict):
+            if details.get("reaction"):
+                texts.append(details["reaction"])
+        elif details:
+            texts.append(details)
+    return texts
+
+
+def known_answers(elements_data, methods):
+    """
+    Every answer any question could expect, with the element it belongs to.
+
+    Args:
+        elements_data (dict): Element data keyed by symbol
+        methods (dict): Production methods keyed by symbol
+
+    Yields:
+        tuple: (symbol, answer text) for names, electron configurations
+        and production methods
+    """
+    for symbol, element in elements_data.items():
+        yield symbol, element["nom"]
+        if element.get("electron_config"):
+            yield symbol, element["electron_config"]
+        for text in production_texts(methods.get(symbol)):
+            yield symbol, text
+
+
+def element_category(element):
+    """
+    Quiz category of an element.
+
+    Args:
+        element (dict): Element entry from elements_data
+
+    Returns:
+        str: 'main_group', 'transition' or 'rare_earth'
+    """
+    return FAMILY_CATEGORIES[element["famille"]]
+
+
+def element_difficulty(element):
+    """
+    Difficulty level of questions about an element.
+
+    Args:
+        element (dict): Element entry from elements_data
+
+    Returns:
+        int: EASY for main group elements up to calcium, otherwise the
+        level of the element's category
+    """
+    category = element_category(element)
+    if category == "main_group" and element["num"] <= 20:
+        return EASY
+    return CATEGORY_DIFFICULTY[category]
+
+
+def answers_match(answer, expected):
+    """
+    Compare an answer with the expected one, ignoring case, accents and spaces.
+
+    Args:
+        answer (str): Submitted answer
+        expected (str): Correct answer
+
+    Returns:
+        bool: True if both normalize to the same text
+    """
+    return bool(answer) and normalize_text(answer) == normalize_text(expected)
+
+
+class QuizEngine:
+    """
+    Question generator and grader for the element quiz.
+
+    Attributes:
+        rng (random.Random): Source of every random choice
+        multiple_choice (bool): Whether questions carry answer options
+        symbols (list): Symbols questions are drawn from
+        pool (list): Every valid (symbol, question type) pair
+        payloads (dict): (symbol, question type) -> list of (prompt, answer)
+        answer_pool (dict): Question type -> distinct answers of the pool
+        similarity (SimilarityIndex): Ranked distractor elements per question
+        matcher (AnswerMatcher): Fuzzy grader over every known answer
+    """
+
+    def __init__(self, elements_data=None, methods=None, seed=None,
+                 multiple_choice=True, option_count=OPTION_COUNT,
+                 categories=DEFAULT_CATEGORIES, max_difficulty=None,
+                 question_types=QUESTION_TYPES, match_threshold=DEFAULT_THRESHOLD):
+        """
+        Precompute the question pool for the selected scope.
+
+        Args:
+            elements_data (dict): Element data (defaults to elements_data.elements)
+            methods (dict): Production methods (defaults to production_methods)
+            seed: Seed of the random generator, for reproducible question sets
+            multiple_choice (bool): Generate options for multiple choice
+            option_count (int): Number of options, including the answer
+            categories (iterable): Element categories included (see FAMILY_CATEGORIES)
+            max_difficulty (int): Highest element difficulty included, None for all
+            question_types (iterable): Question types included
+            match_threshold (float): Typos accepted in free responses, as a
+                fraction of the answer length (0 for exact matching)
+        """
+        self.elements = elements if elements_data is None else elements_data
+        self.methods = production_methods if methods is None else methods
+        self.rng = random.Random(seed)
+        self.multiple_choice = multiple_choice
+        self.option_count = option_count
+
+        categories = set(categories)
+        self.symbols = [symbol for symbol, element in self.elements.items()
+                        if element_category(element) in categories
+                        and (max_difficulty is None or element_difficulty(element) <= max_difficulty)]
+        self.build_pool(question_types)
+        if not self.pool:
+            raise ValueError("No quiz question matches the selected categories and difficulty")
+        self.matcher = AnswerMatcher(known_answers(self.elements, self.methods), match_threshold)
+
+    def build_pool(self, question_types):
+        """
+        Precompute every valid (symbol, question type) pair with its payloads.
+
+        Args:
+            question_types (iterable): Question types included
+        """
+        self.payloads = {}
+        for symbol in self.symbols:
+            for question_type in question_types:
+                payloads = self.question_payloads(symbol, question_type)
+                if payloads:
+                    self.payloads[(symbol, question_type)] = payloads
+        self.pool = list(self.payloads)
+
+        answers = {question_type: {} for question_type in question_types}
+        for (_, question_type), payloads in self.payloads.items():
+            for _, answer in payloads:
+                answers[question_type][answer] = None
+        self.answer_pool = {question_type: list(found) for question_type, found in answers.items()}
+
+        candidates = {question_type: [] for question_type in question_types}
+        for symbol, question_type in self.pool:
+            candidates[question_type].append(symbol)
+        self.similarity = SimilarityIndex(self.elements, candidates)
+
+    # ==================================================================================
+    # GENERATION
+    # ==================================================================================
+
+    def question_payloads(self, symbol, question_type):
+        """
+        All (prompt, answer) variants of one question about an element.
+
+        Args:
+            symbol (str): Chemical symbol the question is about
+            question_type (str): One of QUESTION_TYPES
+
+        Returns:
+            list: (prompt, answer) tuples, empty if the element lacks the data
+        """
+        element = self.elements[symbol]
+        if question_type == "symbol":
+            return [(f"What is the name of the element with symbol <b>{symbol}</b>?", element["nom"])]
+        if question_type == "atomic_number":
+            return [(f"What is the name of the element with atomic number <b>{element['num']}</b>?",
+                     element["nom"])]
+        if question_type == "electron_config":
+            if not element.get("electron_config"):
+                return []
+            return [(f"Which element has the electron configuration <b>{element['electron_config']}</b>?",
+                     element["nom"])]
+        if question_type == "electron_config_reverse":
+            if not element.get("electron_config"):
+                return []
+            return [(f"What is the electron configuration of <b>{element['nom']}</b>?",
+                     element["electron_config"])]
+        texts = production_texts(self.methods.get(symbol))
+        if question_type == "production":
+            return [(f"Which element is produced by the following method?<br><b>{text}</b>", element["nom"])
+                    for text in texts]
+        if question_type == "production_reverse":
+            return [(f"Which production method corresponds to <b>{element['nom']}</b>?", text)
+                    for text in texts]
+        raise ValueError(f"Unknown question type: {question_type}")
+
+    def generate(self, symbol, question_type):
+        """
+        Build one question about an element from the precomputed payloads.
+
+        Args:
+            symbol (str): Chemical symbol the question is about
+            question_type (str): One of QUESTION_TYPES
+
+        Returns:
+            Question: The question, or None if the pair is not in the pool
+        """
+        payloads = self.payloads.get((symbol, question_type))
+        if not payloads:
+            return None
+        prompt, answer = payloads[self.rng.randrange(len(payloads))]
+        options = self.options(question_type, answer, symbol) if self.multiple_choice else None
+        return Question(prompt, answer, options, question_type, symbol)
+
+    def options(self, question_type, answer, symbol):
+        """
+        Shuffled answer options: the answer plus hard, distinct distractors.
+
+        Distractors are drawn from the most similar elements of the
+        similarity index, so options are plausible and the work per question
+        is bounded by the ranking depth.
+
+        Args:
+            question_type (str): Type of the question
+            answer (str): Correct answer
+            symbol (str): Element asked about; its other valid answers (e.g.
+                its other production methods) are never used as distractors
+
+        Returns:
+            list: Up to option_count options, fewer only if the scope is too small
+        """
+        own = {a for _, a in self.payloads.get((symbol, question_type), ())}
+        own.add(answer)
+        ranked = self.similarity.nearest(question_type, symbol)
+        wanted = self.option_count - 1
+        # Shuffle the hardest few, keep the rest of the ranking as a fallback
+        hardest = min(len(ranked), 2 * wanted)
+        order = self.rng.sample(ranked[:hardest], hardest) + list(ranked[hardest:])
+
+        options = [answer]
+        for other in order:
+            if len(options) > wanted:
+                break
+            choices = [a for _, a in self.payloads[(other, question_type)] if a not in own]
+            if choices:
+                candidate = choices[self.rng.randrange(len(choices))]
+                own.add(candidate)
+                options.append(candidate)
+        self.rng.shuffle(options)
+        return options
+
+    def next_question(self):
+        """
+        Draw a random (symbol, question type) pair from the pool.
+
+        Returns:
+            Question: A new question
+        """
+        return self.generate(*self.pool[self.rng.randrange(len(self.pool))])
+
+    def questions(self, count=None):
+        """
+        Generate questions lazily.
+
+        Args:
+            count (int): Number of questions, or None for an endless stream
+
+        Yields:
+            Question: Successive random questions
+        """
+        produced = 0
+        while count is None or produced < count:
+            yield self.next_question()
+            produced += 1
+
+    # ==================================================================================
+    # GRADING
+    # ==================================================================================
+
+    def check(self, answer, expected):
+        """
+        Fuzzy-match an answer against the expected one.
+
+        Args:
+            answer (str): The submitted answer
+            expected (str): The correct answer
+
+        Returns:
+            MatchResult: Verdict with the closest known answer and its element
+        """
+        return self.matcher.match(answer, expected)
+
+    def grade(self, question, answer):
+        """
+        Check an answer to a question.
+
+        Multiple choice answers must match an option exactly (after folding);
+        free responses accept near-misses within the matcher's threshold.
+
+        Args:
+            question (Question): The question asked
+            answer (str): The submitted answer
+
+        Returns:
+            bool: True if the answer is correct
+        """
+        if question.options is not None:
+            return answers_match(answer, question.answer)
+        return self.check(answer, question.answer).correct
+
+
+def benchmark(count=50000, seed=0):
+    """
+    Measure question generation throughput.
+
+    Args:
+        count (int): Number of questions to generate
+        seed: Random seed
+
+    Returns:
+        float: Questions generated per second
+    """
+    engine = QuizEngine(seed=seed)
+    start = time.perf_counter()
+    for _ in engine.questions(count):
+        pass
+    return count / (time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    print(f"{benchmark():,.0f} questions/s")
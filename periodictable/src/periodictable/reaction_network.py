@@ -0,0 +1,285 @@
+"""
+Reaction Network
+Indexes the parsed production reactions as a bipartite species/reaction graph stored in
+CSR adjacency arrays, and answers reachability and shortest synthesis route queries by
+breadth-first search. The network for the shipped dataset is built once and cached.
+"""
+
+from collections import deque
+from functools import lru_cache
+
+import numpy as np
+
+try:
+    from .formula import parse_species, SUBSCRIPTS, STATE_SUFFIX
+    from .reactions import dataset_results, format_reaction, BALANCED, REBALANCED
+except ImportError:
+    from formula import parse_species, SUBSCRIPTS, STATE_SUFFIX
+    from reactions import dataset_results, format_reaction, BALANCED, REBALANCED
+
+# Arrows of equilibria, which are followed in both directions
+REVERSIBLE = ("⇌", "<=>")
+
+
+def species_key(species):
+    """
+    Canonical node key for a species: subscripts folded and physical state removed.
+
+    Args:
+        species (str): Species string (e.g. 'Cl₂(g)')
+
+    Returns:
+        str: Canonical key (e.g. 'Cl2')
+    """
+    return STATE_SUFFIX.sub("", species.strip()).translate(SUBSCRIPTS)
+
+
+def reaction_key(reaction, coefficients=None):
+    """
+    Canonical key of an equation, independent of the order its species are written in.
+
+    Args:
+        reaction (Reaction): Parsed reaction
+        coefficients (tuple): Coefficients in species order (defaults to the written ones)
+
+    Returns:
+        tuple: (reversible, reactants, products), each side a sorted tuple of
+        (species key, coefficient); the sides of an equilibrium are sorted too,
+        so 'A ⇌ B' and 'B ⇌ A' share a key
+    """
+    terms = reaction.reactants + reaction.products
+    if coefficients is None:
+        coefficients = [c for c, _ in terms]
+    pairs = [(species_key(species), float(c)) for (_, species), c in zip(terms, coefficients)]
+    n = len(reaction.reactants)
+    left, right = tuple(sorted(pairs[:n])), tuple(sorted(pairs[n:]))
+    reversible = reaction.arrow in REVERSIBLE
+    if reversible:
+        left, right = sorted((left, right))
+    return reversible, left, right
+
+
+def _csr(pairs, n_rows):
+    """
+    Build CSR adjacency arrays from (row, column) pairs.
+
+    Args:
+        pairs (list): Edge list of (source, target) indices
+        n_rows (int): Number of source nodes
+
+    Returns:
+        tuple: (indptr, indices) numpy arrays
+    """
+    pairs = sorted(set(pairs))
+    indptr = np.zeros(n_rows + 1, dtype=np.int32)
+    for row, _ in pairs:
+        indptr[row + 1] += 1
+    np.cumsum(indptr, out=indptr)
+    indices = np.array([col for _, col in pairs], dtype=np.int32)
+    return indptr, indices
+
+
+class ReactionNetwork:
+    """
+    Bipartite graph of species and reactions.
+
+    Edges run species -> reaction (the species is consumed) and reaction ->
+    species (the species is produced); equilibria (⇌) are added in both
+    directions. A species is reachable from another when some chain of
+    reactions consumes the first and eventually produces the second.
+    Equations listed under several elements or methods, in any species
+    order, are one reaction.
+
+    Attributes:
+        species (list): Canonical species keys, indexed by node id
+        reactions (list): Display strings of the reactions, indexed by reaction id
+        sources (list): (element symbol, method name) pairs listing each reaction
+    """
+
+    def __init__(self, results):
+        """
+        Build the network from batch balancing results.
+
+        Args:
+            results (iterable): BalanceResult objects from reactions.balance_all
+        """
+        self.species = []
+        self.reactions = []
+        self.sources = []
+        self._index = {}
+        self._reaction_ids = {}
+        consumes, produces = [], []
+
+        for result in results:
+            if result.reaction is None:
+                continue
+            reaction = result.reaction
+            balanced = result.status in (BALANCED, REBALANCED)
+            coefficients = result.coefficients if balanced else None
+            key = reaction_key(reaction, coefficients)
+            if key in self._reaction_ids:
+                self.sources[self._reaction_ids[key]].append((result.symbol, result.method))
+                continue
+            rid = self._reaction_ids[key] = len(self.reactions)
+            self.reactions.append(format_reaction(reaction, coefficients))
+            self.sources.append([(result.symbol, result.method)])
+            left = [self._node(s) for _, s in reaction.reactants]
+            right = [self._node(s) for _, s in reaction.products]
+            consumes.extend((s, rid) for s in left)
+            produces.extend((rid, s) for s in right)
+            if reaction.arrow in REVERSIBLE:
+                consumes.extend((s, rid) for s in right)
+                produces.extend((rid, s) for s in left)
+
+        n_species, n_reactions = len(self.species), len(self.reactions)
+        self.species_indptr, self.species_indices = _csr(consumes, n_species)
+        self.reaction_indptr, self.reaction_indices = _csr(produces, n_reactions)
+        # Reverse direction (species -> reactions producing it) for "made from" lookups
+        self.producer_indptr, self.producer_indices = _csr([(s, r) for r, s in produces], n_species)
+        # Python lists for the BFS inner loop, which is faster than indexing numpy scalars
+        self._consumes = self._adjacency(self.species_indptr, self.species_indices)
+        self._produces = self._adjacency(self.reaction_indptr, self.reaction_indices)
+        self._producers = self._adjacency(self.producer_indptr, self.producer_indices)
+        self._elemental = self._elemental_species()
+
+    def _node(self, species):
+        """Return the node id of a species, adding it if needed."""
+        key = species_key(species)
+        if key not in self._index:
+            self._index[key] = len(self.species)
+            self.species.append(key)
+        return self._index[key]
+
+    @staticmethod
+    def _adjacency(indptr, indices):
+        """Split CSR arrays into per-node neighbour lists."""
+        flat = indices.tolist()
+        bounds = indptr.tolist()
+        return [flat[bounds[i]:bounds[i + 1]] for i in range(len(bounds) - 1)]
+
+    def _elemental_species(self):
+        """Map element symbols to the ids of their neutral elemental forms (Na, Cl2, P4...)."""
+        elemental = {}
+        for node, key in enumerate(self.species):
+            try:
+                counts, charge = parse_species(key)
+            except ValueError:
+                continue
+            if len(counts) == 1 and charge == 0:
+                elemental.setdefault(next(iter(counts)), []).append(node)
+        return elemental
+
+    def node(self, species):
+        """
+        Look up the node id of a species.
+
+        Args:
+            species (str): Species string in any notation ('Cl₂', 'Cl2(g)')
+
+        Returns:
+            int: Node id
+
+        Raises:
+            KeyError: If the species does not occur in any reaction
+        """
+        return self._index[species_key(species)]
+
+    def reachable(self, source):
+        """
+        Return every species that can be made starting from a species.
+
+        Args:
+            source (str): Starting species
+
+        Returns:
+            set: Canonical keys of reachable species (excluding the source)
+        """
+        start = self.node(source)
+        seen = {start}
+        seen_reactions = set()
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            for rid in self._consumes[node]:
+                if rid in seen_reactions:
+                    continue
+                seen_reactions.add(rid)
+                for product in self._produces[rid]:
+                    if product not in seen:
+                        seen.add(product)
+                        queue.append(product)
+        seen.discard(start)
+        return {self.species[node] for node in seen}
+
+    def shortest_route(self, source, target):
+        """
+        Find a synthesis route with the fewest reactions between two species.
+
+        Args:
+            source (str): Starting species
+            target (str): Species to make
+
+        Returns:
+            list: Reaction display strings in order, or None if target is unreachable
+        """
+        start, goal = self.node(source), self.node(target)
+        if start == goal:
+            return []
+        parent = {start: None}  # species -> (previous species, reaction id)
+        seen_reactions = set()
+        queue = deque([start])
+        while queue:
+            node = queue.popleft()
+            for rid in self._consumes[node]:
+                if rid in seen_reactions:
+                    continue
+                seen_reactions.add(rid)
+                for product in self._produces[rid]:
+                    if product in parent:
+                        continue
+                    parent[product] = (node, rid)
+                    if product == goal:
+                        route = []
+                        while parent[product] is not None:
+                            product, rid = parent[product]
+                            route.append(self.reactions[rid])
+                        return route[::-1]
+                    queue.append(product)
+        return None
+
+    def made_from(self, symbol):
+        """
+        Return the reactions that produce an element in its elemental form.
+
+        Args:
+            symbol (str): Chemical symbol of the element
+
+        Returns:
+            list: Reaction display strings
+        """
+        rids = {rid for node in self._elemental.get(symbol, ()) for rid in self._producers[node]}
+        return [self.reactions[rid] for rid in sorted(rids)]
+
+    def used_to_make(self, symbol):
+        """
+        Return the reactions that consume an element in its elemental form.
+
+        Args:
+            symbol (str): Chemical symbol of the element
+
+        Returns:
+            list: Reaction display strings
+        """
+        rids = {rid for node in self._elemental.get(symbol, ()) for rid in self._consumes[node]}
+        return [self.reactions[rid] for rid in sorted(rids)]
+
+
+@lru_cache(maxsize=1)
+def reaction_network():
+    """
+    Return the cached reaction network for the shipped production_methods.
+
+    Returns:
+        ReactionNetwork: Network built from reactions.dataset_results()
+    """
+    return ReactionNetwork(dataset_results())
@@ -0,0 +1,329 @@
+"""
+Reaction Parsing, Balancing and Validation
+Extracts the reaction equations recorded in production_methods, parses them into
+species with stoichiometric coefficients, and balances them by computing the
+nullspace of the element/charge matrix. The whole dataset is processed in one
+cached batch run that also produces a validation report.
+"""
+
+import re
+from collections import namedtuple, Counter
+from fractions import Fraction
+from functools import lru_cache
+from math import lcm
+
+import numpy as np
+from scipy.linalg import null_space
+
+try:
+    from .elements_data import production_methods
+    from .formula import parse_species
+except ImportError:
+    from elements_data import production_methods
+    from formula import parse_species
+
+# Reaction arrows used in the dataset (→ for reactions, ⇌ for equilibria)
+ARROW = re.compile(r"\s*(→|⇌|<=>|->)\s*")
+
+# Trailing prose annotations such as ' (electrolysis)' or ' (with H₂SO₄)'
+ANNOTATION = re.compile(r"\s+\([^()]*\)\s*$")
+
+# Optional leading coefficient: integers, decimals or vulgar fractions
+TERM = re.compile(r"^(\d+(?:\.\d+)?|[½⅓¼¾])?\s*(\S.*)$")
+FRACTIONS = {"½": Fraction(1, 2), "⅓": Fraction(1, 3), "¼": Fraction(1, 4), "¾": Fraction(3, 4)}
+
+# Validation statuses
+BALANCED = "balanced"            # balanced as written
+REBALANCED = "rebalanced"        # written coefficients are wrong, a balanced form was found
+UNBALANCEABLE = "unbalanceable"  # no positive coefficients conserve atoms and charge
+AMBIGUOUS = "ambiguous"          # several independent balanced forms exist
+UNPARSED = "unparsed"            # prose or a formula that could not be parsed
+
+# A parsed equation; reactants/products are tuples of (coefficient, species) pairs
+Reaction = namedtuple("Reaction", ["reactants", "products", "arrow"])
+
+# Outcome of balancing one dataset entry
+BalanceResult = namedtuple("BalanceResult", ["symbol", "method", "source", "reaction",
+                                             "coefficients", "status", "message"])
+
+
+def iter_reaction_strings(methods=None):
+    """
+    Yield every reaction or description string stored in production_methods.
+
+    Handles the three layouts used in elements_data.py: plain strings, lists
+    of strings, and dictionaries with 'reaction' and 'conditions' keys.
+
+    Args:
+        methods (dict): Production methods mapping (defaults to production_methods)
+
+    Yields:
+        tuple: (element symbol, method name, text)
+    """
+    methods = production_methods if methods is None else methods
+    for symbol, entries in methods.items():
+        for method, details in entries.items():
+            if isinstance(details, list):
+                for item in details:
+                    yield symbol, method, item
+            elif isinstance(details, dict):
+                if details.get("reaction"):
+                    yield symbol, method, details["reaction"]
+            else:
+                yield symbol, method, details
+
+
+def _parse_term(term):
+    """
+    Split a reaction term into coefficient and species.
+
+    Args:
+        term (str): Term such as '2 H₂O', '4Li' or '½ H2(g)'
+
+    Returns:
+        tuple: (Fraction coefficient, species string)
+    """
+    match = TERM.match(term.strip())
+    if not match:
+        raise ValueError(f"Empty term in reaction: {term!r}")
+    coefficient, species = match.groups()
+    if coefficient is None:
+        value = Fraction(1)
+    elif coefficient in FRACTIONS:
+        value = FRACTIONS[coefficient]
+    else:
+        value = Fraction(coefficient)
+    return value, species.strip()
+
+
+@lru_cache(maxsize=None)
+def parse_reaction(text):
+    """
+    Parse a reaction equation, ignoring surrounding prose.
+
+    Text before a colon ('... using chlorine: 2 I⁻ + Cl₂ → ...') and trailing
+    parenthetical annotations ('(electrolysis)') are discarded.
+
+    Args:
+        text (str): Reaction text from production_methods
+
+    Returns:
+        Reaction: Parsed reaction
+
+    Raises:
+        ValueError: If the text contains no arrow or a term cannot be parsed
+    """
+    parts = ARROW.split(text)
+    if len(parts) != 3:
+        raise ValueError(f"Not a single reaction equation: {text!r}")
+    left, arrow, right = parts
+    left = left.rsplit(":", 1)[-1]
+    while ANNOTATION.search(right):
+        right = ANNOTATION.sub("", right)
+
+    def side(expression):
+        terms = [t for t in re.split(r"\s+\+\s+", expression.strip()) if t]
+        if not terms:
+            raise ValueError(f"Empty side in reaction: {text!r}")
+        parsed = tuple(_parse_term(t) for t in terms)
+        for _, species in parsed:
+            parse_species(species)  # validate early
+        return parsed
+
+    return Reaction(side(left), side(right), arrow)
+
+
+def composition_matrix(reaction):
+    """
+    Build the element/charge conservation matrix of a reaction.
+
+    Rows are elements followed by charge; columns are species, reactants
+    positive and products negative, so balanced coefficients x satisfy A x = 0.
+
+    Args:
+        reaction (Reaction): Parsed reaction
+
+    Returns:
+        tuple: (matrix as numpy array, list of row labels)
+    """
+    species = [s for _, s in reaction.reactants] + [s for _, s in reaction.products]
+    signs = [1] * len(reaction.reactants) + [-1] * len(reaction.products)
+    parsed = [parse_species(s) for s in species]
+    labels = sorted({symbol for counts, _ in parsed for symbol in counts})
+    rows = {label: i for i, label in enumerate(labels)}
+    matrix = np.zeros((len(labels) + 1, len(species)))
+    for column, ((counts, charge), sign) in enumerate(zip(parsed, signs)):
+        for symbol, n in counts.items():
+            matrix[rows[symbol], column] = sign * n
+        matrix[-1, column] = sign * charge
+    return matrix, labels + ["charge"]
+
+
+def _integer_coefficients(vector):
+    """
+    Scale a real nullspace vector to the smallest positive integer coefficients.
+
+    Args:
+        vector (numpy.ndarray): Nullspace basis vector
+
+    Returns:
+        tuple: Integer coefficients, or None if the vector has mixed signs or zeros
+    """
+    if np.all(vector < 0):
+        vector = -vector
+    if not np.all(vector > 1e-9):
+        return None
+    fractions = [Fraction(float(v / vector.min())).limit_denominator(1000) for v in vector]
+    denominator = lcm(*(f.denominator for f in fractions))
+    integers = [int(f * denominator) for f in fractions]
+    common = np.gcd.reduce(integers)
+    return tuple(int(i // common) for i in integers)
+
+
+def balance(reaction):
+    """
+    Balance a parsed reaction.
+
+    Args:
+        reaction (Reaction): Parsed reaction
+
+    Returns:
+        tuple: (integer coefficients or None, status, message)
+    """
+    matrix, labels = composition_matrix(reaction)
+    written = np.array([float(c) for c, _ in reaction.reactants + reaction.products])
+    if np.allclose(matrix @ written, 0):
+        return _integer_coefficients(written), BALANCED, ""
+
+    basis = null_space(matrix)
+    if basis.shape[1] == 0:
+        residual = matrix @ written
+        unbalanced = [label for label, r in zip(labels, residual) if abs(r) > 1e-9]
+        return None, UNBALANCEABLE, f"No balanced form conserves {', '.join(unbalanced)}"
+    if basis.shape[1] > 1:
+        return None, AMBIGUOUS, f"{basis.shape[1]} independent balanced forms"
+    coefficients = _integer_coefficients(basis[:, 0])
+    if coefficients is None:
+        return None, UNBALANCEABLE, "Balancing requires moving a species across the arrow"
+    return coefficients, REBALANCED, ""
+
+
+@lru_cache(maxsize=None)
+def balance_text(text):
+    """
+    Parse and balance one reaction string (cached by text).
+
+    Args:
+        text (str): Reaction text
+
+    Returns:
+        tuple: (Reaction or None, coefficients or None, status, message)
+    """
+    try:
+        reaction = parse_reaction(text)
+    except ValueError as e:
+        return None, None, UNPARSED, str(e)
+    coefficients, status, message = balance(reaction)
+    return reaction, coefficients, status, message
+
+
+def format_reaction(reaction, coefficients=None):
+    """
+    Render a reaction with the given (or written) coefficients.
+
+    Args:
+        reaction (Reaction): Parsed reaction
+        coefficients (tuple): Integer coefficients in species order, or None
+
+    Returns:
+        str: Equation such as '2 H₂O → 2 H₂ + O₂'
+    """
+    terms = reaction.reactants + reaction.products
+    if coefficients is None:
+        coefficients = [c for c, _ in terms]
+
+    symbols = {value: symbol for symbol, value in FRACTIONS.items()}
+
+    def coefficient(c):
+        if c in symbols:
+            return symbols[c]
+        return str(int(c)) if c == int(c) else str(float(c))
+
+    def render(pairs, coefs):
+        return " + ".join(
+            species if c == 1 else f"{coefficient(c)} {species}"
+            for (_, species), c in zip(pairs, coefs)
+        )
+
+    n = len(reaction.reactants)
+    return f"{render(reaction.reactants, coefficients[:n])} {reaction.arrow} {render(reaction.products, coefficients[n:])}"
+
+
+def balance_all(methods=None):
+    """
+    Process every reaction in the dataset in one batch.
+
+    Args:
+        methods (dict): Production methods mapping (defaults to production_methods)
+
+    Returns:
+        list: BalanceResult for every string in the dataset
+    """
+    results = []
+    for symbol, method, text in iter_reaction_strings(methods):
+        reaction, coefficients, status, message = balance_text(text)
+        results.append(BalanceResult(symbol, method, text, reaction, coefficients, status, message))
+    return results
+
+
+@lru_cache(maxsize=1)
+def dataset_results():
+    """
+    Return the cached batch results for the shipped production_methods.
+
+    Returns:
+        tuple: BalanceResult for every string in production_methods
+    """
+    return tuple(balance_all())
+
+
+def balanced_equations(symbol):
+    """
+    Return the balanced forms of the reactions recorded for an element.
+
+    Args:
+        symbol (str): Chemical symbol of the element
+
+    Returns:
+        list: Balanced equation strings
+    """
+    return [
+        format_reaction(r.reaction, r.coefficients)
+        for r in dataset_results()
+        if r.symbol == symbol and r.status in (BALANCED, REBALANCED)
+    ]
+
+
+def validation_report(results=None):
+    """
+    Summarise batch balancing results as plain text.
+
+    Args:
+        results (list): BalanceResult list (defaults to the cached dataset results)
+
+    Returns:
+        str: Report with status counts and every entry that is not balanced as written
+    """
+    results = dataset_results() if results is None else results
+    counts = Counter(r.status for r in results)
+    lines = [f"{len(results)} entries: " + ", ".join(f"{n} {status}" for status, n in sorted(counts.items()))]
+    for r in results:
+        if r.status == REBALANCED:
+            lines.append(f"[{r.symbol}/{r.method}] {r.source}\n    balanced: {format_reaction(r.reaction, r.coefficients)}")
+        elif r.status in (UNBALANCEABLE, AMBIGUOUS):
+            lines.append(f"[{r.symbol}/{r.method}] {r.source}\n    {r.status}: {r.message}")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    print(validation_report())
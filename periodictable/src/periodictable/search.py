@@ -0,0 +1,275 @@
+"""
+Full-Text Search
+Inverted index over element names, symbols, families, isotopes and every production
+method, reaction and condition string. Tokens are folded with the same rules as
+normalize_text (plus subscript/superscript folding) so 'Cl₂' matches 'cl2'. The index
+can be saved to and loaded from a JSON cache file keyed by a fingerprint of the data.
+A prefix trie over names, symbols and atomic numbers backs the type-ahead filter.
+"""
+
+import hashlib
+import json
+import math
+import os
+from collections import namedtuple, defaultdict
+
+try:
+    from .elements_data import elements, production_methods
+    from .normalization import tokenize, normalize_text
+except ImportError:
+    from elements_data import elements, production_methods
+    from normalization import tokenize, normalize_text
+
+# Relative weight of a token occurrence in each field
+FIELD_WEIGHTS = {
+    "symbol": 8.0,
+    "name": 6.0,
+    "family": 3.0,
+    "isotopes": 1.0,
+    "production": 1.0,
+}
+
+SearchHit = namedtuple("SearchHit", ["symbol", "score"])
+
+
+def element_fields(symbol):
+    """
+    Collect the searchable text of an element, grouped by field.
+
+    Args:
+        symbol (str): Chemical symbol of the element
+
+    Returns:
+        dict: Field name -> list of strings
+    """
+    element = elements[symbol]
+    production = []
+    for method, details in production_methods.get(symbol, {}).items():
+        production.append(method)
+        if isinstance(details, list):
+            production.extend(details)
+        elif isinstance(details, dict):
+            production.extend(str(v) for v in details.values())
+        else:
+            production.append(details)
+    return {
+        "symbol": [symbol],
+        "name": [element["nom"]],
+        "family": [element["famille"]],
+        "isotopes": list(element["isotopes"]),
+        "production": production,
+    }
+
+
+def data_fingerprint():
+    """
+    Hash the indexed data so stale cache files can be detected.
+
+    Returns:
+        str: Hex digest of the element and production data
+    """
+    payload = json.dumps([elements, production_methods], ensure_ascii=False, sort_keys=True)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+class SearchIndex:
+    """
+    Inverted index mapping normalised tokens to weighted element postings.
+
+    Attributes:
+        symbols (list): Indexed element symbols, indexed by document id
+        postings (dict): Token -> {document id: field-weighted term frequency}
+        fingerprint (str): Fingerprint of the data the index was built from
+    """
+
+    def __init__(self, symbols, postings, fingerprint=None):
+        """
+        Create an index from prepared postings.
+
+        Args:
+            symbols (list): Element symbols, indexed by document id
+            postings (dict): Token -> {document id: weight}
+            fingerprint (str): Data fingerprint, if known
+        """
+        self.symbols = symbols
+        self.postings = postings
+        self.fingerprint = fingerprint
+        n = len(symbols)
+        self.idf = {token: math.log(1 + n / len(docs)) for token, docs in postings.items()}
+
+    @classmethod
+    def build(cls):
+        """
+        Build the index from elements_data.
+
+        Returns:
+            SearchIndex: Freshly built index
+        """
+        symbols = list(elements)
+        postings = defaultdict(dict)
+        for doc, symbol in enumerate(symbols):
+            for field, texts in element_fields(symbol).items():
+                weight = FIELD_WEIGHTS[field]
+                for text in texts:
+                    for token in tokenize(text):
+                        postings[token][doc] = postings[token].get(doc, 0.0) + weight
+        return cls(symbols, dict(postings), data_fingerprint())
+
+    def save(self, path):
+        """
+        Write the index to a JSON cache file.
+
+        Args:
+            path (str): Cache file path
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump({"fingerprint": self.fingerprint, "symbols": self.symbols,
+                       "postings": self.postings}, f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path):
+        """
+        Read an index from a JSON cache file.
+
+        Args:
+            path (str): Cache file path
+
+        Returns:
+            SearchIndex: Loaded index
+        """
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        postings = {token: {int(doc): w for doc, w in docs.items()}
+                    for token, docs in data["postings"].items()}
+        return cls(data["symbols"], postings, data["fingerprint"])
+
+    def search(self, query, limit=None):
+        """
+        Rank elements matching every token of a query.
+
+        Args:
+            query (str): Free-text query (e.g. 'electrolysis Cl₂')
+            limit (int): Maximum number of hits, or None for all
+
+        Returns:
+            list: SearchHit tuples sorted by decreasing score
+        """
+        tokens = tokenize(query)
+        if not tokens:
+            return []
+        # Intersect rarest postings first so the candidate set shrinks fastest
+        lists = sorted((self.postings.get(t, {}) for t in set(tokens)), key=len)
+        candidates = set(lists[0])
+        for docs in lists[1:]:
+            candidates.intersection_update(docs)
+            if not candidates:
+                return []
+        scores = {
+            doc: sum(self.postings[t][doc] * self.idf[t] for t in set(tokens))
+            for doc in candidates
+        }
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [SearchHit(self.symbols[doc], score) for doc, score in ranked]
+
+
+def load_or_build_index(cache_path=None):
+    """
+    Load the index from a cache file if it is current, otherwise build it.
+
+    When a cache path is given and the file is missing or stale, the freshly
+    built index is written back to it.
+
+    Args:
+        cache_path (str): Optional cache file path
+
+    Returns:
+        SearchIndex: Ready-to-query index
+    """
+    if cache_path and os.path.exists(cache_path):
+        try:
+            index = SearchIndex.load(cache_path)
+            if index.fingerprint == data_fingerprint():
+                return index
+        except (OSError, ValueError, KeyError):
+            pass
+    index = SearchIndex.build()
+    if cache_path:
+        try:
+            index.save(cache_path)
+        except OSError:
+            pass
+    return index
+
+
+class PrefixTrie:
+    """
+    Prefix trie whose nodes store every value reachable below them.
+
+    Storing the match set on each node makes a lookup cost proportional to
+    the length of the prefix only, independent of the number of keys.
+
+    Attributes:
+        root (dict): Root node; nodes are dicts with 'children' and 'values'
+    """
+
+    def __init__(self):
+        """Create an empty trie."""
+        self.root = {"children": {}, "values": set()}
+
+    def insert(self, key, value):
+        """
+        Index a value under a key and all of its prefixes.
+
+        Args:
+            key (str): Normalised key (e.g. 'chlorine')
+            value: Value returned by lookups (e.g. 'Cl')
+        """
+        node = self.root
+        node["values"].add(value)
+        for char in key:
+            node = node["children"].setdefault(char, {"children": {}, "values": set()})
+            node["values"].add(value)
+
+    def freeze(self):
+        """Convert the value sets to frozensets so lookups can return them directly."""
+        stack = [self.root]
+        while stack:
+            node = stack.pop()
+            node["values"] = frozenset(node["values"])
+            stack.extend(node["children"].values())
+
+    def lookup(self, prefix):
+        """
+        Return every value whose key starts with a prefix.
+
+        Args:
+            prefix (str): Normalised prefix
+
+        Returns:
+            frozenset: Matching values (empty if none)
+        """
+        node = self.root
+        for char in prefix:
+            node = node["children"].get(char)
+            if node is None:
+                return frozenset()
+        return node["values"]
+
+
+def build_element_trie():
+    """
+    Build the type-ahead trie over element names, symbols and atomic numbers.
+
+    Keys are folded with normalize_text, so 'neon', 'Néon' and 'NE' all match.
+
+    Returns:
+        PrefixTrie: Frozen trie mapping prefixes to element symbols
+    """
+    trie = PrefixTrie()
+    for symbol, element in elements.items():
+        for key in (element["nom"], symbol, str(element["num"])):
+            trie.insert(normalize_text(key), symbol)
+    trie.freeze()
+    return trie
@@ -0,0 +1,706 @@
+"""
+Classroom Quiz Server
+Hosts quiz sessions for a whole class from one asyncio process using only the standard
+library. Students connect over WebSocket (RFC 6455) and are served questions by one
+shared headless QuizEngine, graded with its normalisation and fuzzy matching. Answer
+deadlines are enforced by the server, results are written to the SQLite progress
+store in batches, and a leaderboard is served as JSON over plain HTTP.
+
+Protocol (JSON text frames):
+    client  {"type": "join", "name": ..., "multiple_choice": true}
+    server  {"type": "question", "id": n, "prompt": ..., "options": [...] or null, "deadline": s}
+    client  {"type": "answer", "id": n, "answer": ...}  or  {"type": "skip", "id": n}
+    server  {"type": "result", "id": n, "correct": ..., "answer": ..., "score": ..., ...}
+    server  {"type": "finished", "score": ..., "total": ...}
+"""
+
+import argparse
+import asyncio
+import base64
+import hashlib
+import itertools
+import json
+import os
+import struct
+import time
+import uuid
+from collections import namedtuple
+
+try:
+    from .quiz_engine import QuizEngine
+    from .spaced_repetition import ProgressStore, DEFAULT_DB_PATH, PERFECT, WRONG, BLACKOUT
+    from .events import EventLog, AnswerEvent
+except ImportError:
+    from quiz_engine import QuizEngine
+    from spaced_repetition import ProgressStore, DEFAULT_DB_PATH, PERFECT, WRONG, BLACKOUT
+    from events import EventLog, AnswerEvent
+
+WEBSOCKET_GUID = "258EAFA5-E914-47DA-95CA-C5AB0DC85B11"
+OP_CONTINUATION, OP_TEXT, OP_BINARY, OP_CLOSE, OP_PING, OP_PONG = 0x0, 0x1, 0x2, 0x8, 0x9, 0xA
+
+# Largest accepted message; quiz messages are a few hundred bytes
+MAX_MESSAGE_SIZE = 64 * 1024
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+BACKLOG = 1024
+
+QUESTIONS_PER_SESSION = 10
+ANSWER_DEADLINE = 30.0
+FLUSH_INTERVAL = 2.0
+FLUSH_BATCH = 256
+LEADERBOARD_SIZE = 20
+
+# Best finished session of a student
+LeaderboardEntry = namedtuple("LeaderboardEntry", ["name", "score", "total", "finished_at"])
+
+HTTP_REASONS = {101: "Switching Protocols", 200: "OK", 400: "Bad Request", 404: "Not Found"}
+
+# ======================================================================================
+# WEBSOCKET PROTOCOL
+# ======================================================================================
+
+
+def accept_key(key):
+    """
+    Sec-WebSocket-Accept value of a handshake.
+
+    Args:
+        key (str): Client's Sec-WebSocket-Key header
+
+    Returns:
+        str: Base64 SHA-1 of the key and the protocol GUID
+    """
+    return base64.b64encode(hashlib.sha1((key + WEBSOCKET_GUID).encode()).digest()).decode()
+
+
+def apply_mask(data, key):
+    """
+    XOR a payload with a 4-byte masking key (masking and unmasking are the same).
+
+    Args:
+        data (bytes): Payload
+        key (bytes): Masking key
+
+    Returns:
+        bytes: Masked payload
+    """
+    n = len(data)
+    repeated = (key * (n // 4 + 1))[:n]
+    return (int.from_bytes(data, "big") ^ int.from_bytes(repeated, "big")).to_bytes(n, "big")
+
+
+def encode_frame(payload, opcode=OP_TEXT, mask=False):
+    """
+    Encode one final WebSocket frame.
+
+    Args:
+        payload (bytes): Frame payload
+        opcode (int): Frame opcode
+        mask (bool): Mask the payload (required for client frames)
+
+    Returns:
+        bytes: The encoded frame
+    """
+    mask_bit = 0x80 if mask else 0
+    n = len(payload)
+    header = bytearray([0x80 | opcode])
+    if n < 126:
+        header.append(mask_bit | n)
+    elif n < 1 << 16:
+        header.append(mask_bit | 126)
+        header += struct.pack("!H", n)
+    else:
+        header.append(mask_bit | 127)
+        header += struct.pack("!Q", n)
+    if mask:
+        key = os.urandom(4)
+        header += key
+        payload = apply_mask(payload, key)
+    return bytes(header) + payload
+
+
+async def read_frame(reader):
+    """
+    Read one WebSocket frame.
+
+    Args:
+        reader (asyncio.StreamReader): Connection reader
+
+    Returns:
+        tuple: (fin, opcode, unmasked payload)
+
+    Raises:
+        ValueError: If the frame exceeds MAX_MESSAGE_SIZE
+        asyncio.IncompleteReadError: If the connection closes mid-frame
+    """
+    head = await reader.readexactly(2)
+    fin, opcode = bool(head[0] & 0x80), head[0] & 0x0F
+    masked, n = head[1] & 0x80, head[1] & 0x7F
+    if n == 126:
+        n = struct.unpack("!H", await reader.readexactly(2))[0]
+    elif n == 127:
+        n = struct.unpack("!Q", await reader.readexactly(8))[0]
+    if n > MAX_MESSAGE_SIZE:
+        raise ValueError(f"WebSocket frame of {n} bytes exceeds {MAX_MESSAGE_SIZE}")
+    key = await reader.readexactly(4) if masked else None
+    payload = await reader.readexactly(n)
+    return fin, opcode, apply_mask(payload, key) if key else payload
+
+
+class WebSocket:
+    """
+    Message-level WebSocket connection (either end).
+
+    Pings are answered and fragmented messages reassembled transparently.
+    """
+
+    def __init__(self, reader, writer, mask=False):
+        """
+        Wrap an upgraded connection.
+
+        Args:
+            reader (asyncio.StreamReader): Connection reader
+            writer (asyncio.StreamWriter): Connection writer
+            mask (bool): Mask outgoing frames (True on the client side)
+        """
+        self.reader = reader
+        self.writer = writer
+        self.mask = mask
+        self.closed = False
+
+    async def send(self, text):
+        """Send a text message."""
+        self.writer.write(encode_frame(text.encode(), OP_TEXT, self.mask))
+        await self.writer.drain()
+
+    async def send_json(self, message):
+        """Send a JSON message."""
+        await self.send(json.dumps(message, ensure_ascii=False))
+
+    async def receive(self):
+        """
+        Receive the next text message.
+
+        Returns:
+            str: The message, or None once the connection is closed
+        """
+        parts = []
+        while not self.closed:
+            try:
+                fin, opcode, payload = await read_frame(self.reader)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                self.closed = True
+                return None
+            except ValueError:
+                await self.close(1009)
+                return None
+            if opcode == OP_PING:
+                self.writer.write(encode_frame(payload, OP_PONG, self.mask))
+                continue
+            if opcode == OP_PONG:
+                continue
+            if opcode == OP_CLOSE:
+                await self.close()
+                return None
+            parts.append(payload)
+            if fin:
+                return b"".join(parts).decode()
+        return None
+
+    async def receive_json(self):
+        """
+        Receive the next JSON message.
+
+        Returns:
+            dict: The decoded message, or None once the connection is closed
+
+        Raises:
+            ValueError: If the message is not a valid JSON object
+        """
+        text = await self.receive()
+        if text is None:
+            return None
+        message = json.loads(text)
+        if not isinstance(message, dict):
+            raise ValueError(f"Expected a JSON object, not {type(message).__name__}")
+        return message
+
+    async def close(self, code=1000):
+        """Send a close frame (once) and close the transport."""
+        if not self.closed:
+            self.closed = True
+            try:
+                self.writer.write(encode_frame(struct.pack("!H", code), OP_CLOSE, self.mask))
+                await self.writer.drain()
+            except ConnectionError:
+                pass
+        self.writer.close()
+
+
+async def read_request(reader):
+    """
+    Read an HTTP request line and headers.
+
+    Args:
+        reader (asyncio.StreamReader): Connection reader
+
+    Returns:
+        tuple: (method, path, headers with lower-case names)
+
+    Raises:
+        ValueError: If the request line is malformed
+    """
+    method, path, _ = (await reader.readline()).decode("latin-1").split()
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            return method, path, headers
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+
+def http_response(status, body=b"", headers=None):
+    """
+    Encode an HTTP/1.1 response.
+
+    Args:
+        status (int): Status code
+        body (bytes): Response body
+        headers (dict): Extra headers
+
+    Returns:
+        bytes: The response
+    """
+    lines = [f"HTTP/1.1 {status} {HTTP_REASONS[status]}"]
+    for name, value in (headers or {}).items():
+        lines.append(f"{name}: {value}")
+    if status != 101:
+        lines.append(f"Content-Length: {len(body)}")
+        lines.append("Connection: close")
+    return ("\r\n".join(lines) + "\r\n\r\n").encode("latin-1") + body
+
+
+async def connect(host, port, path="/ws"):
+    """
+    Open a client WebSocket connection (used by tests and load generators).
+
+    Args:
+        host (str): Server host
+        port (int): Server port
+        path (str): WebSocket endpoint
+
+    Returns:
+        WebSocket: Connected client socket
+
+    Raises:
+        ConnectionError: If the server refuses the upgrade
+    """
+    reader, writer = await asyncio.open_connection(host, port)
+    key = base64.b64encode(os.urandom(16)).decode()
+    writer.write((f"GET {path} HTTP/1.1\r\nHost: {host}:{port}\r\nUpgrade: websocket\r\n"
+                  f"Connection: Upgrade\r\nSec-WebSocket-Key: {key}\r\n"
+                  f"Sec-WebSocket-Version: 13\r\n\r\n").encode("latin-1"))
+    status = (await reader.readline()).decode("latin-1").split()
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+    if len(status) < 2 or status[1] != "101" or headers.get("sec-websocket-accept") != accept_key(key):
+        writer.close()
+        raise ConnectionError(f"WebSocket upgrade refused: {' '.join(status)}")
+    return WebSocket(reader, writer, mask=True)
+
+# ======================================================================================
+# QUIZ SERVER
+# ======================================================================================
+
+
+class QuizSession:
+    """
+    State of one connected student.
+
+    Attributes:
+        id (str): Unique session identifier
+        name (str): Student name
+        multiple_choice (bool): Whether questions carry options
+        score (int): Correct answers so far
+        asked (int): Questions asked so far
+        question (Question): Question awaiting an answer
+        deadline (float): Event loop time at which the question expires
+        steps (list): (symbol, question type, prompt, options, answer, action,
+            latency) of every question, kept for the session recorder
+    """
+
+    def __init__(self, name, multiple_choice):
+        self.id = uuid.uuid4().hex
+        self.name = name
+        self.multiple_choice = multiple_choice
+        self.score = 0
+        self.asked = 0
+        self.question = None
+        self.deadline = None
+        self.steps = []
+
+
+class QuizServer:
+    """
+    Asyncio quiz server.
+
+    Every connection runs as one coroutine on the event loop, so hundreds
+    of sessions share a single core; questions are drawn from one engine
+    built at startup.
+
+    Attributes:
+        engine (QuizEngine): Shared question generator and grader
+        store (ProgressStore): Batched result persistence
+        sessions (dict): Connection id -> QuizSession of connected students
+        leaderboard (dict): Student name -> best LeaderboardEntry
+    """
+
+    def __init__(self, engine=None, store=None, questions=QUESTIONS_PER_SESSION,
+                 deadline=ANSWER_DEADLINE, flush_interval=FLUSH_INTERVAL, recorder=None,
+                 event_log=None):
+        """
+        Configure the server.
+
+        Args:
+            engine (QuizEngine): Question source (defaults to a free response engine)
+            store (ProgressStore): Result store (defaults to an in-memory database)
+            questions (int): Questions per session
+            deadline (float): Seconds allowed per answer
+            flush_interval (float): Seconds between flushes of queued results
+            recorder: Session recorder such as loadgen.SessionLog, called as
+                recorder.write(name, multiple_choice, steps) when a session ends
+            event_log (EventLog): Log receiving every answer, skip and timeout
+        """
+        self.engine = QuizEngine(multiple_choice=False) if engine is None else engine
+        self.store = ProgressStore(":memory:", FLUSH_BATCH) if store is None else store
+        self.questions = questions
+        self.deadline = deadline
+        self.flush_interval = flush_interval
+        self.recorder = recorder
+        self.event_log = event_log
+        self.sessions = {}
+        self.leaderboard = {}
+        self.server = None
+        self._flusher = None
+        self._connections = set()
+        self._ids = itertools.count(1)
+
+    @property
+    def port(self):
+        """Port the server listens on."""
+        return self.server.sockets[0].getsockname()[1]
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """
+        Start listening (port 0 picks a free port).
+
+        Args:
+            host (str): Interface to bind
+            port (int): Port to bind
+
+        Returns:
+            int: The bound port
+        """
+        self.server = await asyncio.start_server(self.handle_connection, host, port, backlog=BACKLOG)
+        self._flusher = asyncio.create_task(self._flush_periodically())
+        return self.port
+
+    async def close(self):
+        """Stop listening, drop open connections and flush queued results."""
+        self.server.close()
+        self._flusher.cancel()
+        for task in list(self._connections):
+            task.cancel()
+        await asyncio.gather(*self._connections, self._flusher, return_exceptions=True)
+        await self.server.wait_closed()
+        self.store.flush()
+
+    async def _flush_periodically(self):
+        """Write queued results every flush_interval seconds."""
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            self.store.flush()
+
+    async def handle_connection(self, reader, writer):
+        """
+        Serve one TCP connection: an HTTP request or a WebSocket session.
+
+        Args:
+            reader (asyncio.StreamReader): Connection reader
+            writer (asyncio.StreamWriter): Connection writer
+        """
+        task = asyncio.current_task()
+        self._connections.add(task)
+        try:
+            try:
+                method, path, headers = await read_request(reader)
+            except (ValueError, ConnectionError, asyncio.IncompleteReadError):
+                writer.write(http_response(400))
+                return
+            if path == "/ws" and headers.get("upgrade", "").lower() == "websocket":
+                key = headers.get("sec-websocket-key")
+                if not key:
+                    writer.write(http_response(400))
+                    return
+                writer.write(http_response(101, headers={
+                    "Upgrade": "websocket", "Connection": "Upgrade",
+                    "Sec-WebSocket-Accept": accept_key(key)}))
+                await self.run_session(WebSocket(reader, writer))
+            elif method == "GET" and path == "/leaderboard":
+                self.write_json(writer, [entry._asdict() for entry in self.top_scores()])
+            elif method == "GET" and path == "/health":
+                self.write_json(writer, {"sessions": len(self.sessions)})
+            else:
+                writer.write(http_response(404))
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            self._connections.discard(task)
+            try:
+                await writer.drain()
+            except ConnectionError:
+                pass
+            writer.close()
+
+    @staticmethod
+    def write_json(writer, payload):
+        """Write a JSON HTTP response."""
+        writer.write(http_response(200, json.dumps(payload, ensure_ascii=False).encode(),
+                                   {"Content-Type": "application/json; charset=utf-8"}))
+
+    def top_scores(self, count=LEADERBOARD_SIZE):
+        """
+        Best sessions, highest score first.
+
+        Args:
+            count (int): Number of entries
+
+        Returns:
+            list: LeaderboardEntry records
+        """
+        return sorted(self.leaderboard.values(), key=lambda e: (-e.score, e.finished_at))[:count]
+
+    # ==================================================================================
+    # SESSIONS
+    # ==================================================================================
+
+    async def run_session(self, ws):
+        """
+        Run one student's quiz over an upgraded connection.
+
+        A background task turns incoming frames into a queue of messages, so
+        waiting for an answer can time out without cutting a frame in half.
+
+        Args:
+            ws (WebSocket): Server side of the connection
+        """
+        inbox = asyncio.Queue()
+        receiver = asyncio.create_task(self._receive(ws, inbox))
+        connection = next(self._ids)
+        session = None
+        try:
+            join = await self._next_message(inbox, asyncio.get_running_loop().time() + self.deadline)
+            if not join or join.get("type") != "join":
+                await ws.send_json({"type": "error", "message": "expected a join message"})
+                return
+            session = QuizSession(str(join.get("name") or "anonymous"),
+                                  bool(join.get("multiple_choice", True)))
+            self.sessions[connection] = session
+            while session.asked < self.questions:
+                if not await self.ask(ws, session, inbox):
+                    return
+            entry = LeaderboardEntry(session.name, session.score, session.asked, time.time())
+            best = self.leaderboard.get(session.name)
+            if best is None or entry.score > best.score:
+                self.leaderboard[session.name] = entry
+            await ws.send_json({"type": "finished", "score": session.score, "total": session.asked})
+        finally:
+            self.sessions.pop(connection, None)
+            if self.recorder is not None and session is not None and session.steps:
+                self.recorder.write(session.name, session.multiple_choice, session.steps)
+            receiver.cancel()
+            await ws.close()
+
+    async def _receive(self, ws, inbox):
+        """Queue decoded messages until the connection closes (then queue None)."""
+        try:
+            while True:
+                try:
+                    message = await ws.receive_json()
+                except ValueError:
+                    continue
+                await inbox.put(message)
+                if message is None:
+                    return
+        except ConnectionError:
+            await inbox.put(None)
+
+    @staticmethod
+    async def _next_message(inbox, deadline):
+        """
+        Next message received before a deadline.
+
+        Args:
+            inbox (asyncio.Queue): Decoded messages
+            deadline (float): Event loop time
+
+        Returns:
+            dict: The message, False on timeout, None if the connection closed
+        """
+        remaining = deadline - asyncio.get_running_loop().time()
+        if remaining <= 0:
+            return False
+        try:
+            return await asyncio.wait_for(inbox.get(), remaining)
+        except asyncio.TimeoutError:
+            return False
+
+    def next_question(self, session):
+        """
+        Draw a question for a session.
+
+        Args:
+            session (QuizSession): Student session
+
+        Returns:
+            Question: Question with options for multiple choice sessions
+        """
+        question = self.engine.next_question()
+        if session.multiple_choice and question.options is None:
+            question = question._replace(options=self.engine.options(
+                question.type, question.answer, question.symbol))
+        elif not session.multiple_choice and question.options is not None:
+            question = question._replace(options=None)
+        return question
+
+    async def ask(self, ws, session, inbox):
+        """
+        Send one question and grade the answer, a skip or the timeout.
+
+        Args:
+            ws (WebSocket): Server side of the connection
+            session (QuizSession): Student session
+            inbox (asyncio.Queue): Decoded messages
+
+        Returns:
+            bool: False if the connection closed
+        """
+        loop = asyncio.get_running_loop()
+        session.question = question = self.next_question(session)
+        session.asked += 1
+        session.deadline = loop.time() + self.deadline
+        await ws.send_json({"type": "question", "id": session.asked, "prompt": question.prompt,
+                            "options": question.options, "question_type": question.type,
+                            "deadline": self.deadline})
+        while True:
+            message = await self._next_message(inbox, session.deadline)
+            if message is None:
+                return False
+            if message is False:
+                self.record(session, False, BLACKOUT, "timeout")
+                await ws.send_json(self.result(session, False, timed_out=True))
+                return True
+            if message.get("id") != session.asked:
+                continue
+            if message.get("type") == "skip":
+                self.record(session, False, BLACKOUT, "skip")
+                await ws.send_json(self.result(session, False, skipped=True))
+                return True
+            if message.get("type") == "answer":
+                answer = str(message.get("answer") or "")
+                correct = self.engine.grade(question, answer)
+                session.score += correct
+                self.record(session, correct, PERFECT if correct else WRONG, "answer", answer)
+                await ws.send_json(self.result(session, correct))
+                return True
+
+    def record(self, session, correct, quality, action, answer=None):
+        """
+        Queue the result of the session's current question.
+
+        Args:
+            session (QuizSession): Student session
+            correct (bool): Whether the answer was correct
+            quality (int): SM-2 quality stored with the answer
+            action (str): 'answer', 'skip' or 'timeout'
+            answer (str): Submitted answer
+        """
+        question = session.question
+        now = time.time()
+        latency = min(self.deadline, self.deadline - (session.deadline - asyncio.get_running_loop().time()))
+        self.store.record_answer(session.name, question.symbol, question.type, correct, quality, now)
+        if self.event_log is not None:
+            self.event_log.log(AnswerEvent(session.id, session.name, question.symbol, question.type,
+                                           "classroom", action, correct, latency, now))
+        if self.recorder is not None:
+            session.steps.append((question.symbol, question.type, question.prompt, question.options,
+                                  answer, action, round(latency, 3)))
+
+    @staticmethod
+    def result(session, correct, timed_out=False, skipped=False):
+        """Result message of the session's current question."""
+        return {"type": "result", "id": session.asked, "correct": bool(correct),
+                "answer": session.question.answer, "score": session.score,
+                "timed_out": timed_out, "skipped": skipped}
+
+
+async def serve(host=DEFAULT_HOST, port=DEFAULT_PORT, **options):
+    """
+    Run a quiz server until cancelled.
+
+    Args:
+        host (str): Interface to bind
+        port (int): Port to bind
+        **options: QuizServer keyword arguments
+    """
+    server = QuizServer(**options)
+    await server.start(host, port)
+    print(f"Quiz server listening on ws://{host}:{server.port}/ws")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+def main():
+    """Command line entry point of the classroom server."""
+    parser = argparse.ArgumentParser(description="Classroom quiz server")
+    parser.add_argument("--host", default=DEFAULT_HOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--questions", type=int, default=QUESTIONS_PER_SESSION)
+    parser.add_argument("--deadline", type=float, default=ANSWER_DEADLINE)
+    parser.add_argument("--db", default=DEFAULT_DB_PATH, help="Progress database for results")
+    parser.add_argument("--record", metavar="LOG", help="Append every session to a replayable log")
+    parser.add_argument("--events", metavar="DB", help="Append every answer to a quiz event log")
+    args = parser.parse_args()
+    store = ProgressStore(args.db, FLUSH_BATCH)
+    event_log = EventLog(args.events) if args.events else None
+    recorder = None
+    if args.record:
+        try:
+            from .loadgen import SessionLog
+        except ImportError:
+            from loadgen import SessionLog
+        recorder = SessionLog(args.record)
+    try:
+        asyncio.run(serve(args.host, args.port, store=store, questions=args.questions,
+                          deadline=args.deadline, recorder=recorder, event_log=event_log))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        store.close()
+        if recorder is not None:
+            recorder.close()
+        if event_log is not None:
+            event_log.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""
+Element Similarity Index
+Ranks, for every element and question type, the other elements that make the hardest
+multiple choice distractors: neighbours in the `positions` grid, the same famille,
+close electron configurations (token edit distance) and production reactions that
+share species. Rankings are computed once, so picking distractors is constant time.
+"""
+
+import math
+from collections import Counter
+
+try:
+    from .elements_data import positions
+    from .normalization import fold_scripts
+    from .reactions import dataset_results
+    from .reaction_network import species_key
+except ImportError:
+    from elements_data import positions
+    from normalization import fold_scripts
+    from reactions import dataset_results
+    from reaction_network import species_key
+
+# Number of ranked candidates kept per element and question type
+RANK_DEPTH = 12
+
+# Feature weights (grid neighbour, same famille, configuration, shared species)
+SIMILARITY_WEIGHTS = {
+    "symbol": (3.0, 2.0, 0.5, 0.0),
+    "atomic_number": (3.0, 2.0, 0.5, 0.0),
+    "electron_config": (1.0, 1.0, 4.0, 0.0),
+    "electron_config_reverse": (1.0, 1.0, 4.0, 0.0),
+    "production": (1.0, 1.0, 0.0, 4.0),
+    "production_reverse": (1.0, 1.0, 0.0, 4.0),
+}
+
+
+def edit_distance(a, b, limit=None):
+    """
+    Levenshtein distance between two sequences (strings or token lists).
+
+    Uses Myers' bit-parallel algorithm: one column of the dynamic programming
+    table is packed into an integer, so the cost is a few integer operations
+    per item of b instead of a Python loop over every cell.
+
+    Args:
+        a (Sequence): First sequence (items must be hashable)
+        b (Sequence): Second sequence
+        limit (int): If given, any distance above it is reported as limit + 1
+
+    Returns:
+        int: Minimum number of insertions, deletions and substitutions
+    """
+    if limit is not None and abs(len(a) - len(b)) > limit:
+        return limit + 1
+    if not a or not b:
+        distance = len(a) or len(b)
+    else:
+        peq = {}
+        for i, item in enumerate(a):
+            peq[item] = peq.get(item, 0) | (1 << i)
+        mask = (1 << len(a)) - 1
+        high = 1 << (len(a) - 1)
+        pv, mv, distance = mask, 0, len(a)
+        for item in b:
+            eq = peq.get(item, 0)
+            xv = eq | mv
+            xh = ((((eq & pv) + pv) & mask) ^ pv) | eq
+            ph = mv | (~(xh | pv) & mask)
+            mh = pv & xh
+            if ph & high:
+                distance += 1
+            elif mh & high:
+                distance -= 1
+            ph = ((ph << 1) | 1) & mask
+            mh = (mh << 1) & mask
+            pv = mh | (~(xv | ph) & mask)
+            mv = ph & xv
+    return distance if limit is None or distance <= limit else limit + 1
+
+
+def config_tokens(config):
+    """
+    Split an electron configuration into folded subshell tokens.
+
+    Args:
+        config (str): Configuration such as '[Ne] 3s² 3p⁵'
+
+    Returns:
+        tuple: Tokens such as ('[Ne]', '3s2', '3p5')
+    """
+    return tuple(fold_scripts(config).split())
+
+
+def reaction_species(symbols=None):
+    """
+    Species taking part in each element's parsed production reactions.
+
+    Args:
+        symbols (iterable): Symbols to keep (defaults to all)
+
+    Returns:
+        dict: Symbol -> set of canonical species keys
+    """
+    species = {}
+    for result in dataset_results():
+        if result.reaction is None or (symbols is not None and result.symbol not in symbols):
+            continue
+        terms = result.reaction.reactants + result.reaction.products
+        species.setdefault(result.symbol, set()).update(species_key(s) for _, s in terms)
+    return species
+
+
+class SimilarityIndex:
+    """
+    Precomputed distractor rankings.
+
+    Attributes:
+        ranked (dict): (question type, symbol) -> tuple of other symbols, most similar first
+    """
+
+    def __init__(self, elements_data, candidates):
+        """
+        Rank the candidates of every question type for every element.
+
+        Args:
+            elements_data (dict): Element data keyed by symbol
+            candidates (dict): Question type -> symbols whose answers may be offered
+        """
+        symbols = sorted({s for group in candidates.values() for s in group},
+                         key=lambda s: elements_data[s]["num"])
+        tokens = {s: config_tokens(elements_data[s].get("electron_config", "")) for s in symbols}
+        species = reaction_species(set(symbols))
+
+        # Rare species weigh more than ubiquitous ones such as H2O
+        frequency = Counter(key for keys in species.values() for key in keys)
+        idf = {key: math.log(1 + len(species) / n) for key, n in frequency.items()}
+
+        features = {}
+        for i, a in enumerate(symbols):
+            for b in symbols[i + 1:]:
+                features[(a, b)] = features[(b, a)] = self.pair_features(
+                    elements_data[a], elements_data[b], positions.get(a), positions.get(b),
+                    tokens[a], tokens[b], species.get(a, set()), species.get(b, set()), idf)
+
+        self.ranked = {}
+        for question_type, group in candidates.items():
+            weights = SIMILARITY_WEIGHTS[question_type]
+            group = list(group)
+            for symbol in group:
+                scored = [
+                    (-sum(w * f for w, f in zip(weights, features[(symbol, other)])),
+                     abs(elements_data[symbol]["num"] - elements_data[other]["num"]), other)
+                    for other in group if other != symbol
+                ]
+                scored.sort()
+                self.ranked[(question_type, symbol)] = tuple(other for *_, other in scored[:RANK_DEPTH])
+
+    @staticmethod
+    def pair_features(a, b, pos_a, pos_b, tokens_a, tokens_b, species_a, species_b, idf):
+        """
+        Similarity features of two elements, each between 0 and 1.
+
+        Args:
+            a, b (dict): Element entries
+            pos_a, pos_b (tuple): (row, col) grid positions, or None
+            tokens_a, tokens_b (tuple): Electron configuration tokens
+            species_a, species_b (set): Species of the elements' production reactions
+            idf (dict): Species key -> inverse document frequency weight
+
+        Returns:
+            tuple: (grid neighbour, same famille, configuration similarity,
+            weighted share of reaction species)
+        """
+        neighbour = 0.0
+        if pos_a and pos_b:
+            neighbour = 1.0 / max(1, abs(pos_a[0] - pos_b[0]), abs(pos_a[1] - pos_b[1]))
+        famille = 1.0 if a["famille"] == b["famille"] else 0.0
+        longest = max(len(tokens_a), len(tokens_b)) or 1
+        config = 1.0 - edit_distance(tokens_a, tokens_b) / longest
+        union = sum(idf[k] for k in species_a | species_b)
+        shared = sum(idf[k] for k in species_a & species_b) / union if union else 0.0
+        return neighbour, famille, config, shared
+
+    def nearest(self, question_type, symbol):
+        """
+        Ranked distractor symbols for a question about an element.
+
+        Args:
+            question_type (str): Question type
+            symbol (str): Element the question is about
+
+        Returns:
+            tuple: Up to RANK_DEPTH symbols, most similar first
+        """
+        return self.ranked.get((question_type, symbol), ())
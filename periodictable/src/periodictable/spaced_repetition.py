@@ -0,0 +1,294 @@
+"""
+Spaced Repetition
+SM-2 scheduling of (element, question type) review items with per-student progress
+kept in a local SQLite database. Item states are loaded with one indexed query, due
+items are served from a heap in O(log n), and answers are written in batches inside
+a single transaction.
+"""
+
+import heapq
+import os
+import sqlite3
+import time
+from collections import deque, namedtuple
+
+# Review state of one (symbol, question type) item; interval in days, due in epoch seconds
+ItemState = namedtuple("ItemState", ["symbol", "question_type", "repetitions", "interval",
+                                     "easiness", "due", "lapses"])
+
+# SM-2 answer qualities used by the quiz
+PERFECT, CORRECT, WRONG, BLACKOUT = 5, 4, 1, 0
+
+INITIAL_EASINESS = 2.5
+MIN_EASINESS = 1.3
+DAY = 86400
+
+# Failed items come back later in the same session
+RELEARN_SECONDS = 60
+
+DEFAULT_DB_PATH = os.path.join(os.path.expanduser("~"), ".periodictable", "progress.sqlite3")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    student TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    question_type TEXT NOT NULL,
+    repetitions INTEGER NOT NULL,
+    interval REAL NOT NULL,
+    easiness REAL NOT NULL,
+    due REAL NOT NULL,
+    lapses INTEGER NOT NULL,
+    PRIMARY KEY (student, symbol, question_type)
+);
+CREATE INDEX IF NOT EXISTS items_due ON items (student, due);
+CREATE TABLE IF NOT EXISTS answers (
+    id INTEGER PRIMARY KEY,
+    student TEXT NOT NULL,
+    symbol TEXT NOT NULL,
+    question_type TEXT NOT NULL,
+    correct INTEGER NOT NULL,
+    quality INTEGER NOT NULL,
+    answered_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS answers_student ON answers (student, answered_at);
+"""
+
+
+def new_item(symbol, question_type, now):
+    """
+    State of an item that has never been reviewed.
+
+    Args:
+        symbol (str): Chemical symbol
+        question_type (str): Question type
+        now (float): Current time in epoch seconds
+
+    Returns:
+        ItemState: Item due immediately with the initial easiness
+    """
+    return ItemState(symbol, question_type, 0, 0.0, INITIAL_EASINESS, now, 0)
+
+
+def sm2_update(state, quality, now):
+    """
+    Apply one SM-2 review to an item.
+
+    Args:
+        state (ItemState): Current state
+        quality (int): Answer quality from 0 (blackout) to 5 (perfect)
+        now (float): Review time in epoch seconds
+
+    Returns:
+        ItemState: Updated state with its next due time
+    """
+    repetitions, interval, lapses = state.repetitions, state.interval, state.lapses
+    if quality < 3:
+        repetitions, interval, lapses = 0, 1.0, lapses + 1
+        due = now + RELEARN_SECONDS
+    else:
+        repetitions += 1
+        if repetitions == 1:
+            interval = 1.0
+        elif repetitions == 2:
+            interval = 6.0
+        else:
+            interval = round(interval * state.easiness, 2)
+        due = now + interval * DAY
+    miss = 5 - quality
+    easiness = max(MIN_EASINESS, state.easiness + 0.1 - miss * (0.08 + miss * 0.02))
+    return state._replace(repetitions=repetitions, interval=interval, easiness=easiness,
+                          due=due, lapses=lapses)
+
+
+class ProgressStore:
+    """
+    SQLite store of review states and answer history.
+
+    Writes are queued and flushed together once batch_size records are
+    pending, on flush(), or on close().
+    """
+
+    def __init__(self, path=DEFAULT_DB_PATH, batch_size=32):
+        """
+        Open (and create if needed) the database.
+
+        Args:
+            path (str): Database file, or ':memory:'
+            batch_size (int): Number of queued answers that triggers a flush
+        """
+        if path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.path = path
+        self.batch_size = batch_size
+        self.connection = sqlite3.connect(path)
+        if path != ":memory:":
+            self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.executescript(SCHEMA)
+        self._pending_items = {}
+        self._pending_answers = []
+
+    def load_items(self, student):
+        """
+        Load every item state of a student.
+
+        Args:
+            student (str): Student identifier
+
+        Returns:
+            list: ItemState for every item the student has answered
+        """
+        self.flush()
+        rows = self.connection.execute(
+            "SELECT symbol, question_type, repetitions, interval, easiness, due, lapses "
+            "FROM items WHERE student = ?", (student,))
+        return [ItemState(*row) for row in rows]
+
+    def due_count(self, student, now=None):
+        """
+        Number of items due for a student (uses the due-date index).
+
+        Args:
+            student (str): Student identifier
+            now (float): Time in epoch seconds (defaults to now)
+
+        Returns:
+            int: Items due at that time
+        """
+        self.flush()
+        now = time.time() if now is None else now
+        return self.connection.execute(
+            "SELECT COUNT(*) FROM items WHERE student = ? AND due <= ?", (student, now)).fetchone()[0]
+
+    def history(self, student=None):
+        """
+        Recorded answers, oldest first.
+
+        Args:
+            student (str): Only this student's answers, or None for everybody
+
+        Returns:
+            list: (student, symbol, question_type, correct, quality, answered_at) rows
+        """
+        self.flush()
+        query = "SELECT student, symbol, question_type, correct, quality, answered_at FROM answers"
+        if student is None:
+            return self.connection.execute(query + " ORDER BY id").fetchall()
+        return self.connection.execute(query + " WHERE student = ? ORDER BY id", (student,)).fetchall()
+
+    def record(self, student, state, correct, quality, answered_at):
+        """
+        Queue an answer and the item's new state.
+
+        Args:
+            student (str): Student identifier
+            state (ItemState): State after the answer
+            correct (bool): Whether the answer was correct
+            quality (int): SM-2 quality of the answer
+            answered_at (float): Answer time in epoch seconds
+        """
+        self._pending_items[(student, state.symbol, state.question_type)] = state
+        self.record_answer(student, state.symbol, state.question_type, correct, quality, answered_at)
+
+    def record_answer(self, student, symbol, question_type, correct, quality, answered_at):
+        """
+        Queue an answer to the history without rescheduling its item.
+
+        Args:
+            student (str): Student identifier
+            symbol (str): Chemical symbol
+            question_type (str): Question type
+            correct (bool): Whether the answer was correct
+            quality (int): SM-2 quality of the answer
+            answered_at (float): Answer time in epoch seconds
+        """
+        self._pending_answers.append((student, symbol, question_type,
+                                      int(bool(correct)), quality, answered_at))
+        if len(self._pending_answers) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        """Write every queued record in one transaction."""
+        if not self._pending_answers and not self._pending_items:
+            return
+        with self.connection:
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO items VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                [(student, *state) for (student, _, _), state in self._pending_items.items()])
+            self.connection.executemany(
+                "INSERT INTO answers (student, symbol, question_type, correct, quality, answered_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)", self._pending_answers)
+        self._pending_items.clear()
+        self._pending_answers.clear()
+
+    def close(self):
+        """Flush queued records and close the database."""
+        self.flush()
+        self.connection.close()
+
+
+class ReviewScheduler:
+    """
+    Serves the next review item of one student.
+
+    Known items sit in a min-heap keyed by due time; items never seen are
+    introduced in pool order, at most new_per_session per session. The
+    session ends when nothing is due and no new item may be introduced.
+    """
+
+    def __init__(self, store, student, items, new_per_session=10, clock=time.time):
+        """
+        Load the student's states and build the due heap.
+
+        Args:
+            store (ProgressStore): Progress database
+            student (str): Student identifier
+            items (iterable): Every available (symbol, question type) item
+            new_per_session (int): Maximum number of new items introduced
+            clock (callable): Returns the current time in epoch seconds
+        """
+        self.store = store
+        self.student = student
+        self.clock = clock
+        self.new_remaining = new_per_session
+        available = list(items)
+        allowed = set(available)
+        self.states = {(s.symbol, s.question_type): s for s in store.load_items(student)
+                       if (s.symbol, s.question_type) in allowed}
+        self.heap = [(s.due, key) for key, s in self.states.items()]
+        heapq.heapify(self.heap)
+        self.new_items = deque(key for key in available if key not in self.states)
+
+    def due_count(self):
+        """Number of known items due now."""
+        now = self.clock()
+        return sum(1 for due, _ in self.heap if due <= now)
+
+    def next_item(self):
+        """
+        Pop the next item to review.
+
+        Returns:
+            tuple: (symbol, question type), or None when the session is over
+        """
+        if self.heap and self.heap[0][0] <= self.clock():
+            return heapq.heappop(self.heap)[1]
+        if self.new_remaining > 0 and self.new_items:
+            self.new_remaining -= 1
+            return self.new_items.popleft()
+        return None
+
+    def record(self, item, correct, quality):
+        """
+        Apply an answer to an item and reschedule it.
+
+        Args:
+            item (tuple): (symbol, question type) returned by next_item
+            correct (bool): Whether the answer was correct
+            quality (int): SM-2 quality of the answer
+        """
+        now = self.clock()
+        state = self.states.get(item) or new_item(*item, now)
+        state = sm2_update(state, quality, now)
+        self.states[item] = state
+        heapq.heappush(self.heap, (state.due, item))
+        self.store.record(self.student, state, correct, quality, now)
@@ -0,0 +1,357 @@
+"""
+Custom-Painted Periodic Table Widget
+Draws the whole periodic table in a single paintEvent with cached family brushes instead
+of one styled QPushButton per element. Tiles are laid out from the `positions` grid,
+scale with the widget size, and are hit-tested from the same grid for clicks and hovers.
+"""
+
+from PyQt5.QtWidgets import QWidget, QSizePolicy
+from PyQt5.QtCore import Qt, QRectF, QSize, pyqtSignal
+from PyQt5.QtGui import QPainter, QColor, QBrush, QPen, QFont, QLinearGradient
+
+try:
+    from .elements_data import elements, positions, colors
+except ImportError:
+    from elements_data import elements, positions, colors
+
+# Colours for tile states that are not tied to a family
+DIMMED_COLOR = "#EEEEEE"
+DIMMED_TEXT_COLOR = "#AAAAAA"
+HIGHLIGHT_COLOR = "#FFD700"
+HOVER_COLOR = "#FFFFFF"
+MISSING_COLOR = "#D0D0D0"
+
+# Rec. 601 luma weights, to pick white text on dark heatmap tiles
+LUMA = (0.299, 0.587, 0.114)
+
+
+class PeriodicTableWidget(QWidget):
+    """
+    Single widget that paints every element tile of the periodic table.
+
+    Signals:
+        elementClicked (str): Emitted with the symbol of a clicked tile
+        elementHovered (str): Emitted with the symbol under the cursor when it changes
+
+    Attributes:
+        grid (dict): (row, col) -> element symbol, built from `positions`
+        highlighted (set): Symbols drawn with a highlight border
+        dimmed (set): Symbols drawn greyed out
+        overlay (dict): Symbol -> QColor replacing the family colour (heatmaps)
+        light_text (set): Symbols whose overlay is dark enough for white text
+    """
+
+    elementClicked = pyqtSignal(str)
+    elementHovered = pyqtSignal(str)
+
+    MIN_CELL = 24
+    PREFERRED_CELL = 40
+
+    def __init__(self, parent=None):
+        """
+        Build the tile grid and cache brushes and pens.
+
+        Args:
+            parent (QWidget): Parent widget
+        """
+        super().__init__(parent)
+        self.grid = {(row, col): symbol for symbol, (row, col) in positions.items()}
+        self.rows = max(row for row, _ in self.grid) + 1
+        self.cols = max(col for _, col in self.grid) + 1
+
+        # Brushes and pens are created once and reused for every repaint
+        self.set_family_colors(colors)
+        self.dimmed_brush = QBrush(QColor(DIMMED_COLOR))
+        self.hover_brush = QBrush(QColor(HOVER_COLOR))
+        self.border_pen = QPen(QColor("#333333"), 1)
+        self.highlight_pen = QPen(QColor(HIGHLIGHT_COLOR), 3)
+        self.text_pen = QPen(QColor("#000000"))
+        self.dimmed_text_pen = QPen(QColor(DIMMED_TEXT_COLOR))
+        self.light_text_pen = QPen(QColor("#FFFFFF"))
+
+        self.highlighted = set()
+        self.dimmed = set()
+        self.overlay = {}
+        self.light_text = set()
+        self.hovered = None
+
+        self.setMouseTracking(True)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Expanding)
+        self.setMinimumSize(self.cols * self.MIN_CELL, self.rows * self.MIN_CELL)
+
+    def sizeHint(self):
+        """Preferred size: the original 40 px tiles."""
+        return QSize(self.cols * self.PREFERRED_CELL, self.rows * self.PREFERRED_CELL)
+
+    # ==================================================================================
+    # GEOMETRY
+    # ==================================================================================
+
+    def cell_size(self):
+        """
+        Compute the tile size that fits the current widget size.
+
+        Returns:
+            float: Side length of a square tile in pixels
+        """
+        return min(self.width() / self.cols, self.height() / self.rows)
+
+    def origin(self):
+        """
+        Offset that centres the table in the widget.
+
+        Returns:
+            tuple: (x, y) of the top-left corner of the table
+        """
+        cell = self.cell_size()
+        return (self.width() - cell * self.cols) / 2, (self.height() - cell * self.rows) / 2
+
+    def cell_rect(self, symbol):
+        """
+        Rectangle occupied by an element tile.
+
+        Args:
+            symbol (str): Element symbol
+
+        Returns:
+            QRectF: Tile rectangle in widget coordinates
+        """
+        row, col = positions[symbol]
+        cell = self.cell_size()
+        x0, y0 = self.origin()
+        return QRectF(x0 + col * cell, y0 + row * cell, cell, cell)
+
+    def symbol_at(self, x, y):
+        """
+        Hit-test a widget position against the `positions` grid.
+
+        Args:
+            x (float): Horizontal position in widget coordinates
+            y (float): Vertical position in widget coordinates
+
+        Returns:
+            str: Symbol of the tile under the point, or None
+        """
+        cell = self.cell_size()
+        if cell <= 0:
+            return None
+        x0, y0 = self.origin()
+        col = int((x - x0) // cell)
+        row = int((y - y0) // cell)
+        return self.grid.get((row, col))
+
+    def update_symbols(self, symbols):
+        """
+        Schedule a repaint of only the given tiles.
+
+        Args:
+            symbols (iterable): Symbols whose tiles changed
+        """
+        for symbol in symbols:
+            if symbol in positions:
+                self.update(self.cell_rect(symbol).toAlignedRect().adjusted(-2, -2, 2, 2))
+
+    # ==================================================================================
+    # STATE
+    # ==================================================================================
+
+    def set_family_colors(self, family_colors):
+        """
+        Rebuild the cached family brushes (e.g. after a theme switch).
+
+        Args:
+            family_colors (dict): Family name -> colour string
+        """
+        self.family_brushes = {family: QBrush(QColor(color)) for family, color in family_colors.items()}
+        self.tile_brushes = {symbol: self.family_brushes[elements[symbol]["famille"]]
+                             for symbol in positions}
+        self.update()
+
+    def set_highlighted(self, symbols):
+        """
+        Replace the set of highlighted tiles, repainting only those that changed.
+
+        Args:
+            symbols (iterable): Symbols to highlight
+        """
+        symbols = set(symbols)
+        changed = self.highlighted.symmetric_difference(symbols)
+        self.highlighted = symbols
+        self.update_symbols(changed)
+
+    def set_dimmed(self, symbols):
+        """
+        Replace the set of dimmed tiles, repainting only those that changed.
+
+        Args:
+            symbols (iterable): Symbols to grey out
+        """
+        symbols = set(symbols)
+        changed = self.dimmed.symmetric_difference(symbols)
+        self.dimmed = symbols
+        self.update_symbols(changed)
+
+    def set_overlay(self, overlay):
+        """
+        Replace the per-tile fill colours (e.g. a property heatmap) in one repaint.
+
+        Args:
+            overlay (dict): Symbol -> QColor, or an empty dict to restore family colours
+        """
+        self.overlay = {symbol: QBrush(color) for symbol, color in overlay.items()}
+        self.light_text = set()
+        self.update()
+
+    def set_heatmap(self, symbols, colors, known):
+        """
+        Recolour every tile from a precomputed colour array in one repaint.
+
+        Args:
+            symbols (iterable): Symbols in the order of the arrays
+            colors (ndarray): (n, 3) uint8 RGB colours
+            known (ndarray): Boolean mask of tiles with a value; the others
+                are drawn in the 'no data' colour
+        """
+        symbols = list(symbols)
+        missing = QBrush(QColor(MISSING_COLOR))
+        self.overlay = {symbol: QBrush(QColor(*rgb)) if has_value else missing
+                        for symbol, rgb, has_value in zip(symbols, colors.tolist(), known)}
+        dark = (colors @ LUMA < 128) & known
+        self.light_text = {symbol for symbol, is_dark in zip(symbols, dark) if is_dark}
+        self.update()
+
+    # ==================================================================================
+    # EVENTS
+    # ==================================================================================
+
+    def paintEvent(self, event):
+        """
+        Paint every tile intersecting the exposed region.
+
+        Args:
+            event (QPaintEvent): Paint event carrying the exposed rectangle
+        """
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.Antialiasing, False)
+        exposed = QRectF(event.rect())
+        cell = self.cell_size()
+        font = QFont("Arial")
+        font.setBold(True)
+        font.setPixelSize(max(8, int(cell * 0.28)))
+        painter.setFont(font)
+
+        for symbol in positions:
+            rect = self.cell_rect(symbol)
+            if not rect.intersects(exposed):
+                continue
+            if symbol in self.dimmed:
+                brush = self.dimmed_brush
+            elif symbol == self.hovered:
+                brush = self.hover_brush
+            else:
+                brush = self.overlay.get(symbol, self.tile_brushes[symbol])
+            painter.setPen(self.border_pen)
+            painter.setBrush(brush)
+            painter.drawRect(rect)
+            if symbol in self.highlighted:
+                painter.setPen(self.highlight_pen)
+                painter.setBrush(Qt.NoBrush)
+                painter.drawRect(rect.adjusted(1.5, 1.5, -1.5, -1.5))
+            if symbol in self.dimmed:
+                painter.setPen(self.dimmed_text_pen)
+            elif symbol in self.light_text and symbol != self.hovered:
+                painter.setPen(self.light_text_pen)
+            else:
+                painter.setPen(self.text_pen)
+            painter.drawText(rect, Qt.AlignCenter, symbol)
+        painter.end()
+
+    def mouseMoveEvent(self, event):
+        """Track the hovered tile and repaint the two tiles involved."""
+        symbol = self.symbol_at(event.x(), event.y())
+        if symbol != self.hovered:
+            previous, self.hovered = self.hovered, symbol
+            self.update_symbols([s for s in (previous, symbol) if s])
+            if symbol:
+                self.elementHovered.emit(symbol)
+        super().mouseMoveEvent(event)
+
+    def leaveEvent(self, event):
+        """Clear the hover state when the cursor leaves the widget."""
+        if self.hovered:
+            previous, self.hovered = self.hovered, None
+            self.update_symbols([previous])
+        super().leaveEvent(event)
+
+    def mouseReleaseEvent(self, event):
+        """Emit elementClicked for a left click on a tile."""
+        if event.button() == Qt.LeftButton:
+            symbol = self.symbol_at(event.x(), event.y())
+            if symbol:
+                self.elementClicked.emit(symbol)
+        super().mouseReleaseEvent(event)
+
+
+class ColorScaleLegend(QWidget):
+    """
+    Colour bar of a heatmap: the colormap gradient between its value range.
+
+    Attributes:
+        label (str): Property name shown above the bar
+        vmin (float): Value at the left end
+        vmax (float): Value at the right end
+        stops (list): (position, QColor) colormap stops
+    """
+
+    BAR_HEIGHT = 12
+
+    def __init__(self, stops, parent=None):
+        """
+        Create the legend for a colormap.
+
+        Args:
+            stops (tuple): (position in [0, 1], (r, g, b)) colormap stops
+            parent (QWidget): Parent widget
+        """
+        super().__init__(parent)
+        self.stops = [(position, QColor(*rgb)) for position, rgb in stops]
+        self.label = ""
+        self.vmin = self.vmax = 0.0
+        self.setFixedHeight(3 * self.BAR_HEIGHT + 8)
+        self.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
+
+    def set_scale(self, label, vmin, vmax):
+        """
+        Show a new property range.
+
+        Args:
+            label (str): Property name
+            vmin (float): Smallest value
+            vmax (float): Largest value
+        """
+        self.label, self.vmin, self.vmax = label, vmin, vmax
+        self.update()
+
+    @staticmethod
+    def format_value(value):
+        """Compact tick label: integers as is, other values to three significant digits."""
+        return f"{value:.0f}" if float(value).is_integer() else f"{value:.3g}"
+
+    def paintEvent(self, event):
+        """Paint the title, the gradient bar and its end and middle values."""
+        painter = QPainter(self)
+        margin = 40
+        bar = QRectF(margin, self.BAR_HEIGHT + 4, max(1, self.width() - 2 * margin), self.BAR_HEIGHT)
+        gradient = QLinearGradient(bar.left(), 0, bar.right(), 0)
+        for position, color in self.stops:
+            gradient.setColorAt(position, color)
+        painter.setFont(QFont("Arial", 8))
+        painter.drawText(QRectF(0, 0, self.width(), self.BAR_HEIGHT + 2), Qt.AlignCenter, self.label)
+        painter.setPen(QPen(QColor("#333333"), 1))
+        painter.setBrush(QBrush(gradient))
+        painter.drawRect(bar)
+        middle = (self.vmin + self.vmax) / 2
+        for value, x in ((self.vmin, bar.left()), (middle, bar.center().x()), (self.vmax, bar.right())):
+            tick = QRectF(x - margin, bar.bottom() + 1, 2 * margin, self.BAR_HEIGHT + 2)
+            painter.drawText(tick, Qt.AlignHCenter | Qt.AlignTop, self.format_value(value))
+        painter.end()
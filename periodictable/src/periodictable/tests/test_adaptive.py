@@ -0,0 +1,122 @@
+import sys
+import os
+import time
+import unittest
+
+import numpy as np
+
+# Set up path so we can import the package modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from periodictable.adaptive import (ItemBank, AdaptiveSession, probability, prior_difficulty,
+                                    TARGET_SE, MAX_QUESTIONS)
+from periodictable.quiz_engine import QuizEngine
+from periodictable.elements_data import elements
+
+
+def synthetic_bank(size, seed=0):
+    """Bank of numbered items with normally distributed difficulties"""
+    rng = np.random.default_rng(seed)
+    return ItemBank([(str(i), "symbol") for i in range(size)], rng.normal(scale=1.5, size=size))
+
+
+def run_session(session, theta):
+    """Answer a session as a student who knows every item easier than theta"""
+    while True:
+        item = session.next_item()
+        if item is None:
+            return session
+        session.record(item, session.bank.difficulty[session.bank.index[item]] < theta)
+
+
+class TestItemBank(unittest.TestCase):
+    """Test case for item difficulties and calibration"""
+
+    def test_probability(self):
+        """Test the Rasch response curve"""
+        self.assertAlmostEqual(probability(0.0, 0.0), 0.5)
+        self.assertAlmostEqual(probability(1.0, 0.0) + probability(-1.0, 0.0), 1.0)
+        self.assertGreater(probability(2.0, 0.0), probability(1.0, 0.0))
+
+    def test_prior_difficulty(self):
+        """Test that priors order elements and question types by difficulty"""
+        self.assertLess(prior_difficulty(elements["Na"], "symbol"),
+                        prior_difficulty(elements["Na"], "electron_config_reverse"))
+        self.assertLess(prior_difficulty(elements["Na"], "symbol"),
+                        prior_difficulty(elements["U"], "symbol"))
+
+    def test_bank_from_engine(self):
+        """Test that the bank covers the engine's question pool"""
+        engine = QuizEngine(seed=0)
+        bank = ItemBank.from_engine(engine)
+        self.assertEqual(bank.items, engine.pool)
+        self.assertEqual(len(bank.difficulty), len(engine.pool))
+
+    def test_calibration_recovers_difficulty(self):
+        """Test that simulated answers recover the true item difficulties"""
+        rng = np.random.default_rng(1)
+        true_difficulty = rng.normal(size=40)
+        abilities = rng.normal(size=300)
+        bank = ItemBank([(str(i), "symbol") for i in range(40)], np.zeros(40))
+        history = []
+        for student, theta in enumerate(abilities):
+            for i in rng.choice(40, size=20, replace=False):
+                correct = rng.random() < probability(theta, true_difficulty[i])
+                history.append((f"s{student}", str(i), "symbol", int(correct), 0, 0.0))
+        bank.calibrate(history + [("s0", "unknown", "symbol", 1, 0, 0.0)])
+        self.assertEqual(bank.answers.sum(), len(history))
+        self.assertGreater(np.corrcoef(bank.difficulty, true_difficulty)[0, 1], 0.9)
+
+    def test_calibration_without_history(self):
+        """Test that unanswered items keep their prior difficulty"""
+        bank = ItemBank([("H", "symbol")], [0.5]).calibrate([])
+        self.assertEqual(bank.difficulty.tolist(), [0.5])
+
+
+class TestAdaptiveSession(unittest.TestCase):
+    """Test case for online ability estimation and item selection"""
+
+    def test_selects_most_informative_unasked(self):
+        """Test that items nearest the ability are chosen, never twice"""
+        bank = ItemBank([(str(i), "symbol") for i in range(5)], [-2.0, -1.0, 0.0, 1.0, 2.0])
+        session = AdaptiveSession(bank, top_k=1, rng=np.random.default_rng(0))
+        self.assertEqual(session.next_item(), ("2", "symbol"))
+        session.record(("2", "symbol"), True)
+        self.assertGreater(session.theta, 0.0)
+        self.assertEqual(session.next_item(), ("3", "symbol"))
+
+    def test_estimate_converges(self):
+        """Test that the estimate reaches the target precision near the true ability"""
+        bank = synthetic_bank(2000)
+        for theta in (-1.5, 0.0, 1.5):
+            session = run_session(AdaptiveSession(bank, rng=np.random.default_rng(2)), theta)
+            self.assertLessEqual(session.standard_error, TARGET_SE)
+            self.assertLess(len(session.responses), MAX_QUESTIONS)
+            self.assertLess(abs(session.theta - theta), 0.75)
+
+    def test_fewer_questions_than_random_order(self):
+        """Test that adaptive selection reaches the precision sooner than random items"""
+        bank = synthetic_bank(2000)
+        adaptive = run_session(AdaptiveSession(bank, max_questions=100,
+                                               rng=np.random.default_rng(3)), 2.0)
+        random_order = AdaptiveSession(bank, max_questions=100, rng=np.random.default_rng(3))
+        for i in np.random.default_rng(3).permutation(len(bank)):
+            if random_order.finished:
+                break
+            item = bank.items[i]
+            random_order.record(item, bank.difficulty[i] < 2.0)
+        self.assertLess(len(adaptive.responses), len(random_order.responses))
+
+    def test_selection_is_fast(self):
+        """Test that selecting from thousands of items takes well under a millisecond"""
+        bank = synthetic_bank(5000)
+        session = AdaptiveSession(bank, target_se=0.0, max_questions=50,
+                                  rng=np.random.default_rng(4))
+        start = time.perf_counter()
+        for _ in range(50):
+            session.record(session.next_item(), True)
+        self.assertLess((time.perf_counter() - start) / 50, 1e-3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,178 @@
+import sys
+import os
+import sqlite3
+import tempfile
+import time
+import unittest
+from unittest.mock import patch
+
+# Set up path so we can import the package modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from periodictable.events import (EventLog, AnswerEvent, load_events, error_rates,
+                                  element_error_rates, question_type_error_rates)
+
+
+def event(session, symbol, question_type, outcome="answer", correct=True, response_time=1.0):
+    """Build an event with fixed student and mode"""
+    return AnswerEvent(session, "ada", symbol, question_type, "standard", outcome, correct,
+                       response_time, time.time())
+
+
+class TestEventLog(unittest.TestCase):
+    """Test case for the append-only event log"""
+
+    def setUp(self):
+        """Create a log in a temporary directory"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "events.sqlite3")
+
+    def tearDown(self):
+        """Remove the temporary directory"""
+        self.tmpdir.cleanup()
+
+    def count(self):
+        """Events visible to another connection"""
+        with sqlite3.connect(self.path) as connection:
+            return connection.execute("SELECT COUNT(*) FROM events").fetchone()[0]
+
+    def test_batched_writes(self):
+        """Test that events are written once a batch is full or on flush"""
+        log = EventLog(self.path, batch_size=10, flush_interval=60)
+        for i in range(25):
+            log.log(event("s1", "Na", "symbol"))
+        time.sleep(0.2)
+        self.assertEqual(self.count(), 20)
+        log.flush()
+        self.assertEqual(self.count(), 25)
+        log.close()
+        self.assertEqual(log.written, 25)
+
+    def test_idle_flush(self):
+        """Test that pending events are written after the flush interval"""
+        log = EventLog(self.path, batch_size=100, flush_interval=0.05)
+        log.log(event("s1", "Na", "symbol"))
+        time.sleep(0.5)
+        self.assertEqual(self.count(), 1)
+        log.close()
+
+    def test_append_only(self):
+        """Test that events cannot be modified or deleted"""
+        log = EventLog(self.path)
+        log.log(event("s1", "Na", "symbol"))
+        log.close()
+        with sqlite3.connect(self.path) as connection:
+            with self.assertRaises(sqlite3.DatabaseError):
+                connection.execute("UPDATE events SET correct = 0")
+            with self.assertRaises(sqlite3.DatabaseError):
+                connection.execute("DELETE FROM events")
+
+    def test_logging_does_not_block(self):
+        """Test that queuing thousands of events is quick"""
+        log = EventLog(self.path)
+        start = time.perf_counter()
+        for i in range(5000):
+            log.log(event(f"s{i % 50}", "Na", "symbol"))
+        self.assertLess(time.perf_counter() - start, 0.5)
+        log.close()
+        self.assertEqual(self.count(), 5000)
+
+
+    def test_unopenable_path(self):
+        """Test that a database that cannot be opened raises instead of hanging"""
+        with self.assertRaises(sqlite3.Error):
+            EventLog(self.tmpdir.name)
+
+    def test_failed_write_reported(self):
+        """Test that a failing batch is reported once and the writer keeps going"""
+        log = EventLog(self.path, flush_interval=60)
+        write = EventLog._write
+        failures = iter([sqlite3.OperationalError("database is locked")])
+
+        def flaky_write(self, connection, events):
+            error = next(failures, None)
+            if error is not None:
+                raise error
+            write(self, connection, events)
+
+        with patch.object(EventLog, '_write', flaky_write):
+            log.log(event("s1", "Na", "symbol"))
+            log.log(event("s1", "Cl", "symbol"))
+            with self.assertRaises(sqlite3.OperationalError):
+                log.flush()
+            log.log(event("s1", "K", "symbol"))
+            log.flush()
+        log.close()
+        self.assertEqual((log.written, log.lost), (1, 2))
+        self.assertEqual(self.count(), 1)
+
+    def test_dead_writer_does_not_block(self):
+        """Test that flush and close return and report lost events if the writer died"""
+        log = EventLog(self.path, flush_interval=60)
+        with patch.object(EventLog, '_write', side_effect=RuntimeError("writer bug")):
+            log.log(event("s1", "Na", "symbol"))
+            with self.assertRaises(RuntimeError):
+                log.flush()
+        log.log(event("s1", "Cl", "symbol"))
+        with self.assertRaises(RuntimeError):
+            log.close()
+        self.assertEqual(log.lost, 2)
+
+
+class TestEventReports(unittest.TestCase):
+    """Test case for the pandas error rate reports"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Log a small known set of events"""
+        cls.tmpdir = tempfile.TemporaryDirectory()
+        cls.path = os.path.join(cls.tmpdir.name, "events.sqlite3")
+        log = EventLog(cls.path)
+        for e in [event("s1", "Na", "symbol"),
+                  event("s1", "Na", "electron_config", correct=False),
+                  event("s1", "Cl", "symbol", "skip", False, 3.0),
+                  event("s2", "Na", "symbol", correct=False),
+                  event("s2", "Cl", "symbol", "timeout", False, 30.0),
+                  event("s2", "Cl", "production")]:
+            log.log(e)
+        log.close()
+        cls.events = load_events(cls.path)
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the temporary directory"""
+        cls.tmpdir.cleanup()
+
+    def test_load_events(self):
+        """Test column types of the loaded log"""
+        self.assertEqual(len(self.events), 6)
+        self.assertEqual(self.events["correct"].dtype, bool)
+        self.assertEqual(str(self.events["symbol"].dtype), "category")
+        self.assertEqual(len(load_events(self.path, since=time.time() + 60)), 0)
+
+    def test_element_error_rates(self):
+        """Test per-element counts and error rates"""
+        table = element_error_rates(self.events)
+        self.assertEqual(list(table.index), ["Cl", "Na"])
+        self.assertEqual(table.loc["Cl", "attempts"], 3)
+        self.assertEqual(table.loc["Cl", "timeouts"], 1)
+        self.assertEqual(table.loc["Cl", "skips"], 1)
+        self.assertAlmostEqual(table.loc["Cl", "error_rate"], 2 / 3)
+        self.assertAlmostEqual(table.loc["Na", "error_rate"], 2 / 3)
+        self.assertEqual(table.loc["Na", "sessions"], 2)
+
+    def test_question_type_error_rates(self):
+        """Test per-question-type error rates and response times"""
+        table = question_type_error_rates(self.events)
+        self.assertEqual(table.loc["electron_config", "error_rate"], 1.0)
+        self.assertEqual(table.loc["production", "error_rate"], 0.0)
+        self.assertAlmostEqual(table.loc["symbol", "mean_response_time"], 35.0 / 4)
+
+    def test_multi_column_groups(self):
+        """Test grouping by several columns at once"""
+        table = error_rates(self.events, ["symbol", "question_type"])
+        self.assertEqual(table.loc[("Cl", "symbol"), "attempts"], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
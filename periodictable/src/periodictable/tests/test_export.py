@@ -0,0 +1,118 @@
+import sys
+import os
+import io
+import csv
+import json
+import tempfile
+import time
+import unittest
+import xml.etree.ElementTree as ET
+
+# Set up path so we can import the package modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from periodictable.export import (BankItem, iter_bank, write_jsonl, write_csv, write_moodle_xml,
+                                  export, plain_text, ALL_CATEGORIES)
+from periodictable.quiz_engine import QuizEngine
+
+
+class TestQuestionBank(unittest.TestCase):
+    """Test case for the streamed question bank"""
+
+    def test_every_payload_is_exported(self):
+        """Test that the bank holds one question per payload of the full engine"""
+        engine = QuizEngine(seed=0, categories=ALL_CATEGORIES)
+        expected = sum(len(payloads) for payloads in engine.payloads.values())
+        items = list(iter_bank())
+        self.assertEqual(len(items), expected)
+        self.assertEqual(len({item.id for item in items}), expected)
+
+    def test_options_contain_answer(self):
+        """Test that multiple choice options hold the answer once"""
+        for item in iter_bank(categories=("main_group",)):
+            self.assertEqual(item.options.count(item.answer), 1)
+            self.assertEqual(len(set(item.options)), len(item.options))
+
+    def test_seeded_output(self):
+        """Test that a seed always gives the same bank"""
+        first = list(iter_bank(seed=3, categories=("main_group",)))
+        self.assertEqual(first, list(iter_bank(seed=3, categories=("main_group",))))
+        self.assertNotEqual(first, list(iter_bank(seed=4, categories=("main_group",))))
+
+    def test_free_response(self):
+        """Test that free response banks have no options"""
+        items = list(iter_bank(multiple_choice=False, question_types=("symbol",)))
+        self.assertTrue(items)
+        self.assertTrue(all(item.options is None for item in items))
+
+    def test_is_a_generator(self):
+        """Test that questions are produced lazily"""
+        bank = iter_bank()
+        self.assertIsInstance(next(bank), BankItem)
+
+    def test_full_export_time(self):
+        """Test that the full bank exports well under a second"""
+        start = time.perf_counter()
+        write_jsonl(iter_bank(), io.StringIO())
+        self.assertLess(time.perf_counter() - start, 1.0)
+
+
+class TestWriters(unittest.TestCase):
+    """Test case for the JSON lines, CSV and Moodle XML writers"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.items = list(iter_bank(categories=("main_group",), question_types=("symbol", "production")))
+
+    def test_jsonl(self):
+        """Test that each line is one question"""
+        stream = io.StringIO()
+        self.assertEqual(write_jsonl(self.items, stream), len(self.items))
+        rows = [json.loads(line) for line in stream.getvalue().splitlines()]
+        self.assertEqual(rows[0], self.items[0]._asdict())
+
+    def test_csv(self):
+        """Test that rows read back with plain text prompts"""
+        stream = io.StringIO(newline="")
+        write_csv(self.items, stream)
+        stream.seek(0)
+        rows = list(csv.DictReader(stream))
+        self.assertEqual(len(rows), len(self.items))
+        self.assertEqual(rows[0]["prompt"], plain_text(self.items[0].prompt))
+        self.assertNotIn("<b>", rows[0]["prompt"])
+        self.assertIn(rows[0]["answer"], [rows[0][f"option_{i}"] for i in range(1, 5)])
+
+    def test_moodle_xml(self):
+        """Test that the quiz parses with one category per question type"""
+        stream = io.StringIO()
+        write_moodle_xml(self.items, stream)
+        quiz = ET.fromstring(stream.getvalue().encode("utf-8"))
+        questions = quiz.findall("question")
+        self.assertEqual(sum(q.get("type") == "category" for q in questions), 2)
+        multichoice = [q for q in questions if q.get("type") == "multichoice"]
+        self.assertEqual(len(multichoice), len(self.items))
+        first = multichoice[0]
+        self.assertEqual(first.find("questiontext/text").text, self.items[0].prompt)
+        right = [a.find("text").text for a in first.findall("answer") if a.get("fraction") == "100"]
+        self.assertEqual(right, [self.items[0].answer])
+
+    def test_moodle_short_answer(self):
+        """Test that free response questions become short answer questions"""
+        stream = io.StringIO()
+        write_moodle_xml(iter_bank(multiple_choice=False, question_types=("symbol",)), stream)
+        quiz = ET.fromstring(stream.getvalue().encode("utf-8"))
+        self.assertTrue(all(q.get("type") in ("category", "shortanswer") for q in quiz))
+
+    def test_export_by_extension(self):
+        """Test that the format follows the file extension"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "bank.csv")
+            count = export(path, categories=("main_group",), question_types=("symbol",))
+            with open(path, encoding="utf-8") as f:
+                self.assertEqual(len(f.read().splitlines()), count + 1)
+            with self.assertRaises(ValueError):
+                export(os.path.join(tmpdir, "bank.txt"))
+
+
+if __name__ == '__main__':
+    unittest.main()
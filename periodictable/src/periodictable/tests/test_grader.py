@@ -0,0 +1,124 @@
+import sys
+import os
+import csv
+import tempfile
+import unittest
+from concurrent.futures import ProcessPoolExecutor
+from unittest.mock import patch
+
+# Set up path so we can import the package modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from periodictable.grader import (KeyEntry, key_from_bank, load_key, read_chunks, grade,
+                                  grade_chunk, write_table, POOL_MIN_BYTES)
+from periodictable.export import export
+
+KEY = {
+    "q1": KeyEntry("Na", "symbol", "Sodium", "sodium"),
+    "q2": KeyEntry("O", "electron_config", "1s² 2s² 2p⁴", "1s22s22p4"),
+}
+
+ROWS = [
+    ("ada", "q1", "  SODIUM "),
+    ("ada", "q2", "1s2 2s2 2p4"),
+    ("bob", "q1", "Potassium"),
+    ("bob", "q2", ""),
+    ("cy", "q1", "Sódium"),
+    ("cy", "q3", "Iron"),
+]
+
+
+def write_sheet(path, rows, header=("student", "question", "answer")):
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        writer.writerows(rows)
+
+
+class TestGrader(unittest.TestCase):
+    """Test case for the bulk answer grader"""
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.sheet = os.path.join(self.tmpdir.name, "sheet.csv")
+        write_sheet(self.sheet, ROWS)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_normalised_matching(self):
+        """Test that case, accents, spaces and superscripts are ignored"""
+        students, items, unknown = grade_chunk(ROWS, KEY)
+        self.assertEqual(students["ada"], [2, 2, 0])
+        self.assertEqual(students["bob"], [2, 0, 1])
+        self.assertEqual(students["cy"], [1, 1, 0])
+        self.assertEqual(items["q1"][:3], [3, 2, 0])
+        self.assertEqual(unknown, {"q3": 1})
+
+    def test_report(self):
+        """Test per-student scores and per-item statistics"""
+        report = grade([self.sheet], KEY, workers=1)
+        self.assertEqual(report.rows, 5)
+        self.assertEqual([s.student for s in report.students], ["ada", "bob", "cy"])
+        self.assertEqual(report.students[1].score, 0.0)
+        q1 = report.items[0]
+        self.assertEqual((q1.id, q1.attempts, q1.correct), ("q1", 3, 2))
+        self.assertAlmostEqual(q1.facility, 2 / 3)
+        self.assertEqual(q1.common_wrong, "Potassium (1)")
+        self.assertEqual(report.items[1].blank, 1)
+
+    def test_process_pool_matches_in_process(self):
+        """Test that chunks graded across processes merge to the same report"""
+        rows = ROWS * 50
+        write_sheet(self.sheet, rows)
+        serial = grade([self.sheet], KEY, workers=1, chunk_size=7)
+        parallel = grade([self.sheet, self.sheet], KEY, workers=2, chunk_size=7)
+        self.assertEqual(parallel.rows, 2 * serial.rows)
+        self.assertEqual([s.correct for s in parallel.students],
+                         [2 * s.correct for s in serial.students])
+        self.assertEqual(parallel.unknown["q3"], 100)
+
+    def test_default_workers(self):
+        """Test that only sheets over the size threshold are graded in a process pool"""
+        with patch('periodictable.grader.ProcessPoolExecutor', wraps=ProcessPoolExecutor) as mock_pool:
+            self.assertEqual(grade([self.sheet], KEY).rows, 5)
+            mock_pool.assert_not_called()
+            with patch('os.path.getsize', return_value=POOL_MIN_BYTES), \
+                 patch('os.cpu_count', return_value=2):
+                self.assertEqual(grade(iter([self.sheet]), KEY).rows, 5)
+            self.assertEqual(mock_pool.call_args[0][0], 2)
+
+    def test_chunks(self):
+        """Test that sheets are read in bounded chunks, columns in any order"""
+        write_sheet(self.sheet, [(a, s, q) for s, q, a in ROWS], header=("answer", "student", "question"))
+        chunks = list(read_chunks([self.sheet], chunk_size=4))
+        self.assertEqual([len(chunk) for chunk in chunks], [4, 2])
+        self.assertEqual(chunks[0][0], ROWS[0])
+
+    def test_missing_column(self):
+        """Test that sheets without the required columns are rejected"""
+        write_sheet(self.sheet, ROWS, header=("student", "item", "answer"))
+        with self.assertRaises(ValueError):
+            list(read_chunks([self.sheet]))
+
+    def test_exported_key(self):
+        """Test that a key exported as JSON lines or CSV matches the bank"""
+        bank = key_from_bank(categories=("main_group",), question_types=("symbol",))
+        for name in ("bank.jsonl", "bank.csv"):
+            path = os.path.join(self.tmpdir.name, name)
+            export(path, categories=("main_group",), question_types=("symbol",))
+            self.assertEqual(load_key(path), bank)
+
+    def test_write_table(self):
+        """Test that records are written with their field names as header"""
+        report = grade([self.sheet], KEY, workers=1)
+        path = os.path.join(self.tmpdir.name, "scores.csv")
+        write_table(report.students, path)
+        with open(path, encoding="utf-8", newline="") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(rows[0]["student"], "ada")
+        self.assertEqual(float(rows[0]["score"]), 1.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import sys
+import os
+import tempfile
+import time
+import unittest
+
+import numpy as np
+
+# Set up path so we can import the package modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from periodictable.heatmap import (SYMBOLS, COLORMAP, PROPERTIES, colormap, make_heatmap,
+                                   full_configuration, slater_zeff, property_heatmap)
+from periodictable.events import EventLog, AnswerEvent
+from periodictable.elements_data import elements
+
+
+class TestColormap(unittest.TestCase):
+    """Test case for the vectorized colormap"""
+
+    def test_end_and_middle_stops(self):
+        """Test that the range ends and middle map to the stops"""
+        colors = colormap(np.array([0.0, 5.0, 10.0]))
+        self.assertEqual(colors.dtype, np.uint8)
+        self.assertEqual(colors[0].tolist(), list(COLORMAP[0][1]))
+        self.assertEqual(colors[1].tolist(), list(COLORMAP[2][1]))
+        self.assertEqual(colors[2].tolist(), list(COLORMAP[-1][1]))
+
+    def test_missing_and_constant_values(self):
+        """Test NaN rows, constant properties and clipping to an explicit range"""
+        colors = colormap(np.array([np.nan, 3.0, 3.0]))
+        self.assertEqual(colors[0].tolist(), [0, 0, 0])
+        self.assertEqual(colors[1].tolist(), list(COLORMAP[0][1]))
+        self.assertEqual(colormap(np.array([20.0]), 0, 10)[0].tolist(), list(COLORMAP[-1][1]))
+        self.assertEqual(colormap(np.full(3, np.nan)).shape, (3, 3))
+
+    def test_make_heatmap(self):
+        """Test that the range ignores missing values"""
+        heatmap = make_heatmap("x", "X", [np.nan, 1.0, 4.0])
+        self.assertEqual((heatmap.vmin, heatmap.vmax), (1.0, 4.0))
+        self.assertEqual(heatmap.known.tolist(), [False, True, True])
+
+
+class TestProperties(unittest.TestCase):
+    """Test case for the element properties"""
+
+    def test_full_configuration(self):
+        """Test that noble gas cores expand to every electron"""
+        for symbol in SYMBOLS:
+            electrons = sum(count for _, _, count in full_configuration(symbol))
+            self.assertEqual(electrons, elements[symbol]["num"], symbol)
+
+    def test_slater_zeff(self):
+        """Test Slater's rules against textbook values"""
+        expected = {"H": 1.0, "He": 1.7, "C": 3.25, "Na": 2.2, "Cl": 6.1, "K": 2.2, "Fe": 3.75, "Zn": 4.35}
+        for symbol, zeff in expected.items():
+            self.assertAlmostEqual(slater_zeff(symbol), zeff, places=6, msg=symbol)
+
+    def test_every_property(self):
+        """Test that each property covers every tile, fast enough for instant switching"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            missing = os.path.join(tmpdir, "none.sqlite3")
+            for name in PROPERTIES:
+                start = time.perf_counter()
+                heatmap = property_heatmap(name, missing)
+                self.assertLess(time.perf_counter() - start, 0.1)
+                self.assertEqual(heatmap.colors.shape, (len(SYMBOLS), 3))
+            self.assertFalse(property_heatmap("error_rate", missing).known.any())
+            with self.assertRaises(ValueError):
+                property_heatmap("density")
+
+    def test_quiz_error_rates(self):
+        """Test that error rates come from the event log"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "events.sqlite3")
+            log = EventLog(path)
+            for symbol, correct in (("Na", True), ("Na", False), ("Cl", False)):
+                log.log(AnswerEvent("s", "ada", symbol, "symbol", "standard", "answer", correct, 2.0, 0.0))
+            log.close()
+            heatmap = property_heatmap("error_rate", path)
+        rates = dict(zip(SYMBOLS, heatmap.values))
+        self.assertEqual((rates["Na"], rates["Cl"]), (0.5, 1.0))
+        self.assertEqual(int(heatmap.known.sum()), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,74 @@
+import sys
+import os
+import unittest
+
+import numpy as np
+
+# Set up path so we can import the package modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from periodictable.elements_data import elements
+from periodictable.formula import parse_species, parse_formula
+from periodictable.isotopes import isotope_table, natural_isotopes, isotope_distribution
+
+
+class TestFormula(unittest.TestCase):
+    """Test case for the formula parser"""
+
+    def test_subscripts_and_groups(self):
+        """Test subscripts, parentheses and adducts"""
+        self.assertEqual(parse_formula("H₂O"), {"H": 2, "O": 1})
+        self.assertEqual(parse_formula("Ca(OH)₂"), {"Ca": 1, "O": 2, "H": 2})
+        self.assertEqual(parse_formula("(NH₄)₂Cr₂O₇"), {"N": 2, "H": 8, "Cr": 2, "O": 7})
+        self.assertEqual(parse_formula("CuSO4·5H2O"), {"Cu": 1, "S": 1, "O": 9, "H": 10})
+
+    def test_charges_and_states(self):
+        """Test charge suffixes, states and the electron"""
+        self.assertEqual(parse_species("Ca²⁺"), ({"Ca": 1}, 2))
+        self.assertEqual(parse_species("OH⁻"), ({"O": 1, "H": 1}, -1))
+        self.assertEqual(parse_species("H2(g)"), ({"H": 2}, 0))
+        self.assertEqual(parse_species("e⁻"), ({}, -1))
+
+    def test_unknown_symbol(self):
+        """Test that unknown symbols are rejected"""
+        with self.assertRaises(ValueError):
+            parse_formula("Xx2")
+
+
+class TestIsotopes(unittest.TestCase):
+    """Test case for the isotope table and pattern calculation"""
+
+    def test_display_strings_preserved(self):
+        """Test that every isotope listed in elements keeps its display string"""
+        for symbol, element in elements.items():
+            displays = [iso.display for iso in isotope_table[symbol]]
+            for display in element["isotopes"]:
+                self.assertIn(display, displays)
+
+    def test_natural_abundances_sum_to_one(self):
+        """Test that natural abundances are normalised"""
+        for symbol in ("H", "C", "Cl", "Sn", "U"):
+            total = sum(iso.abundance for iso in natural_isotopes(symbol))
+            self.assertAlmostEqual(total, 1.0, places=4)
+
+    def test_chlorine_pattern(self):
+        """Test the classic Cl₂ 9:6:1 pattern"""
+        masses, abundances = isotope_distribution("Cl2")
+        self.assertEqual(len(masses), 3)
+        np.testing.assert_allclose(abundances, [0.758 ** 2, 2 * 0.758 * 0.242, 0.242 ** 2], rtol=1e-9)
+        self.assertAlmostEqual(masses[0], 2 * 34.96885269, places=6)
+
+    def test_large_molecule(self):
+        """Test that a protein-sized formula gives a normalised, sorted pattern"""
+        masses, abundances = isotope_distribution("C2000H3000N500O600S20", threshold=1e-12)
+        self.assertAlmostEqual(abundances.sum(), 1.0, places=6)
+        self.assertTrue(np.all(np.diff(masses) > 0))
+
+    def test_synthetic_element(self):
+        """Test that elements without natural isotopes are rejected"""
+        with self.assertRaises(ValueError):
+            isotope_distribution("Tc")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import sys
+import os
+import tempfile
+import unittest
+
+# Set up path so we can import the package modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from periodictable.loadgen import (Step, SessionScript, SessionLog, synthesize, save_sessions,
+                                   load_sessions, run_load, make_report, format_report,
+                                   EngineTarget, ServerTarget)
+from periodictable.server import QuizServer
+from periodictable.quiz_engine import QuizEngine
+
+ENGINE = QuizEngine(seed=0, multiple_choice=False)
+
+
+class TestSessionLogs(unittest.TestCase):
+    """Test case for synthetic sessions and session logs"""
+
+    def test_synthesis_is_seeded(self):
+        """Test that a seed always gives the same sessions"""
+        self.assertEqual(synthesize(20, seed=1), synthesize(20, seed=1))
+        self.assertNotEqual(synthesize(20, seed=1), synthesize(20, seed=2))
+
+    def test_synthesis_rates(self):
+        """Test the mix of answers, skips and timeouts"""
+        steps = [step for script in synthesize(200, questions=10, seed=3) for step in script.steps]
+        actions = [step.action for step in steps]
+        self.assertAlmostEqual(actions.count("skip") / len(steps), 0.05, delta=0.02)
+        self.assertAlmostEqual(actions.count("timeout") / len(steps), 0.03, delta=0.02)
+        self.assertTrue(all(step.latency >= 0 for step in steps))
+
+    def test_round_trip(self):
+        """Test that plain and gzip logs read back identically"""
+        scripts = synthesize(5, seed=4) + [SessionScript("ada", False, [
+            Step("Na", "symbol", "What is <b>Na</b>?", None, "Sodium", "answer", 2.5)])]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name in ("log.jsonl", "log.jsonl.gz"):
+                path = os.path.join(tmpdir, name)
+                self.assertEqual(save_sessions(path, scripts), 6)
+                self.assertEqual(list(load_sessions(path)), scripts)
+
+    def test_report(self):
+        """Test percentiles and throughput of a report"""
+        report = make_report([0.001 * i for i in range(1, 101)], 2.0, sessions=10, timeouts=4, errors=1)
+        self.assertEqual(report.questions, 104)
+        self.assertAlmostEqual(report.throughput, 52.0)
+        self.assertLessEqual(report.p50, report.p90)
+        self.assertLessEqual(report.p90, report.p99)
+        self.assertAlmostEqual(report.max, 0.1)
+        self.assertIn("p99", format_report(report))
+
+
+class TestLoadRuns(unittest.IsolatedAsyncioTestCase):
+    """Test case for load runs in-process and against a local server"""
+
+    async def test_engine_target(self):
+        """Test a synthetic run against the in-process engine"""
+        scripts = synthesize(50, questions=5, seed=5)
+        report = await run_load(scripts, EngineTarget(ENGINE), concurrency=10)
+        self.assertEqual((report.sessions, report.errors, report.questions), (50, 0, 250))
+        self.assertGreater(report.throughput, 0)
+
+    async def test_record_and_replay_against_server(self):
+        """Test recording sessions on a server, then replaying the log"""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, "sessions.jsonl.gz")
+            recorder = SessionLog(path)
+            server = QuizServer(ENGINE, questions=4, deadline=0.2, flush_interval=0.05,
+                                recorder=recorder)
+            port = await server.start("127.0.0.1", 0)
+            try:
+                scripts = synthesize(30, questions=4, seed=6, timeout_rate=0.1)
+                report = await run_load(scripts, ServerTarget("127.0.0.1", port), concurrency=15)
+            finally:
+                await server.close()
+                recorder.close()
+            self.assertEqual((report.sessions, report.errors, report.questions), (30, 0, 120))
+            self.assertEqual(report.timeouts, sum(s.action == "timeout" for sc in scripts for s in sc.steps))
+
+            recorded = list(load_sessions(path))
+            self.assertEqual(sorted(s.name for s in recorded), sorted(s.name for s in scripts))
+            step = recorded[0].steps[0]
+            self.assertIsNotNone(step.symbol)
+            self.assertIn(step.action, ("answer", "skip", "timeout"))
+
+            replay = await run_load(recorded, EngineTarget(ENGINE), concurrency=5)
+            self.assertEqual(replay.questions, 120)
+
+
+if __name__ == '__main__':
+    unittest.main()
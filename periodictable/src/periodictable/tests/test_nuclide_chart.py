@@ -0,0 +1,174 @@
+import sys
+import os
+import unittest
+from unittest.mock import patch
+
+# Force PyQt5 to work in headless environments (like CI or no display)
+os.environ['QT_QPA_PLATFORM'] = 'offscreen'
+
+from PyQt5.QtWidgets import QApplication
+from PyQt5.QtCore import Qt, QPoint, QPointF, QEvent
+from PyQt5.QtGui import QImage, QMouseEvent
+from PyQt5.QtTest import QTest
+
+# Set up path so we can import the package modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from periodictable.nuclide_chart import (nuclide_table, NuclideIndex, NuclideChartView,
+                                         NuclideChartWindow, binding_energy, runs, describe,
+                                         benchmark, NATURAL, TABULATED, PREDICTED)
+from periodictable.isotopes import isotope_table
+from periodictable.elements_data import elements
+
+TABLE = nuclide_table()
+
+
+def mouse_move(widget, pos, buttons=Qt.NoButton):
+    """Deliver a mouse move to a widget that is not shown on screen."""
+    event = QMouseEvent(QEvent.MouseMove, QPointF(pos), Qt.NoButton, buttons, Qt.NoModifier)
+    QApplication.sendEvent(widget, event)
+
+
+class TestNuclideTable(unittest.TestCase):
+    """Test case for the nuclide table and its spatial index"""
+
+    def test_tabulated_isotopes_included(self):
+        """Test that every tabulated isotope is a cell of the right kind"""
+        index = NuclideIndex(TABLE)
+        for symbol, isotopes in isotope_table.items():
+            z = elements[symbol]["num"]
+            for isotope in isotopes:
+                nuclide = index.at(isotope.mass_number - z, z)
+                self.assertEqual(nuclide.symbol, symbol)
+                self.assertEqual(nuclide.kind, NATURAL if isotope.abundance > 0 else TABULATED)
+
+    def test_full_chart(self):
+        """Test that the chart holds thousands of distinct nuclides"""
+        self.assertGreater(len(TABLE), 5000)
+        self.assertEqual(len({(n.z, n.n) for n in TABLE}), len(TABLE))
+        self.assertIn(PREDICTED, {n.kind for n in TABLE})
+        self.assertEqual(max(n.z for n in TABLE), 118)
+
+    def test_binding_energy(self):
+        """Test the liquid-drop binding energy near the iron peak"""
+        per_nucleon = binding_energy(26, 30) / 56
+        self.assertAlmostEqual(float(per_nucleon), 8.8, delta=0.2)
+        self.assertEqual(float(binding_energy(0, 5)), 0.0)
+
+    def test_runs(self):
+        """Test splitting sorted integers into consecutive runs"""
+        self.assertEqual(runs([1, 2, 3, 7, 9, 10]), [(1, 3), (7, 7), (9, 10)])
+        self.assertEqual(runs([]), [])
+
+    def test_visible_matches_brute_force(self):
+        """Test viewport queries against a scan of every cell"""
+        index = NuclideIndex(TABLE)
+        for n0, n1, z0, z1 in ((0, 20, 0, 10), (100, 140, 40, 60), (-5, 400, -5, 200), (300, 310, 0, 5)):
+            expected = {i for i, n in enumerate(TABLE) if n0 <= n.n <= n1 and z0 <= n.z <= z1}
+            self.assertEqual(set(index.visible(n0, n1, z0, z1)), expected)
+
+    def test_edges_outline_cells(self):
+        """Test that border lines outline runs of cells"""
+        index = NuclideIndex(TABLE)
+        lines = index.edges(0, index.max_n, 1, 1)
+        ns = index.rows[1][0]
+        # Top and bottom of each hydrogen run, plus both sides of every column,
+        # in image rows counted from the top
+        self.assertEqual(len(lines), 2 * len(runs(ns.tolist())) + 2 * (index.max_n + 1))
+        self.assertEqual({line.y1() for line in lines if line.y1() == line.y2()},
+                         {index.max_z - 1, index.max_z})
+
+
+class TestNuclideChartView(unittest.TestCase):
+    """Test case for the virtualized chart widget"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QApplication(sys.argv) if not QApplication.instance() else QApplication.instance()
+
+    def setUp(self):
+        self.view = NuclideChartView(TABLE)
+        self.view.resize(800, 500)
+        self.view.fit()
+
+    def test_fit_shows_whole_chart(self):
+        """Test that the fitted view covers every cell"""
+        n0, n1, z0, z1 = self.view.visible_range()
+        self.assertLessEqual(n0, 0)
+        self.assertGreaterEqual(n1, self.view.index.max_n)
+        self.assertLessEqual(z0, 0)
+        self.assertGreaterEqual(z1, self.view.index.max_z)
+
+    def test_cell_round_trip(self):
+        """Test that a cell's centre maps back to the cell"""
+        self.view.zoom(5)
+        rect = self.view.cell_rect(30, 26)
+        self.assertEqual(self.view.cell_at(rect.center().x(), rect.center().y()), (30, 26))
+
+    def test_zoom_keeps_anchor(self):
+        """Test that zooming keeps the cell under the cursor in place"""
+        anchor = QPointF(300, 200)
+        before = self.view.cell_at(anchor.x(), anchor.y())
+        for factor in (1.25, 1.25, 3.0, 0.5):
+            self.view.zoom(factor, anchor)
+            self.assertEqual(self.view.cell_at(anchor.x(), anchor.y()), before)
+        self.view.zoom(1000)
+        self.assertEqual(self.view.scale, self.view.MAX_SCALE)
+
+    def test_pan_and_keys(self):
+        """Test dragging and keyboard navigation"""
+        origin = QPointF(self.view.origin)
+        QTest.mousePress(self.view, Qt.LeftButton, pos=QPoint(100, 100))
+        mouse_move(self.view, QPoint(140, 90), Qt.LeftButton)
+        QTest.mouseRelease(self.view, Qt.LeftButton, pos=QPoint(140, 90))
+        self.assertEqual(self.view.origin - origin, QPointF(40, -10))
+        scale = self.view.scale
+        QTest.keyClick(self.view, Qt.Key_Plus)
+        self.assertAlmostEqual(self.view.scale, scale * self.view.ZOOM_STEP)
+        QTest.keyClick(self.view, Qt.Key_Home)
+        self.assertAlmostEqual(self.view.scale, scale)
+
+    def test_hover_lookup(self):
+        """Test that hovering a cell emits its nuclide"""
+        self.view.zoom(8)
+        self.view.center_on(30, 26)
+        hovered = []
+        self.view.nuclideHovered.connect(hovered.append)
+        center = self.view.cell_rect(30, 26).center().toPoint()
+        mouse_move(self.view, center)
+        self.assertEqual((hovered[-1].symbol, hovered[-1].mass_number), ("Fe", 56))
+        self.assertIn("Iron-56", describe(hovered[-1]))
+
+    def test_describe_light_nuclides(self):
+        """Test that the model binding energy is left out where it is meaningless"""
+        index = NuclideIndex(TABLE)
+        for n in (0, 1):
+            self.assertNotIn("B/A", describe(index.at(n, 1)))
+        self.assertIn("B/A ≈ 5.71 MeV", describe(index.at(2, 2)))
+
+    def test_labels_only_for_visible_cells(self):
+        """Test that painting at label detail only labels the cells in view"""
+        image = QImage(self.view.size(), QImage.Format_ARGB32_Premultiplied)
+        self.view.zoom(self.view.DETAIL_LOD / self.view.scale)
+        self.view.center_on(30, 26)
+        with patch.object(self.view, 'paint_labels', wraps=self.view.paint_labels) as mock_labels:
+            self.view.render(image)
+        visible = mock_labels.call_args[0][1]
+        self.assertLess(len(visible), 400)
+        self.assertIn(self.view.index.cells[(30, 26)], visible)
+
+    def test_frame_time(self):
+        """Test paint times at every level of detail (bounded at 30 fps for slow machines)"""
+        for scale, seconds in benchmark(frames=5, size=(1280, 800)).items():
+            self.assertLess(seconds, 1 / 30, f"{scale} px cells")
+
+    def test_window_status(self):
+        """Test that the window describes the hovered nuclide"""
+        window = NuclideChartWindow()
+        window.view.nuclideHovered.emit(window.view.index.at(30, 26))
+        self.assertIn("Z = 26", window.status.text())
+        window.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,19 +1,30 @@
 import sys
 import os
+import tempfile
 import unittest
-from unittest.mock import MagicMock, patch, PropertyMock
+from unittest.mock import patch
 
 # Force PyQt5 to work in headless environments (like CI or no display)
 os.environ['QT_QPA_PLATFORM'] = 'offscreen'
 
-from PyQt5.QtWidgets import QApplication
+# Keep quiz events of the tests out of the user's event log
+EVENT_LOG_DIR = tempfile.TemporaryDirectory()
+os.environ['PERIODICTABLE_EVENT_LOG'] = os.path.join(EVENT_LOG_DIR.name, 'events.sqlite3')
+
+from PyQt5.QtWidgets import QApplication, QWidget
 from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtTest import QTest
 
 # Set up path so we can import the main app
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 # Now we can import your modules
 from periodictable.utils import PeriodicTableApp
+from periodictable.element_dialog import LRUCache
+from periodictable.image_loader import StructureImageLoader, neighbours
+from periodictable.diagnostics import take_snapshot, MemoryMonitor
+from periodictable.events import load_events
+from periodictable.heatmap import SYMBOLS
 from periodictable.elements_data import elements, positions, colors, production_methods
 
 class TestPeriodicTableApp(unittest.TestCase):
@@ -49,16 +60,54 @@ class TestPeriodicTableApp(unittest.TestCase):
         self.assertEqual(self.periodic_table.quiz_btn.text(), "🎲 Start Quiz")
     
     def test_element_grid_initialization(self):
-        """Test that the element grid is populated with all elements"""
-        # Count the number of buttons in the grid
-        button_count = 0
-        for i in range(self.periodic_table.element_grid.count()):
-            widget = self.periodic_table.element_grid.itemAt(i).widget()
-            if widget and widget.text() in elements:
-                button_count += 1
+        """Test that the table widget has one tile per element"""
+        table = self.periodic_table.table_widget
+        self.assertEqual(len(table.grid), len(positions))
+        self.assertTrue(all(symbol in elements for symbol in table.grid.values()))
+    
+    def test_table_hit_testing(self):
+        """Test that tile hit-testing follows the positions grid and window size"""
+        table = self.periodic_table.table_widget
+        for width, height in ((720, 480), (1440, 960)):
+            table.resize(width, height)
+            for symbol in ("H", "Og", "La", "Fe"):
+                center = table.cell_rect(symbol).center()
+                self.assertEqual(table.symbol_at(center.x(), center.y()), symbol)
+        
+        # Empty cells of the grid are not tiles
+        rect = table.cell_rect("H")
+        self.assertIsNone(table.symbol_at(rect.center().x() + rect.width(), rect.center().y()))
+    
+    def test_table_click_signal(self):
+        """Test that clicking a tile emits its symbol"""
+        table = self.periodic_table.table_widget
+        table.resize(720, 480)
+        
+        # Replace the dialog slot so no modal dialog is opened
+        clicked = []
+        table.elementClicked.disconnect()
+        table.elementClicked.connect(clicked.append)
+        QTest.mouseClick(table, Qt.LeftButton, pos=table.cell_rect("Na").center().toPoint())
+        self.assertEqual(clicked, ["Na"])
+    
+    # Theme Tests
+    def test_application_stylesheet(self):
+        """Test that styling comes from one application stylesheet"""
+        stylesheet = self.app.styleSheet()
+        self.assertIn("QPushButton#exitButton", stylesheet)
+        self.assertIn('QFrame#legendSwatch[family="metal-alcalin"]', stylesheet)
         
-        # We expect one button per element in positions dictionary
-        self.assertEqual(button_count, len(positions))
+        # No widget of the main window carries its own stylesheet
+        for widget in self.periodic_table.findChildren(QWidget):
+            self.assertEqual(widget.styleSheet(), "")
+    
+    def test_theme_switch(self):
+        """Test switching theme at runtime"""
+        self.periodic_table.set_theme("dark")
+        self.assertEqual(self.periodic_table.theme, "dark")
+        self.assertIn("#2B2B2B", self.app.styleSheet())
+        self.periodic_table.set_theme("light")
+        self.assertNotIn("#2B2B2B", self.app.styleSheet())
     
     # Timer Tests
     def test_timer_initialization(self):
@@ -66,20 +115,44 @@ class TestPeriodicTableApp(unittest.TestCase):
         self.assertEqual(self.periodic_table.time_remaining, 30)
         self.assertEqual(self.periodic_table.timer_display.text(), "Time remaining: 30s")
     
-    @patch('PyQt5.QtWidgets.QMessageBox.warning')
-    def test_timer_update(self, mock_warning):
-        """Test that the timer updates correctly"""
-        # Prepare timer and quiz state
-        self.periodic_table.quiz_active = True
-        self.periodic_table.time_remaining = 2
-        self.periodic_table.timer_display.setText("Time remaining: 2s")
+    @patch('periodictable.utils.time.monotonic', return_value=100.0)
+    def test_timer_update(self, mock_monotonic):
+        """Test that the countdown follows the monotonic deadline"""
+        self.periodic_table.quiz_state = "question"
+        self.periodic_table.start_countdown()
+        self.assertTrue(self.periodic_table.quiz_timer.isSingleShot())
+        self.assertTrue(self.periodic_table.quiz_timer.isActive())
+        self.assertEqual(self.periodic_table.timer_display.text(), "Time remaining: 30s")
         
-        # Manually call update_timer method
+        # A late refresh shows the true remaining time and waits for the next change
+        mock_monotonic.return_value = 102.6
         self.periodic_table.update_timer()
-        
-        # Check that time was reduced by 1
-        self.assertEqual(self.periodic_table.time_remaining, 1)
-        self.assertEqual(self.periodic_table.timer_display.text(), "Time remaining: 1s")
+        self.assertEqual(self.periodic_table.time_remaining, 28)
+        self.assertEqual(self.periodic_table.timer_display.text(), "Time remaining: 28s")
+        self.assertEqual(self.periodic_table.display_timer.interval(), 400)
+        self.assertAlmostEqual(self.periodic_table.response_time(), 2.6)
+        self.periodic_table.stop_countdown()
+        self.assertFalse(self.periodic_table.quiz_timer.isActive())
+        self.assertFalse(self.periodic_table.display_timer.isActive())
+    
+    @patch('PyQt5.QtWidgets.QMessageBox.information')
+    @patch('PyQt5.QtWidgets.QMessageBox.warning')
+    def test_response_time_excludes_feedback(self, mock_warning, mock_info):
+        """Test that the response time is taken when the answer is submitted"""
+        app = self.periodic_table
+        app.quiz_type = "Free Response"
+        app.quiz_active = True
+        with patch('periodictable.utils.time.monotonic', return_value=50.0) as mock_monotonic:
+            app.ask_question()
+            mock_monotonic.return_value = 53.217
+            # The feedback message box stays open for a while
+            mock_info.side_effect = mock_warning.side_effect = \
+                lambda *args: setattr(mock_monotonic, 'return_value', 60.0)
+            with patch.object(app, 'record_result', wraps=app.record_result) as mock_record:
+                app.submit_answer(app.current_answer)
+        self.assertAlmostEqual(mock_record.call_args.args[3], 3.217)
+        self.assertAlmostEqual(app.last_response_time, 3.217)
+        app.exit_quiz()
     
     # Quiz Functionality Tests
     @patch('PyQt5.QtWidgets.QInputDialog.getItem')
@@ -136,6 +209,21 @@ class TestPeriodicTableApp(unittest.TestCase):
             self.assertEqual(self.periodic_table.score, 6)
             mock_info.assert_called_once()
     
+    def test_check_answer_fuzzy_free_response(self):
+        """Test that free responses accept typos and name the closest element"""
+        self.periodic_table.quiz_type = "Free Response"
+        self.periodic_table.current_answer = "Fluorine"
+        self.periodic_table.score = 0
+        with patch('PyQt5.QtWidgets.QMessageBox.information') as mock_info:
+            self.periodic_table.check_answer("Flourine")
+            self.assertEqual(self.periodic_table.score, 1)
+            self.assertIn("typo", mock_info.call_args[0][2])
+        
+        with patch('PyQt5.QtWidgets.QMessageBox.warning') as mock_warning:
+            self.periodic_table.check_answer("Chlorin")
+            self.assertEqual(self.periodic_table.score, 1)
+            self.assertIn("Chlorine (Cl)", mock_warning.call_args[0][2])
+    
     def test_check_answer_incorrect(self):
         """Test checking incorrect answers"""
         # Manually set up test scenario
@@ -173,20 +261,406 @@ class TestPeriodicTableApp(unittest.TestCase):
             self.assertIn("Laboratory:", content)
             self.assertIn("Test Reaction", content)
     
+    def test_get_network_content(self):
+        """Test the made from / used to make section"""
+        content = self.periodic_table.get_network_content("Cl")
+        self.assertIn("Made from:", content)
+        self.assertIn("Used to make:", content)
+        self.assertEqual(self.periodic_table.get_network_content("He"), "")
+    
+    def test_search_highlights_tiles(self):
+        """Test that a search query highlights the matching element tiles"""
+        self.periodic_table.search_input.setText("electrolysis")
+        hits = self.periodic_table.run_search()
+        matched = {hit.symbol for hit in hits}
+        self.assertIn("Li", matched)
+        self.assertEqual(self.periodic_table.table_widget.highlighted, matched)
+        
+        # Clearing the query removes the highlighting
+        self.periodic_table.search_input.setText("")
+        self.periodic_table.run_search()
+        self.assertEqual(self.periodic_table.table_widget.highlighted, set())
+    
+    def test_filter_dims_non_matching_tiles(self):
+        """Test that the type-ahead filter dims non-matching tiles"""
+        table = self.periodic_table.table_widget
+        self.periodic_table.filter_input.setText("Car")
+        self.assertNotIn("C", table.dimmed)
+        self.assertIn("H", table.dimmed)
+        
+        self.periodic_table.filter_input.setText("Carb")
+        self.assertNotIn("C", table.dimmed)
+        
+        self.periodic_table.filter_input.setText("")
+        self.assertEqual(table.dimmed, set())
+    
+    def test_property_heatmap(self):
+        """Test that the colour selector recolours every tile and swaps the legend"""
+        app = self.periodic_table
+        table = app.table_widget
+        with patch.object(table, 'update') as mock_update:
+            app.color_selector.setCurrentIndex(app.color_selector.findData("mass"))
+            mock_update.assert_called_once_with()
+        self.assertEqual(set(table.overlay), set(positions))
+        self.assertNotEqual(table.overlay["H"].color(), table.overlay["Og"].color())
+        self.assertIn("H", table.light_text)
+        self.assertNotIn("Og", table.light_text)
+        self.assertTrue(app.family_legend.isHidden())
+        self.assertFalse(app.scale_legend.isHidden())
+        self.assertEqual(app.scale_legend.vmax, max(e["masse"] for e in elements.values()))
+        
+        # Heatmaps are computed once per property
+        heatmap = app.heatmaps["mass"]
+        app.set_color_property("z_eff")
+        app.set_color_property("mass")
+        self.assertIs(app.heatmaps["mass"], heatmap)
+        
+        app.color_selector.setCurrentIndex(app.color_selector.findData("family"))
+        self.assertEqual(table.overlay, {})
+        self.assertEqual(table.light_text, set())
+        self.assertTrue(app.scale_legend.isHidden())
+    
+    @patch('PyQt5.QtWidgets.QMessageBox.information')
+    @patch('PyQt5.QtWidgets.QMessageBox.warning')
+    @patch('PyQt5.QtWidgets.QInputDialog.getItem', return_value=("Free Response", True))
+    def test_abandoned_quiz_refreshes_error_rates(self, mock_get_item, mock_warning, mock_info):
+        """Test that answers of an abandoned quiz reach the error rate heatmap"""
+        with tempfile.TemporaryDirectory() as tmpdir, \
+             patch.dict(os.environ, {"PERIODICTABLE_EVENT_LOG": os.path.join(tmpdir, "e.sqlite3")}):
+            app = self.periodic_table
+            app.set_color_property("error_rate")
+            stale = app.heatmaps["error_rate"]
+            app.quiz_btn.click()
+            symbol = app.current_question.symbol
+            app.quiz_dialog.answer_input.setText("wrong")
+            app.quiz_dialog.submit_btn.click()
+            app.exit_quiz()
+            
+            heatmap = app.heatmaps["error_rate"]
+            self.assertIsNot(heatmap, stale)
+            self.assertEqual(heatmap.values[SYMBOLS.index(symbol)], 1.0)
+            self.assertIn(symbol, app.table_widget.overlay)
+            app.close()
+    
+    def test_nuclide_chart_window_reused(self):
+        """Test that the chart of nuclides opens in one reused window"""
+        self.periodic_table.nuclide_btn.click()
+        window = self.periodic_table.nuclide_window
+        self.assertTrue(window.isVisible())
+        window.close()
+        self.periodic_table.nuclide_btn.click()
+        self.assertIs(self.periodic_table.nuclide_window, window)
+        window.close()
+    
+    @patch('periodictable.utils.ElementInfoDialog.exec_')
+    def test_element_dialog_reused(self, mock_exec):
+        """Test that one dialog is reused and contents are served from the cache"""
+        with patch.object(self.periodic_table, 'prepare_element_content',
+                          wraps=self.periodic_table.prepare_element_content) as mock_prepare:
+            self.periodic_table.show_element_info("Cl")
+            dialog = self.periodic_table.info_dialog
+            self.periodic_table.show_element_info("Na")
+            self.periodic_table.show_element_info("Cl")
+            
+            self.assertIs(self.periodic_table.info_dialog, dialog)
+            self.assertEqual(mock_prepare.call_count, 2)
+            self.assertEqual(dialog.symbol, "Cl")
+            self.assertIn("Chlorine (Cl)", dialog.info_label.text())
+            self.assertIn("Made from:", dialog.production_label.text())
+        self.assertEqual(mock_exec.call_count, 3)
+    
+    def test_element_content_cache_bounded(self):
+        """Test that the content cache evicts least recently used elements"""
+        cache = LRUCache(2)
+        cache.put("H", 1)
+        cache.put("He", 2)
+        cache.get("H")
+        cache.put("Li", 3)
+        self.assertIn("H", cache)
+        self.assertNotIn("He", cache)
+        self.assertEqual(len(cache), 2)
+    
+    def wait_for_image(self, loader, symbol):
+        """Process events until the loader emits imageReady for a symbol"""
+        received = {}
+        loader.imageReady.connect(lambda s, pixmap: received.setdefault(s, pixmap))
+        loader.request(symbol)
+        for _ in range(100):
+            if symbol in received:
+                break
+            loader.wait_for_done(50)
+            QTest.qWait(10)
+        return received.get(symbol)
+    
+    def test_image_loader_decodes_scaled(self):
+        """Test that images are decoded at the target size off the GUI thread"""
+        from PyQt5.QtGui import QImage, QColor
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "big.png")
+            image = QImage(800, 400, QImage.Format_RGB32)
+            image.fill(QColor("red"))
+            image.save(path)
+            
+            loader = StructureImageLoader(size=100, path_for=lambda symbol: path)
+            pixmap = self.wait_for_image(loader, "Xe")
+            self.assertIsNotNone(pixmap)
+            self.assertEqual((pixmap.width(), pixmap.height()), (100, 50))
+            # Served from QPixmapCache afterwards
+            self.assertIsNotNone(loader.cached("Xe"))
+            
+            missing = StructureImageLoader(size=100, path_for=lambda symbol: path + ".none")
+            self.assertTrue(self.wait_for_image(missing, "Kr").isNull())
+            self.assertIn("Kr", missing.missing)
+    
+    def test_neighbour_prefetch(self):
+        """Test neighbour lookup and prefetch on hover"""
+        self.assertEqual(set(neighbours("H")), {"Li", "Be"})
+        self.assertIn("O", neighbours("N"))
+        with patch.object(self.periodic_table.image_loader, 'prefetch') as mock_prefetch:
+            self.periodic_table.table_widget.elementHovered.emit("N")
+            symbols = mock_prefetch.call_args[0][0]
+        self.assertIn("N", symbols)
+        self.assertIn("P", symbols)
+    
+    @patch('periodictable.utils.ElementInfoDialog.exec_')
+    def test_dialog_ignores_stale_images(self, mock_exec):
+        """Test that a late image for another element does not replace the current one"""
+        from PyQt5.QtGui import QPixmap
+        self.periodic_table.show_element_info("Cl")
+        dialog = self.periodic_table.info_dialog
+        pixmap = QPixmap(10, 10)
+        self.periodic_table.on_structure_image("Na", pixmap)
+        self.assertIsNone(dialog.img_label.pixmap())
+        self.periodic_table.on_structure_image("Cl", pixmap)
+        self.assertEqual(dialog.img_label.pixmap().width(), 10)
+    
+    def quiz_dialogs(self):
+        """Live quiz dialogs parented to the main window"""
+        from PyQt5.QtWidgets import QDialog
+        return [d for d in self.periodic_table.findChildren(QDialog)
+                if d.windowTitle().startswith("Element Quiz")]
+    
+    @patch('PyQt5.QtWidgets.QMessageBox.information')
+    def test_quiz_reuses_one_dialog(self, mock_info):
+        """Test that a whole quiz runs in one dialog without recursion"""
+        app = self.periodic_table
+        app.quiz_type = "Multiple Choice"
+        app.quiz_active = True
+        app.ask_question()
+        dialog = app.quiz_dialog
+        
+        for _ in range(10):
+            self.assertEqual(app.quiz_state, "question")
+            dialog.new_btn.click()
+        
+        self.assertEqual(app.question_count, 10)
+        self.assertFalse(app.quiz_active)
+        self.assertEqual(app.quiz_state, "idle")
+        self.assertFalse(dialog.isVisible())
+        self.assertEqual(self.quiz_dialogs(), [dialog])
+        mock_info.assert_called_once()
+    
+    @patch('PyQt5.QtWidgets.QMessageBox.information')
+    @patch('PyQt5.QtWidgets.QMessageBox.warning')
+    def test_quiz_answer_flow(self, mock_warning, mock_info):
+        """Test answering through the dialog signals and exiting the quiz"""
+        app = self.periodic_table
+        app.quiz_type = "Free Response"
+        app.quiz_active = True
+        app.ask_question()
+        dialog = app.quiz_dialog
+        self.assertTrue(dialog.answer_input.isVisible())
+        self.assertFalse(dialog.option_buttons[0].isVisible())
+        
+        # An empty answer keeps the question open
+        dialog.submit_btn.click()
+        self.assertEqual(app.question_count, 0)
+        
+        dialog.answer_input.setText(app.current_answer)
+        dialog.submit_btn.click()
+        self.assertEqual(app.score, 1)
+        self.assertEqual(app.question_count, 1)
+        
+        # Closing the dialog abandons the quiz
+        dialog.close()
+        self.assertFalse(app.quiz_active)
+        self.assertEqual(app.quiz_state, "idle")
+        self.assertTrue(any(c.args[1] == "Quiz Abandoned" for c in mock_info.call_args_list))
+    
+    @patch('PyQt5.QtWidgets.QMessageBox.information')
+    @patch('PyQt5.QtWidgets.QMessageBox.warning')
+    @patch('PyQt5.QtWidgets.QInputDialog.getItem', return_value=("Free Response", True))
+    def test_review_session_persists_progress(self, mock_get_item, mock_warning, mock_info):
+        """Test that a review session schedules answers and saves them"""
+        with tempfile.TemporaryDirectory() as tmpdir, \
+             patch.dict(os.environ, {"PERIODICTABLE_PROGRESS_DB": os.path.join(tmpdir, "p.sqlite3")}):
+            app = self.periodic_table
+            app.review_btn.click()
+            self.assertEqual(app.quiz_mode, "review")
+            first = (app.current_question.symbol, app.current_question.type)
+            app.quiz_dialog.answer_input.setText(app.current_answer)
+            app.quiz_dialog.submit_btn.click()
+            app.quiz_dialog.new_btn.click()
+            app.exit_quiz()
+            
+            history = app.progress_store.history(app.student)
+            self.assertEqual([(row[1], row[2], row[3]) for row in history][:1], [first + (1,)])
+            self.assertEqual(len(history), 2)
+            
+            # The next session resumes both items, neither of which is due yet
+            app.start_quiz("review")
+            self.assertEqual(len(app.review_scheduler.states), 2)
+            self.assertNotIn(first, app.review_scheduler.new_items)
+            self.assertEqual(app.review_scheduler.due_count(), 0)
+            app.exit_quiz()
+            app.close()
+            self.assertIsNone(app.progress_store)
+    
+    @patch('PyQt5.QtWidgets.QMessageBox.information')
+    @patch('PyQt5.QtWidgets.QMessageBox.warning')
+    @patch('PyQt5.QtWidgets.QInputDialog.getItem', return_value=("Free Response", True))
+    def test_adaptive_session_stops_at_precision(self, mock_get_item, mock_warning, mock_info):
+        """Test that an adaptive test ends with an ability estimate and saves its answers"""
+        with tempfile.TemporaryDirectory() as tmpdir, \
+             patch.dict(os.environ, {"PERIODICTABLE_PROGRESS_DB": os.path.join(tmpdir, "p.sqlite3")}):
+            app = self.periodic_table
+            app.adaptive_btn.click()
+            self.assertEqual(app.quiz_mode, "adaptive")
+            while app.quiz_active:
+                app.quiz_dialog.answer_input.setText(app.current_answer)
+                app.quiz_dialog.submit_btn.click()
+            
+            session = app.adaptive_session
+            self.assertGreater(session.theta, 0)
+            self.assertEqual(app.score, len(session.responses))
+            self.assertEqual(len(app.progress_store.history(app.student)), app.score)
+            self.assertTrue(any(c.args[1] == "Adaptive Test Complete! 🎯"
+                                for c in mock_info.call_args_list))
+    
+    @patch('PyQt5.QtWidgets.QMessageBox.information')
+    @patch('PyQt5.QtWidgets.QMessageBox.warning')
+    @patch('PyQt5.QtWidgets.QInputDialog.getItem', return_value=("Free Response", True))
+    def test_enter_submits_free_answer_once(self, mock_get_item, mock_warning, mock_info):
+        """Test that pressing Enter in the answer field grades exactly one answer"""
+        app = self.periodic_table
+        app.quiz_btn.click()
+        submitted = []
+        app.quiz_dialog.answerSubmitted.connect(submitted.append)
+        app.quiz_dialog.answer_input.setText(app.current_answer)
+        QTest.keyClick(app.quiz_dialog.answer_input, Qt.Key_Return)
+        self.assertEqual(len(submitted), 1)
+        self.assertEqual((app.score, app.question_count), (1, 1))
+        app.exit_quiz()
+    
+    @patch('PyQt5.QtWidgets.QMessageBox.information')
+    @patch('PyQt5.QtWidgets.QMessageBox.warning')
+    @patch('PyQt5.QtWidgets.QInputDialog.getItem', return_value=("Free Response", True))
+    def test_quiz_without_event_log(self, mock_get_item, mock_warning, mock_info):
+        """Test that a quiz carries on unlogged if the event log cannot be opened"""
+        with tempfile.TemporaryDirectory() as tmpdir, \
+             patch.dict(os.environ, {"PERIODICTABLE_EVENT_LOG": tmpdir}):
+            app = self.periodic_table
+            app.quiz_btn.click()
+            app.quiz_dialog.answer_input.setText(app.current_answer)
+            app.quiz_dialog.submit_btn.click()
+            app.quiz_dialog.new_btn.click()
+            self.assertEqual((app.score, app.question_count), (1, 2))
+            self.assertIsNone(app.event_log)
+            self.assertIsNotNone(app.event_log_error)
+            app.exit_quiz()
+            app.close()
+    
+    @patch('PyQt5.QtWidgets.QMessageBox.information')
+    @patch('PyQt5.QtWidgets.QMessageBox.warning')
+    @patch('PyQt5.QtWidgets.QInputDialog.getItem', return_value=("Free Response", True))
+    def test_score_out_of_questions_asked(self, mock_get_item, mock_warning, mock_info):
+        """Test that scores are reported out of the questions asked so far"""
+        app = self.periodic_table
+        app.quiz_btn.click()
+        app.quiz_dialog.answer_input.setText(app.current_answer)
+        app.quiz_dialog.submit_btn.click()
+        self.assertIn("Current Score: 1/1", mock_info.call_args[0][2])
+        app.quiz_dialog.new_btn.click()
+        app.exit_quiz()
+        self.assertEqual(mock_info.call_args[0][1:], ("Quiz Abandoned", "Current Score: 1/2"))
+    
+    @patch('PyQt5.QtWidgets.QMessageBox.information')
+    @patch('PyQt5.QtWidgets.QMessageBox.warning')
+    @patch('PyQt5.QtWidgets.QInputDialog.getItem', return_value=("Free Response", True))
+    def test_quiz_events_logged(self, mock_get_item, mock_warning, mock_info):
+        """Test that answers, skips and timeouts reach the event log"""
+        with tempfile.TemporaryDirectory() as tmpdir, \
+             patch.dict(os.environ, {"PERIODICTABLE_EVENT_LOG": os.path.join(tmpdir, "e.sqlite3")}):
+            app = self.periodic_table
+            app.quiz_btn.click()
+            asked = [app.current_question]
+            app.quiz_dialog.answer_input.setText(app.current_answer)
+            app.quiz_dialog.submit_btn.click()
+            asked.append(app.current_question)
+            app.quiz_dialog.new_btn.click()
+            asked.append(app.current_question)
+            app.handle_timeout()
+            app.exit_quiz()
+            app.event_log.flush()
+            
+            events = load_events(app.event_log.path)
+            self.assertEqual(list(events["outcome"]), ["answer", "skip", "timeout"])
+            self.assertEqual(list(events["correct"]), [True, False, False])
+            self.assertEqual(list(events["symbol"]), [q.symbol for q in asked])
+            self.assertEqual(events["session"].nunique(), 1)
+            self.assertTrue((events["response_time"] >= 0).all())
+            app.close()
+            self.assertIsNone(app.event_log)
+    
+    @patch('periodictable.utils.ElementInfoDialog.exec_')
+    def test_memory_monitor_reports_no_growth(self, mock_exec):
+        """Test that browsing elements keeps dialog and object counts flat"""
+        app = self.periodic_table
+        monitor = MemoryMonitor(app, app.image_loader)
+        app.show_element_info("H")
+        monitor.sample()
+        for symbol in ["He", "Li", "Be", "B", "C", "H", "He"]:
+            app.show_element_info(symbol)
+        monitor.sample()
+        
+        self.assertEqual(monitor.growth("dialogs"), 0)
+        self.assertLessEqual(monitor.growth("objects"), 0)
+        snapshot = take_snapshot(app, app.image_loader)
+        self.assertLessEqual(snapshot.pixmaps, 1)
+        self.assertGreaterEqual(snapshot.pixmap_cache_bytes, 0)
+    
+    def test_pixmap_cache_bytes(self):
+        """Test that the loader reports the bytes of its cached pixmaps"""
+        from PyQt5.QtGui import QImage, QColor
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "img.png")
+            image = QImage(64, 64, QImage.Format_RGB32)
+            image.fill(QColor("blue"))
+            image.save(path)
+            loader = StructureImageLoader(size=64, path_for=lambda symbol: path)
+            self.assertEqual(loader.cache_bytes(), 0)
+            pixmap = self.wait_for_image(loader, "Ne")
+            self.assertEqual(loader.cache_bytes(), 64 * 64 * pixmap.depth() // 8)
+    
     def test_multiple_choice_answer_selection(self):
         """Test multiple choice answer selection"""
-        # Create a mock dialog
-        mock_dialog = MagicMock()
+        self.periodic_table.quiz_state = "question"
+        self.periodic_table.current_answer = "Helium"
         
         # Simulate answer selection
         answer = "Helium"
-        self.periodic_table.mc_answer_selected(answer, mock_dialog)
-        
-        # Check that the user answer was set correctly
-        self.assertEqual(self.periodic_table.user_answer, answer)
-        
-        # Verify dialog was accepted
-        mock_dialog.accept.assert_called_once()
+        with patch.object(self.periodic_table, 'check_answer') as mock_check, \
+             patch.object(self.periodic_table, 'ask_question') as mock_ask:
+            self.periodic_table.mc_answer_selected(answer)
+            
+            # Check that the user answer was set and graded once
+            self.assertEqual(self.periodic_table.user_answer, answer)
+            mock_check.assert_called_once_with(answer)
+            mock_ask.assert_called_once()
+            
+            # A second click on the same question is ignored
+            self.periodic_table.mc_answer_selected("Neon")
+            mock_check.assert_called_once_with(answer)
     
     # Timeout Handling Test
     @patch('PyQt5.QtWidgets.QMessageBox.warning')
@@ -194,14 +668,12 @@ class TestPeriodicTableApp(unittest.TestCase):
         """Test handling quiz timeout"""
         # Set up test scenario with proper quiz state
         self.periodic_table.quiz_active = True
+        self.periodic_table.quiz_state = "question"
         self.periodic_table.current_answer = "Carbon"
         self.periodic_table.question_count = 3
         
-        # Create a mock current dialog
-        self.periodic_table.current_dialog = MagicMock()
-        
         # Prevent actual question asking
-        with patch.object(self.periodic_table, 'ask_question', return_value=None):
+        with patch.object(self.periodic_table, 'ask_question', return_value=None) as mock_ask:
             # Call handle timeout
             self.periodic_table.handle_timeout()
             
@@ -211,28 +683,38 @@ class TestPeriodicTableApp(unittest.TestCase):
             # Check that question count was incremented
             self.assertEqual(self.periodic_table.question_count, 4)
             
-            # Verify dialog was closed
-            self.periodic_table.current_dialog.close.assert_called_once()
+            # Verify the next question is shown in the same dialog
+            mock_ask.assert_called_once()
+            
+            # A second timeout for the same question is ignored
+            self.periodic_table.handle_timeout()
+            self.assertEqual(self.periodic_table.question_count, 4)
     
     # Additional test for handling quiz timeout with timer at zero
     @patch('PyQt5.QtWidgets.QMessageBox.warning')
     def test_update_timer_timeout(self, mock_warning):
-        """Test timer update with timeout"""
-        # Setup quiz state
+        """Test that a refresh past the deadline times the question out"""
         self.periodic_table.quiz_active = True
-        self.periodic_table.time_remaining = 1
         self.periodic_table.current_answer = "Oxygen"
-        self.periodic_table.current_dialog = MagicMock()
-        
-        # Mock the handle_timeout method to prevent it from executing
-        with patch.object(self.periodic_table, 'handle_timeout') as mock_handle_timeout:
-            # Call update_timer which should trigger timeout
-            self.periodic_table.update_timer()
-            
-            # Verify time has reached 0
-            self.assertEqual(self.periodic_table.time_remaining, 0)
+        with patch('periodictable.utils.time.monotonic', return_value=10.0) as mock_monotonic:
+            self.periodic_table.start_countdown()
+            mock_monotonic.return_value = 40.5
             
-            # Verify handle_timeout was called
+            # Mock the handle_timeout method to prevent it from executing
+            with patch.object(self.periodic_table, 'handle_timeout') as mock_handle_timeout:
+                self.periodic_table.update_timer()
+                
+                # Verify time has reached 0 and the timers are stopped
+                self.assertEqual(self.periodic_table.time_remaining, 0)
+                self.assertFalse(self.periodic_table.quiz_timer.isActive())
+                mock_handle_timeout.assert_called_once()
+    
+    def test_deadline_timer_fires_timeout(self):
+        """Test that the single-shot deadline timer drives handle_timeout"""
+        with patch.object(self.periodic_table, 'handle_timeout') as mock_handle_timeout:
+            self.periodic_table.init_timer()
+            self.periodic_table.quiz_timer.start(1)
+            QTest.qWait(50)
             mock_handle_timeout.assert_called_once()
 
 if __name__ == '__main__':
@@ -0,0 +1,217 @@
+import sys
+import os
+import subprocess
+import unittest
+
+# Set up path so we can import the package modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from periodictable.quiz_engine import (QuizEngine, Question, QUESTION_TYPES,
+                                       FAMILY_CATEGORIES, EASY, production_texts,
+                                       answers_match, element_category)
+from periodictable.similarity import edit_distance, config_tokens
+from periodictable.matching import AnswerMatcher, bigrams, fold_answer
+from periodictable.elements_data import elements
+
+
+class TestQuizEngine(unittest.TestCase):
+    """Test case for the headless quiz engine"""
+
+    def test_seeded_generation_is_reproducible(self):
+        """Test that the same seed yields the same question set"""
+        first = list(QuizEngine(seed=42).questions(50))
+        second = list(QuizEngine(seed=42).questions(50))
+        self.assertEqual(first, second)
+        self.assertNotEqual(first, list(QuizEngine(seed=43).questions(50)))
+
+    def test_question_fields(self):
+        """Test that every question type builds a well-formed question"""
+        engine = QuizEngine(seed=1)
+        for question_type in QUESTION_TYPES:
+            question = engine.generate("Na", question_type)
+            self.assertIsInstance(question, Question)
+            self.assertEqual(question.type, question_type)
+            self.assertEqual(question.symbol, "Na")
+            self.assertIn(question.answer, question.options)
+            self.assertEqual(len(question.options), 4)
+            self.assertEqual(len(set(question.options)), 4)
+
+    def test_impossible_question(self):
+        """Test that production questions are refused for elements without methods"""
+        engine = QuizEngine(seed=1)
+        self.assertIsNone(engine.generate("He", "production"))
+        self.assertIsNone(engine.generate("He", "production_reverse"))
+        self.assertEqual(engine.generate("He", "symbol").answer, elements["He"]["nom"])
+
+    def test_free_response(self):
+        """Test that free response questions carry no options"""
+        engine = QuizEngine(seed=3, multiple_choice=False)
+        self.assertTrue(all(q.options is None for q in engine.questions(20)))
+
+    def test_production_texts(self):
+        """Test flattening of the production method layouts"""
+        texts = production_texts({"a": "x", "b": ["y", "z"], "c": {"reaction": "r", "conditions": "c"}})
+        self.assertEqual(texts, ["x", "y", "z", "r"])
+        self.assertEqual(production_texts(None), [])
+
+    def test_grading(self):
+        """Test answer grading ignores case, accents and spaces"""
+        engine = QuizEngine(seed=5)
+        question = engine.generate("Ne", "symbol")
+        self.assertTrue(engine.grade(question, question.answer.upper()))
+        self.assertFalse(engine.grade(question, "Argon"))
+        self.assertFalse(answers_match("", "Neon"))
+
+    def test_category_map_covers_families(self):
+        """Test that every French family of the dataset has a category"""
+        self.assertEqual({e["famille"] for e in elements.values()} - set(FAMILY_CATEGORIES), set())
+
+    def test_default_scope_filters_families(self):
+        """Test that transition metals and rare earths are left out by default"""
+        engine = QuizEngine(seed=0)
+        self.assertNotIn("Fe", engine.symbols)
+        self.assertNotIn("U", engine.symbols)
+        self.assertIn("Na", engine.symbols)
+        self.assertTrue(all(element_category(elements[q.symbol]) == "main_group"
+                            for q in engine.questions(200)))
+
+        transition = QuizEngine(seed=0, categories=("transition",))
+        self.assertIn("Fe", transition.symbols)
+        self.assertNotIn("Na", transition.symbols)
+
+    def test_difficulty_filter(self):
+        """Test that the easy level keeps only the first twenty elements"""
+        engine = QuizEngine(seed=0, max_difficulty=EASY)
+        self.assertTrue(all(elements[s]["num"] <= 20 for s in engine.symbols))
+        self.assertIn("Ca", engine.symbols)
+        with self.assertRaises(ValueError):
+            QuizEngine(categories=("rare_earth",), max_difficulty=EASY)
+
+    def test_pool_has_only_valid_pairs(self):
+        """Test that every pooled pair builds a question without retries"""
+        engine = QuizEngine(seed=0)
+        self.assertNotIn(("He", "production"), engine.pool)
+        for symbol, question_type in engine.pool:
+            self.assertIsNotNone(engine.generate(symbol, question_type))
+
+    def test_production_distractors_from_other_elements(self):
+        """Test that another method of the same element is never a distractor"""
+        engine = QuizEngine(seed=0)
+        own = {answer for _, answer in engine.payloads[("H", "production_reverse")]}
+        for _ in range(50):
+            question = engine.generate("H", "production_reverse")
+            self.assertEqual(len(own.intersection(question.options)), 1)
+
+    def test_no_qt_import(self):
+        """Test that the engine runs without importing Qt"""
+        package_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..'))
+        code = ("import sys; from periodictable.quiz_engine import QuizEngine; "
+                "list(QuizEngine(seed=0).questions(100)); "
+                "print(any(m.startswith('PyQt5') for m in sys.modules))")
+        output = subprocess.run([sys.executable, "-c", code], cwd=package_dir,
+                                capture_output=True, text=True, check=True).stdout
+        self.assertEqual(output.strip(), "False")
+
+
+class TestSimilarityIndex(unittest.TestCase):
+    """Test case for similarity-ranked distractors"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Build one engine for all tests"""
+        cls.engine = QuizEngine(seed=7)
+
+    def test_edit_distance(self):
+        """Test Levenshtein distance on strings and token lists"""
+        self.assertEqual(edit_distance("flourine", "fluorine"), 2)
+        self.assertEqual(edit_distance("aluminum", "aluminium"), 1)
+        self.assertEqual(edit_distance(("[Ne]", "3s2"), ("[Ne]", "3s2", "3p1")), 1)
+        self.assertEqual(edit_distance("abcdef", "z", limit=2), 3)
+        self.assertEqual(config_tokens("[Ne] 3s² 3p⁵"), ("[Ne]", "3s2", "3p5"))
+
+    def test_name_distractors_are_related(self):
+        """Test that sodium's distractors are its group and grid neighbours"""
+        nearest = self.engine.similarity.nearest("symbol", "Na")
+        self.assertEqual(set(nearest[:2]), {"Li", "K"})
+        self.assertIn("Mg", nearest[:5])
+        question = self.engine.generate("Na", "symbol")
+        names = {elements[s]["nom"] for s in nearest}
+        self.assertTrue(set(question.options) - {question.answer} <= names)
+
+    def test_config_distractors_are_close(self):
+        """Test that configuration distractors differ by few subshells"""
+        question = self.engine.generate("Cl", "electron_config_reverse")
+        for option in question.options:
+            self.assertLessEqual(edit_distance(config_tokens(option),
+                                               config_tokens(question.answer)), 1)
+
+    def test_production_distractors_share_species(self):
+        """Test that production distractors come from chemically related elements"""
+        self.assertIn("Br", self.engine.similarity.nearest("production", "Cl")[:3])
+
+    def test_no_padding(self):
+        """Test that options are always unique and never padded"""
+        for question in self.engine.questions(500):
+            self.assertEqual(len(question.options), 4)
+            self.assertEqual(len(set(question.options)), 4)
+            self.assertNotIn("N/A", question.options)
+
+
+class TestAnswerMatcher(unittest.TestCase):
+    """Test case for fuzzy free-response matching"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Build one engine for all tests"""
+        cls.engine = QuizEngine(seed=11, multiple_choice=False)
+        cls.matcher = cls.engine.matcher
+
+    def test_fold_answer(self):
+        """Test folding of case, accents, scripts and whitespace"""
+        self.assertEqual(fold_answer(" Néon "), "neon")
+        self.assertEqual(fold_answer("[Ne] 3s² 3p⁴"), fold_answer("[ne]3s2 3p4"))
+
+    def test_near_misses_accepted(self):
+        """Test that common misspellings are accepted"""
+        for answer, expected in [("Flourine", "Fluorine"), ("Aluminum", "Aluminium"),
+                                 ("[Ne] 3s2 3p4", "[Ne] 3s² 3p⁴")]:
+            result = self.matcher.match(answer, expected)
+            self.assertTrue(result.correct, answer)
+
+    def test_other_element_rejected(self):
+        """Test that a near-miss which is another element's name is wrong"""
+        result = self.matcher.match("Cerium", "Cesium")
+        self.assertFalse(result.correct)
+        self.assertEqual(result.closest_symbol, "Ce")
+
+    def test_closest_element_reported(self):
+        """Test that wrong answers report the closest element"""
+        result = self.matcher.match("Chlorin", "Sodium")
+        self.assertFalse(result.correct)
+        self.assertEqual(result.closest_symbol, "Cl")
+        self.assertIsNone(self.matcher.match("xyz", "Neon").closest_symbol)
+
+    def test_threshold(self):
+        """Test that a zero threshold requires exact (folded) answers"""
+        strict = AnswerMatcher([("F", "Fluorine")], threshold=0)
+        self.assertFalse(strict.match("Flourine", "Fluorine").correct)
+        self.assertTrue(strict.match("FLUORINE", "Fluorine").correct)
+
+    def test_closest_matches_linear_scan(self):
+        """Test that bigram-filtered lookups find exactly what a full scan finds"""
+        keys = list(self.matcher.answers)
+        for query in ["flourine", "magnesum", "1s22s2", "oxigen", "xenn", "ab"]:
+            for radius in (1, 2, 3):
+                expected = sorted((edit_distance(query, k), k) for k in keys
+                                  if edit_distance(query, k) <= radius)
+                self.assertEqual(self.matcher.closest(query, radius), expected)
+        self.assertEqual(bigrams("neon"), {"ne", "eo", "on"})
+
+    def test_engine_grading(self):
+        """Test that free responses are graded fuzzily by the engine"""
+        question = self.engine.generate("F", "symbol")
+        self.assertTrue(self.engine.grade(question, "Flourine"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import sys
+import os
+import unittest
+
+# Set up path so we can import the package modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from periodictable.reactions import (
+    parse_reaction, balance, balance_text, balance_all, format_reaction, validation_report,
+    BALANCED, REBALANCED, UNBALANCEABLE, UNPARSED
+)
+from periodictable.reaction_network import ReactionNetwork, reaction_network, reaction_key
+
+
+class TestReactions(unittest.TestCase):
+    """Test case for reaction parsing and balancing"""
+
+    def test_parse_strips_prose(self):
+        """Test that prefixes and trailing annotations are ignored"""
+        reaction = parse_reaction("Oxidation of iodide using chlorine: 2 I⁻ + Cl₂ → I₂ + 2 Cl⁻ (in brine)")
+        self.assertEqual([s for _, s in reaction.reactants], ["I⁻", "Cl₂"])
+        self.assertEqual([s for _, s in reaction.products], ["I₂", "Cl⁻"])
+
+    def test_balanced_as_written(self):
+        """Test that a correct equation keeps its coefficients"""
+        coefficients, status, _ = balance(parse_reaction("CH4 + H2O → 3 H2 + CO"))
+        self.assertEqual(status, BALANCED)
+        self.assertEqual(coefficients, (1, 1, 3, 1))
+
+    def test_rebalanced(self):
+        """Test that wrong coefficients are replaced by a balanced set"""
+        reaction, coefficients, status, _ = balance_text("2 B₂O₃ + 7 C → 4 B + 3 CO₂")
+        self.assertEqual(status, REBALANCED)
+        self.assertEqual(format_reaction(reaction, coefficients), "2 B₂O₃ + 3 C → 4 B + 3 CO₂")
+
+    def test_fractional_coefficients(self):
+        """Test that ½ and decimal coefficients are scaled to integers"""
+        _, coefficients, status, _ = balance_text("KClO₃ + 6 P → KCl + 1.5 P₄O₁₀")
+        self.assertEqual(status, REBALANCED)
+        self.assertEqual(coefficients, (10, 12, 10, 3))
+
+    def test_charge_conservation(self):
+        """Test that ionic equations balance charge as well as atoms"""
+        _, coefficients, status, _ = balance_text("Zn + 2 H3O⁺ → H2 + Zn²⁺ + 2 H2O")
+        self.assertEqual(status, BALANCED)
+
+    def test_unbalanceable_and_prose(self):
+        """Test statuses for spectator species and descriptive text"""
+        self.assertEqual(balance_text("KF + HF → F₂ + H₂")[2], UNBALANCEABLE)
+        self.assertEqual(balance_text("Nitrogen is separated from air")[2], UNPARSED)
+
+    def test_batch_report(self):
+        """Test the batch run over a production_methods-style mapping"""
+        methods = {"X": {"a": ["CO + H2O → H2 + CO2"], "b": {"reaction": "H2 + O2 → H2O", "conditions": ""}}}
+        results = balance_all(methods)
+        self.assertEqual([r.status for r in results], [BALANCED, REBALANCED])
+        self.assertIn("2 entries", validation_report(results))
+
+
+class TestReactionNetwork(unittest.TestCase):
+    """Test case for the species/reaction graph"""
+
+    def setUp(self):
+        """Build a small network"""
+        methods = {"X": {
+            "a": "CH4 + H2O → 3 H2 + CO",
+            "b": "N₂ + 3 H₂ → 2 NH₃",
+            "c": "4 NH₃ + 5 O₂ → 4 NO + 6 H₂O",
+            "d": "CO₂ + C(s) ⇌ 2 CO",
+        }}
+        self.network = ReactionNetwork(balance_all(methods))
+
+    def test_shortest_route(self):
+        """Test BFS route through intermediate species in any notation"""
+        route = self.network.shortest_route("CH4", "NO")
+        self.assertEqual(route, ["CH4 + H2O → 3 H2 + CO", "N₂ + 3 H₂ → 2 NH₃", "4 NH₃ + 5 O₂ → 4 NO + 6 H₂O"])
+        self.assertIsNone(self.network.shortest_route("NO", "CH4"))
+
+    def test_equilibrium_is_bidirectional(self):
+        """Test that ⇌ reactions can be followed both ways"""
+        self.assertIn("CO2", self.network.reachable("CO"))
+        self.assertIn("CO", self.network.reachable("CO2"))
+
+    def test_made_from_used_to_make(self):
+        """Test elemental form lookups on the shipped dataset"""
+        network = reaction_network()
+        self.assertTrue(any("Cl₂" in r for r in network.made_from("Cl")))
+        self.assertTrue(any("Br₂" in r for r in network.used_to_make("Cl")))
+
+    def test_permuted_duplicates_merged(self):
+        """Test that one equation written in different orders is a single reaction"""
+        methods = {"X": {"a": "2 I⁻ + Cl₂ → I₂ + 2 Cl⁻", "b": "CO₂ + C ⇌ 2 CO"},
+                   "Y": {"a": "Cl2 + 2 I⁻ → 2 Cl⁻ + I2", "b": "2 CO ⇌ C + CO₂"}}
+        network = ReactionNetwork(balance_all(methods))
+        self.assertEqual(len(network.reactions), 2)
+        self.assertEqual(network.sources[0], [("X", "a"), ("Y", "a")])
+
+        made = reaction_network().made_from("I")
+        keys = [reaction_key(parse_reaction(r)) for r in made]
+        self.assertEqual(len(set(keys)), len(made))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+import sys
+import os
+import tempfile
+import unittest
+
+# Set up path so we can import the package modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from periodictable.normalization import tokenize, normalize_text
+from periodictable.search import SearchIndex, load_or_build_index, build_element_trie
+
+
+class TestSearchIndex(unittest.TestCase):
+    """Test case for the inverted search index"""
+
+    @classmethod
+    def setUpClass(cls):
+        """Build the index once for all tests"""
+        cls.index = SearchIndex.build()
+
+    def test_tokenize_folds_scripts_and_accents(self):
+        """Test that tokenisation folds the same way as normalize_text"""
+        self.assertEqual(tokenize("Cl₂ + 2 I⁻"), ["cl2", "2", "i"])
+        self.assertEqual(tokenize("Roentgénium"), [normalize_text("Roentgénium")])
+        self.assertEqual(tokenize("electrolysis_of_LiCl"), ["electrolysis", "of", "licl"])
+
+    def test_search_reactions(self):
+        """Test that production methods and reaction species are searchable"""
+        symbols = {hit.symbol for hit in self.index.search("electrolysis")}
+        self.assertTrue({"Li", "Na", "O"} <= symbols)
+        symbols = {hit.symbol for hit in self.index.search("cl2")}
+        self.assertIn("Br", symbols)
+        self.assertIn("I", symbols)
+
+    def test_name_ranks_first(self):
+        """Test that name and symbol matches outrank mentions in reactions"""
+        self.assertEqual(self.index.search("Chlorine")[0].symbol, "Cl")
+        self.assertEqual(self.index.search("fe")[0].symbol, "Fe")
+
+    def test_all_tokens_required(self):
+        """Test AND semantics of multi-token queries"""
+        self.assertEqual([hit.symbol for hit in self.index.search("electrolysis lithium")], ["Li"])
+        self.assertEqual(self.index.search("electrolysis xenonium"), [])
+
+    def test_cache_roundtrip(self):
+        """Test that the cache file is written and reloaded"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "index.json")
+            built = load_or_build_index(path)
+            self.assertTrue(os.path.exists(path))
+            loaded = load_or_build_index(path)
+            self.assertEqual(loaded.search("halogène"), built.search("halogène"))
+
+
+class TestPrefixTrie(unittest.TestCase):
+    """Test case for the type-ahead trie"""
+
+    def setUp(self):
+        """Build the element trie"""
+        self.trie = build_element_trie()
+
+    def test_name_symbol_and_number_prefixes(self):
+        """Test lookups by name, symbol and atomic number prefixes"""
+        self.assertIn("Cl", self.trie.lookup("chl"))
+        self.assertIn("Fe", self.trie.lookup("fe"))
+        self.assertEqual(self.trie.lookup("118"), {"Og"})
+        self.assertTrue({"H", "He", "Hf"} <= self.trie.lookup("h"))
+
+    def test_accent_folding_and_misses(self):
+        """Test that keys are folded like normalize_text and misses are empty"""
+        self.assertEqual(self.trie.lookup(normalize_text("Roentgé")), {"Rg"})
+        self.assertEqual(self.trie.lookup("zzz"), frozenset())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,160 @@
+import sys
+import os
+import asyncio
+import json
+import unittest
+
+# Set up path so we can import the package modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from periodictable.server import (QuizServer, connect, accept_key, encode_frame, read_frame,
+                                  OP_TEXT, OP_PING)
+from periodictable.quiz_engine import QuizEngine
+
+# One engine for every test server (building it dominates server startup)
+ENGINE = QuizEngine(seed=0, multiple_choice=False)
+
+
+async def http_get(port, path):
+    """Plain HTTP GET against the local server"""
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: localhost\r\n\r\n".encode())
+    response = await reader.read()
+    writer.close()
+    head, _, body = response.partition(b"\r\n\r\n")
+    return int(head.split()[1]), body
+
+
+class TestWebSocketProtocol(unittest.IsolatedAsyncioTestCase):
+    """Test case for the RFC 6455 framing"""
+
+    def test_accept_key(self):
+        """Test the handshake example of RFC 6455"""
+        self.assertEqual(accept_key("dGhlIHNhbXBsZSBub25jZQ=="), "s3pPLMBiTxaQ9kYGzzhZRbK+xOo=")
+
+    async def test_frame_round_trip(self):
+        """Test masked and unmasked frames of every length encoding"""
+        for size in (0, 5, 300, 70000):
+            for mask in (False, True):
+                reader = asyncio.StreamReader()
+                payload = bytes(range(256)) * (size // 256) + bytes(size % 256)
+                reader.feed_data(encode_frame(payload, OP_TEXT, mask))
+                if size > 65536:
+                    with self.assertRaises(ValueError):
+                        await read_frame(reader)
+                    continue
+                self.assertEqual(await read_frame(reader), (True, OP_TEXT, payload))
+
+
+class TestQuizServer(unittest.IsolatedAsyncioTestCase):
+    """Test case for quiz sessions served over localhost"""
+
+    async def asyncSetUp(self):
+        """Start a server on a free port"""
+        self.server = QuizServer(ENGINE, questions=3, deadline=5.0, flush_interval=0.05)
+        self.port = await self.server.start("127.0.0.1", 0)
+
+    async def asyncTearDown(self):
+        """Stop the server"""
+        await self.server.close()
+
+    def session_of(self, name):
+        """Server-side session of a connected student"""
+        return next(s for s in self.server.sessions.values() if s.name == name)
+
+    async def test_full_session(self):
+        """Test a correct answer, a wrong one and a skip, then the results"""
+        ws = await connect("127.0.0.1", self.port)
+        await ws.send_json({"type": "join", "name": "ada", "multiple_choice": False})
+
+        question = await ws.receive_json()
+        self.assertEqual(question["type"], "question")
+        self.assertIsNone(question["options"])
+        await ws.send_json({"type": "answer", "id": question["id"],
+                            "answer": self.session_of("ada").question.answer.upper()})
+        result = await ws.receive_json()
+        self.assertTrue(result["correct"])
+        self.assertEqual(result["score"], 1)
+
+        question = await ws.receive_json()
+        await ws.send_json({"type": "answer", "id": question["id"], "answer": "xyz"})
+        self.assertFalse((await ws.receive_json())["correct"])
+
+        question = await ws.receive_json()
+        await ws.send_json({"type": "skip", "id": question["id"]})
+        self.assertTrue((await ws.receive_json())["skipped"])
+        self.assertEqual(await ws.receive_json(), {"type": "finished", "score": 1, "total": 3})
+        self.assertIsNone(await ws.receive_json())
+
+        status, body = await http_get(self.port, "/leaderboard")
+        self.assertEqual(status, 200)
+        self.assertEqual([(e["name"], e["score"]) for e in json.loads(body)], [("ada", 1)])
+        await asyncio.sleep(0.1)
+        self.assertEqual([row[3] for row in self.server.store.history("ada")], [1, 0, 0])
+
+    async def test_multiple_choice_and_ping(self):
+        """Test that multiple choice sessions get options and pings are answered"""
+        ws = await connect("127.0.0.1", self.port)
+        ws.writer.write(encode_frame(b"hi", OP_PING, mask=True))
+        await ws.send_json({"type": "join", "name": "bob"})
+        question = await ws.receive_json()
+        self.assertEqual(len(question["options"]), 4)
+        await ws.send_json({"type": "answer", "id": question["id"], "answer": question["options"][0]})
+        self.assertIn("correct", await ws.receive_json())
+        await ws.close()
+
+    async def test_server_side_deadline(self):
+        """Test that unanswered questions time out on the server"""
+        self.server.deadline = 0.05
+        ws = await connect("127.0.0.1", self.port)
+        await ws.send_json({"type": "join", "name": "eve"})
+        question = await ws.receive_json()
+        result = await ws.receive_json()
+        self.assertTrue(result["timed_out"])
+        await asyncio.sleep(0.1)
+        # A late answer to an expired question is ignored
+        await ws.send_json({"type": "answer", "id": question["id"], "answer": "late"})
+        self.assertEqual((await ws.receive_json())["type"], "question")
+        await ws.close()
+
+    async def test_non_object_messages_ignored(self):
+        """Test that JSON values other than objects are skipped like malformed JSON"""
+        ws = await connect("127.0.0.1", self.port)
+        for junk in ("hi", [1, 2], 3):
+            await ws.send_json(junk)
+        await ws.send_json({"type": "join", "name": "mal", "multiple_choice": False})
+        question = await ws.receive_json()
+        self.assertEqual(question["type"], "question")
+        await ws.send_json([1, 2])
+        await ws.send_json({"type": "skip", "id": question["id"]})
+        self.assertTrue((await ws.receive_json())["skipped"])
+        await ws.close()
+
+    async def test_http_routes(self):
+        """Test the health route and unknown paths"""
+        status, body = await http_get(self.port, "/health")
+        self.assertEqual((status, json.loads(body)), (200, {"sessions": 0}))
+        self.assertEqual((await http_get(self.port, "/missing"))[0], 404)
+
+    async def test_concurrent_sessions(self):
+        """Test two hundred simultaneous students on one event loop"""
+        async def student(i):
+            ws = await connect("127.0.0.1", self.port)
+            await ws.send_json({"type": "join", "name": f"s{i}", "multiple_choice": i % 2 == 0})
+            while True:
+                message = await ws.receive_json()
+                if message["type"] == "finished":
+                    await ws.close()
+                    return message["total"]
+                if message["type"] == "question":
+                    await ws.send_json({"type": "answer", "id": message["id"], "answer": "Neon"})
+
+        totals = await asyncio.wait_for(asyncio.gather(*(student(i) for i in range(200))), 30)
+        self.assertEqual(totals, [3] * 200)
+        self.assertEqual(len(self.server.leaderboard), 200)
+        await asyncio.sleep(0.1)
+        self.assertEqual(len(self.server.store.history()), 600)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,126 @@
+import sys
+import os
+import tempfile
+import unittest
+
+# Set up path so we can import the package modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from periodictable.spaced_repetition import (ProgressStore, ReviewScheduler, new_item, sm2_update,
+                                             PERFECT, CORRECT, WRONG, MIN_EASINESS, DAY,
+                                             RELEARN_SECONDS)
+
+
+class FakeClock:
+    """Manually advanced clock"""
+
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+class TestSM2(unittest.TestCase):
+    """Test case for the SM-2 update rule"""
+
+    def test_intervals_grow(self):
+        """Test the 1, 6, 6 * EF day progression of correct answers"""
+        state = new_item("Na", "symbol", 0)
+        intervals = []
+        for _ in range(4):
+            state = sm2_update(state, PERFECT, 0)
+            intervals.append(state.interval)
+        self.assertEqual(intervals[:2], [1.0, 6.0])
+        self.assertGreater(intervals[2], 6.0 * 2.5)
+        self.assertGreater(intervals[3], intervals[2])
+        self.assertEqual(state.due, intervals[3] * DAY)
+
+    def test_lapse_resets(self):
+        """Test that a wrong answer resets repetitions and comes back soon"""
+        state = sm2_update(sm2_update(new_item("Na", "symbol", 0), CORRECT, 0), CORRECT, 0)
+        failed = sm2_update(state, WRONG, 100)
+        self.assertEqual(failed.repetitions, 0)
+        self.assertEqual(failed.lapses, 1)
+        self.assertEqual(failed.due, 100 + RELEARN_SECONDS)
+        self.assertLess(failed.easiness, state.easiness)
+
+    def test_easiness_floor(self):
+        """Test that easiness never drops below the SM-2 minimum"""
+        state = new_item("Na", "symbol", 0)
+        for _ in range(20):
+            state = sm2_update(state, WRONG, 0)
+        self.assertEqual(state.easiness, MIN_EASINESS)
+
+
+class TestProgressStore(unittest.TestCase):
+    """Test case for the SQLite progress store and review scheduler"""
+
+    def setUp(self):
+        """Open a store in a temporary directory"""
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, "progress.sqlite3")
+        self.store = ProgressStore(self.path, batch_size=3)
+
+    def tearDown(self):
+        """Close the store and remove the directory"""
+        self.store.close()
+        self.tmpdir.cleanup()
+
+    def count_answers(self):
+        """Answers already written to disk (ignoring the queue)"""
+        return self.store.connection.execute("SELECT COUNT(*) FROM answers").fetchone()[0]
+
+    def test_writes_are_batched(self):
+        """Test that answers are queued until the batch is full"""
+        scheduler = ReviewScheduler(self.store, "ada", [("H", "symbol"), ("He", "symbol")],
+                                    clock=FakeClock())
+        scheduler.record(("H", "symbol"), True, PERFECT)
+        scheduler.record(("He", "symbol"), False, WRONG)
+        self.assertEqual(self.count_answers(), 0)
+        scheduler.record(("H", "symbol"), True, PERFECT)
+        self.assertEqual(self.count_answers(), 3)
+
+    def test_resume_after_reopen(self):
+        """Test that states and history survive closing the database"""
+        clock = FakeClock()
+        items = [("H", "symbol"), ("He", "symbol"), ("Li", "symbol")]
+        scheduler = ReviewScheduler(self.store, "ada", items, clock=clock)
+        scheduler.record(scheduler.next_item(), True, PERFECT)
+        scheduler.record(scheduler.next_item(), False, WRONG)
+        self.store.close()
+
+        self.store = ProgressStore(self.path)
+        self.assertEqual(len(self.store.history("ada")), 2)
+        self.assertEqual(self.store.history("bob"), [])
+        resumed = ReviewScheduler(self.store, "ada", items, clock=clock)
+        self.assertEqual(list(resumed.new_items), [("Li", "symbol")])
+        self.assertEqual(resumed.states[("H", "symbol")].repetitions, 1)
+
+        # The failed item comes back before the new one once it is due
+        clock.now += RELEARN_SECONDS
+        self.assertEqual(resumed.next_item(), ("He", "symbol"))
+        self.assertEqual(resumed.next_item(), ("Li", "symbol"))
+        self.assertIsNone(resumed.next_item())
+        self.assertEqual(self.store.due_count("ada", clock.now), 1)
+
+    def test_due_items_in_due_order(self):
+        """Test that due items are served earliest first"""
+        clock = FakeClock()
+        items = [(symbol, "symbol") for symbol in ("H", "He", "Li")]
+        scheduler = ReviewScheduler(self.store, "ada", items, clock=clock)
+        for item in reversed(items):
+            clock.now += 1
+            scheduler.record(item, False, WRONG)
+        clock.now += RELEARN_SECONDS
+        self.assertEqual([scheduler.next_item() for _ in items], list(reversed(items)))
+
+    def test_new_item_limit(self):
+        """Test that a session introduces at most new_per_session items"""
+        items = [(symbol, "symbol") for symbol in ("H", "He", "Li", "Be")]
+        scheduler = ReviewScheduler(self.store, "ada", items, new_per_session=2, clock=FakeClock())
+        self.assertEqual([scheduler.next_item() for _ in range(3)], items[:2] + [None])
+
+
+if __name__ == '__main__':
+    unittest.main()
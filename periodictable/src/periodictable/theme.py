@@ -0,0 +1,150 @@
+"""
+Application Theme Engine
+Compiles one application-wide Qt stylesheet per theme and installs it on the QApplication.
+Widgets are styled by object name (e.g. QPushButton#exitButton) and per-family colours
+by the `family` dynamic property, so no widget needs its own setStyleSheet call and a
+theme switch is a single repolish.
+"""
+
+from functools import lru_cache
+
+try:
+    from .elements_data import colors
+    from .normalization import normalize_text
+except ImportError:
+    from elements_data import colors
+    from normalization import normalize_text
+
+# Colours of each widget role; families default to the `colors` palette
+THEMES = {
+    "light": {
+        "window": None,  # keep the platform default
+        "text": "#000000",
+        "muted": "#666666",
+        "welcome_background": "#FF7F50",
+        "welcome_button": "#6C63FF",
+        "welcome_button_hover": "#45a049",
+        "option": "#CF9FFF",
+        "option_hover": "#7F00FF",
+        "exit": "#f44336",
+        "exit_hover": "#d32f2f",
+        "new": "#2196F3",
+        "new_hover": "#1976D2",
+        "submit": "#4CAF50",
+        "submit_hover": "#388E3C",
+        "border": "#cccccc",
+        "families": dict(colors),
+    },
+    "dark": {
+        "window": "#2B2B2B",
+        "text": "#EEEEEE",
+        "muted": "#AAAAAA",
+        "welcome_background": "#5A3A2E",
+        "welcome_button": "#5A54CC",
+        "welcome_button_hover": "#3A7D3E",
+        "option": "#5E4A7A",
+        "option_hover": "#7F00FF",
+        "exit": "#B23A32",
+        "exit_hover": "#8E2B25",
+        "new": "#1B6AAE",
+        "new_hover": "#14507F",
+        "submit": "#3A7D3E",
+        "submit_hover": "#2B5E2E",
+        "border": "#555555",
+        "families": dict(colors),
+    },
+}
+
+DEFAULT_THEME = "light"
+
+
+def family_key(family):
+    """
+    ASCII identifier of a family for use in `family` property selectors.
+
+    Args:
+        family (str): Family name from elements_data (e.g. 'métal alcalin')
+
+    Returns:
+        str: Folded key (e.g. 'metal-alcalin')
+    """
+    return normalize_text(family.replace(" ", "-"))
+
+
+@lru_cache(maxsize=None)
+def compile_stylesheet(name=DEFAULT_THEME):
+    """
+    Build the application stylesheet for a theme (cached per theme name).
+
+    Args:
+        name (str): Theme name, a key of THEMES
+
+    Returns:
+        str: Qt stylesheet
+    """
+    t = THEMES[name]
+    rules = []
+    if t["window"]:
+        rules += [
+            f"QMainWindow, QDialog {{ background-color: {t['window']}; }}",
+            f"QLabel {{ color: {t['text']}; }}",
+        ]
+    rules += [
+        f"""QTextEdit#welcomeText {{
+            background-color: {t['welcome_background']};
+            border: 1px solid {t['border']};
+            padding: 10px;
+            font-size: 14px;
+        }}""",
+        f"""QPushButton#welcomeButton {{
+            background-color: {t['welcome_button']};
+            color: white;
+            font-size: 16px;
+            padding: 10px;
+            border-radius: 5px;
+        }}""",
+        f"QPushButton#welcomeButton:hover {{ background-color: {t['welcome_button_hover']}; }}",
+        f"QLabel#questionLabel {{ font-size: 16px; color: {t['text']}; padding: 10px; }}",
+        f"""QPushButton#optionButton {{
+            padding: 10px;
+            margin: 5px;
+            background-color: {t['option']};
+            border: 1px solid {t['border']};
+        }}""",
+        f"QPushButton#optionButton:hover {{ background-color: {t['option_hover']}; }}",
+        "QLineEdit#answerInput { font-size: 14px; margin: 10px; }",
+    ]
+    for role, padding in (("exit", "8px 16px"), ("new", "8px 16px"), ("submit", "8px 24px")):
+        rules.append(f"QPushButton#{role}Button {{ padding: {padding}; margin: 5px; "
+                     f"background-color: {t[role]}; color: white; }}")
+        rules.append(f"QPushButton#{role}Button:hover {{ background-color: {t[role + '_hover']}; }}")
+    rules += [
+        "QLabel#sectionHeader { font-size: 14px; padding-top: 15px; }",
+        f"QLabel#sectionContent {{ font-size: 12px; color: {t['text']}; margin-left: 10px; }}",
+        f"QLabel#imageFallback {{ color: {t['muted']}; font-size: 14px; }}",
+        "QLabel#elementInfo { font-size: 14px; padding: 15px; }",
+        "QFrame#legendSwatch { border: 1px solid black; }",
+    ]
+    for family, color in t["families"].items():
+        rules.append(f'QFrame#legendSwatch[family="{family_key(family)}"] {{ background-color: {color}; }}')
+    return "\n".join(rules)
+
+
+def install_theme(app, name=DEFAULT_THEME):
+    """
+    Install a theme's stylesheet on the application.
+
+    Setting the application stylesheet repolishes every widget once; the call
+    is skipped when the theme is already installed.
+
+    Args:
+        app (QApplication): Running application instance
+        name (str): Theme name, a key of THEMES
+
+    Returns:
+        dict: The theme's colour table
+    """
+    stylesheet = compile_stylesheet(name)
+    if app.styleSheet() != stylesheet:
+        app.setStyleSheet(stylesheet)
+    return THEMES[name]
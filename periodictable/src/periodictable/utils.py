@@ -9,25 +9,80 @@ Features:
 
 import sys
 import os
-import random
-import unicodedata
+import getpass
+import math
+import sqlite3
+import time
+import uuid
 from PyQt5.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QLabel, QPushButton, QGridLayout, QMessageBox,
-    QHBoxLayout, QFrame, QInputDialog, QApplication, QScrollArea, QDialog, QLineEdit,
-    QDialogButtonBox, QTextEdit
+    QMainWindow, QWidget, QVBoxLayout, QLabel, QPushButton, QMessageBox,
+    QHBoxLayout, QFrame, QInputDialog, QApplication, QDialog, QLineEdit,
+    QDialogButtonBox, QTextEdit, QComboBox
 )
-from PyQt5.QtCore import Qt, QTimer, QEventLoop
-from PyQt5.QtGui import QFont, QPixmap
+from PyQt5.QtCore import Qt, QTimer
+from PyQt5.QtGui import QFont
 
 try:
     # First try relative import (when run as module)
     from .elements_data import elements, positions, colors, production_methods
+    from .reaction_network import reaction_network
+    from .normalization import normalize_text
+    from .search import load_or_build_index, build_element_trie
+    from .table_widget import PeriodicTableWidget, ColorScaleLegend
+    from .theme import install_theme, family_key, DEFAULT_THEME
+    from .element_dialog import ElementInfoDialog, ElementContent, LRUCache
+    from .image_loader import StructureImageLoader
+    from .diagnostics import MemoryMonitor, format_snapshot
+    from .quiz_dialog import QuizDialog
+    from .quiz_engine import QuizEngine, answers_match
+    from .spaced_repetition import (ProgressStore, ReviewScheduler, DEFAULT_DB_PATH,
+                                    PERFECT, WRONG, BLACKOUT)
+    from .adaptive import ItemBank, AdaptiveSession
+    from .events import EventLog, AnswerEvent, DEFAULT_EVENT_LOG
+    from .heatmap import PROPERTIES, SYMBOLS, COLORMAP, property_heatmap
+    from .nuclide_chart import NuclideChartWindow
 except ImportError:
     # Fallback for direct execution - add current directory to path
     current_dir = os.path.dirname(os.path.abspath(__file__))
     if current_dir not in sys.path:
         sys.path.insert(0, current_dir)
     from elements_data import elements, positions, colors, production_methods
+    from reaction_network import reaction_network
+    from normalization import normalize_text
+    from search import load_or_build_index, build_element_trie
+    from table_widget import PeriodicTableWidget, ColorScaleLegend
+    from theme import install_theme, family_key, DEFAULT_THEME
+    from element_dialog import ElementInfoDialog, ElementContent, LRUCache
+    from image_loader import StructureImageLoader
+    from diagnostics import MemoryMonitor, format_snapshot
+    from quiz_dialog import QuizDialog
+    from quiz_engine import QuizEngine, answers_match
+    from spaced_repetition import (ProgressStore, ReviewScheduler, DEFAULT_DB_PATH,
+                                   PERFECT, WRONG, BLACKOUT)
+    from adaptive import ItemBank, AdaptiveSession
+    from events import EventLog, AnswerEvent, DEFAULT_EVENT_LOG
+    from heatmap import PROPERTIES, SYMBOLS, COLORMAP, property_heatmap
+    from nuclide_chart import NuclideChartWindow
+
+# Quiz states: no quiz, waiting for an answer, showing the result of a question
+QUIZ_IDLE = "idle"
+QUIZ_QUESTION = "question"
+QUIZ_FEEDBACK = "feedback"
+
+# Quiz modes: fixed random session, or spaced repetition of due items
+QUIZ_STANDARD = "standard"
+QUIZ_REVIEW = "review"
+QUIZ_ADAPTIVE = "adaptive"
+
+# Seconds allowed per question
+QUESTION_TIME = 30
+
+# Questions per standard quiz and maximum reviews per spaced repetition session
+QUIZ_LENGTH = 10
+REVIEW_SESSION_SIZE = 20
+
+# Table colouring: by element family, or by one of the heatmap PROPERTIES
+FAMILY_COLORS = "family"
 
 # ======================================================================================
 # MAIN APPLICATION CLASS
@@ -46,11 +101,32 @@ class PeriodicTableApp(QMainWindow):
         question_count (int): Number of questions answered in current quiz
         quiz_active (bool): Whether a quiz is currently running
         current_answer (str): Correct answer for current quiz question
-        time_remaining (int): Seconds remaining for current question
+        time_remaining (int): Whole seconds remaining for current question, as displayed
         quiz_type (str): Type of quiz ("Multiple Choice" or "Free Response")
         user_answer (str): User's selected answer in multiple choice
-        current_dialog (QDialog): Reference to currently open dialog
+        quiz_state (str): QUIZ_IDLE, QUIZ_QUESTION or QUIZ_FEEDBACK
+        quiz_dialog (QuizDialog): Persistent quiz dialog, created on first use
+        quiz_engine (QuizEngine): Headless question generator and grader
+        current_question (Question): Question currently displayed
+        quiz_mode (str): QUIZ_STANDARD, QUIZ_REVIEW or QUIZ_ADAPTIVE
+        student (str): Name under which review progress is stored
+        progress_store (ProgressStore): Review database, opened on first review
+        review_scheduler (ReviewScheduler): Due item queue of the review session
+        adaptive_session (AdaptiveSession): Ability estimate of the adaptive test
+        event_log (EventLog): Append-only answer log, opened on the first event
+        event_log_error (Exception): Why the event log could not be opened, or None
+        quiz_session (str): Identifier of the running quiz in the event log
+        question_started (float): Monotonic time at which the current question was shown
+        question_deadline (float): Monotonic time at which the current question expires
+        last_response_time (float): Seconds taken to answer the last question
+        info_dialog (ElementInfoDialog): Persistent element information dialog
+        element_content_cache (LRUCache): Prepared element dialog contents by symbol
+        image_loader (StructureImageLoader): Background structure image decoder
+        memory_monitor (MemoryMonitor): Samples live object and pixmap counts
     """
+
+    # Maximum number of prepared element dialog contents kept in memory
+    INFO_CACHE_SIZE = 32
     
     def __init__(self):
         """
@@ -69,12 +145,25 @@ class PeriodicTableApp(QMainWindow):
         self.setWindowTitle("Interactive Periodic Table + Quiz 🎲")
         self.setGeometry(100, 100, 600, 500)
 
+        # One compiled stylesheet for the whole application
+        self.theme = DEFAULT_THEME
+        install_theme(QApplication.instance(), self.theme)
+
         # Quiz game state variables
         self.score = 0
         self.question_count = 0
         self.quiz_active = False
         self.current_answer = None
-        self.time_remaining = 30
+        self.time_remaining = QUESTION_TIME
+
+        # Table colouring and the property heatmaps computed so far
+        self.color_property = FAMILY_COLORS
+        self.heatmaps = {}
+        self.nuclide_window = None
+
+        # Structure images are decoded off the GUI thread
+        self.image_loader = StructureImageLoader(self)
+        self.image_loader.imageReady.connect(self.on_structure_image)
 
         # Initialize UI components
         self.init_ui()
@@ -82,7 +171,38 @@ class PeriodicTableApp(QMainWindow):
 
         self.quiz_type = None
         self.user_answer = None
-        self.current_dialog = None
+        self.quiz_state = QUIZ_IDLE
+        self.quiz_dialog = None
+        self.quiz_engine = QuizEngine()
+        self.current_question = None
+
+        # Spaced repetition progress, stored per student
+        self.quiz_mode = QUIZ_STANDARD
+        self.student = getpass.getuser()
+        self.progress_store = None
+        self.review_scheduler = None
+        self.adaptive_session = None
+
+        # Every answer, skip and timeout is appended to the event log; if it
+        # cannot be opened the quiz runs without it
+        self.event_log = None
+        self.event_log_error = None
+        self.quiz_session = None
+        self.question_started = None
+        self.question_deadline = None
+        self.last_response_time = None
+
+        # Persistent element dialog and its prepared content
+        self.info_dialog = None
+        self.element_content_cache = LRUCache(self.INFO_CACHE_SIZE)
+
+        # Live object instrumentation; PERIODICTABLE_MEMORY_DEBUG=<seconds> logs samples
+        self.memory_monitor = MemoryMonitor(self, self.image_loader)
+        debug_interval = os.environ.get("PERIODICTABLE_MEMORY_DEBUG")
+        if debug_interval:
+            self.memory_monitor.timer.setInterval(int(float(debug_interval) * 1000))
+            self.memory_monitor.sampled.connect(lambda snapshot: print(format_snapshot(snapshot)))
+            self.memory_monitor.start()
 
         # Show initial information dialog
         self.show_initial_info()
@@ -102,6 +222,7 @@ class PeriodicTableApp(QMainWindow):
             None
         """
         info_dialog = QDialog(self)
+        info_dialog.setAttribute(Qt.WA_DeleteOnClose)
         info_dialog.setWindowTitle("Welcome to the Interactive Periodic Table!")
         info_dialog.setMinimumSize(600, 500)
 
@@ -148,33 +269,35 @@ class PeriodicTableApp(QMainWindow):
             <li>Match electron configuration</li>
             <li>Identify element by production method</li>
         </ul>""")
-        info_text.setStyleSheet("""
-            background-color: #FF7F50;
-            border: 1px solid #ccc;
-            padding: 10px;
-            font-size: 14px;
-        """)
+        info_text.setObjectName("welcomeText")
         layout.addWidget(info_text)
 
         # OK Button
         ok_btn = QPushButton("Got it! Let's Explore 🚀")
-        ok_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #6C63FF;
-                color: white;
-                font-size: 16px;
-                padding: 10px;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        ok_btn.setObjectName("welcomeButton")
         ok_btn.clicked.connect(info_dialog.accept)
         layout.addWidget(ok_btn)
 
         info_dialog.exec_()
 
+    def set_theme(self, name):
+        """
+        Switch the application theme at runtime.
+        
+        Installs the theme's compiled stylesheet on the QApplication (one
+        repolish of all widgets) and updates the family brushes of the
+        periodic table widget.
+        
+        Args:
+            name (str): Theme name (e.g. "light" or "dark")
+            
+        Returns:
+            None
+        """
+        theme = install_theme(QApplication.instance(), name)
+        self.table_widget.set_family_colors(theme["families"])
+        self.theme = name
+
     def init_ui(self):
         """
         Set up all user interface components for the main window.
@@ -212,11 +335,24 @@ class PeriodicTableApp(QMainWindow):
         self.timer_display.setFont(QFont("Arial", 16))
         main_layout.addWidget(self.timer_display)
 
-        # Quiz control button
+        # Quiz control buttons
+        quiz_buttons = QHBoxLayout()
         self.quiz_btn = QPushButton("🎲 Start Quiz")
         self.quiz_btn.setFixedHeight(50)
-        self.quiz_btn.clicked.connect(self.start_quiz)
-        main_layout.addWidget(self.quiz_btn)
+        self.quiz_btn.clicked.connect(lambda: self.start_quiz(QUIZ_STANDARD))
+        quiz_buttons.addWidget(self.quiz_btn)
+        self.review_btn = QPushButton("🔁 Review Due Elements")
+        self.review_btn.setFixedHeight(50)
+        self.review_btn.clicked.connect(lambda: self.start_quiz(QUIZ_REVIEW))
+        quiz_buttons.addWidget(self.review_btn)
+        self.adaptive_btn = QPushButton("🎯 Adaptive Test")
+        self.adaptive_btn.setFixedHeight(50)
+        self.adaptive_btn.clicked.connect(lambda: self.start_quiz(QUIZ_ADAPTIVE))
+        quiz_buttons.addWidget(self.adaptive_btn)
+        main_layout.addLayout(quiz_buttons)
+
+        # Full-text search over elements and reactions
+        self.init_search_bar(main_layout)
 
         # Periodic table grid
         self.init_periodic_table_grid(main_layout)
@@ -224,95 +360,186 @@ class PeriodicTableApp(QMainWindow):
         # Element family legend
         self.create_legend(main_layout)
 
-    def init_timer(self):
+    def init_search_bar(self, parent_layout):
         """
-        Initialize and configure the quiz timer.
+        Create the search box that highlights elements matching a query.
         
-        Creates a QTimer object with 1-second intervals and connects it to
-        the update_timer method for countdown functionality during quiz questions.
+        Builds the inverted search index and the type-ahead trie once, then
+        adds a filter box that dims non-matching tiles on every keystroke
+        and a search box whose query (e.g. "electrolysis" or "Cl₂") is run
+        when the user presses Enter, with a label showing the number of matches.
         
         Args:
-            None
+            parent_layout (QVBoxLayout): The parent layout to add the search bar to
             
         Returns:
             None
         """
-        self.quiz_timer = QTimer()
-        self.quiz_timer.setInterval(1000)  # 1 second intervals
-        self.quiz_timer.timeout.connect(self.update_timer)
+        self.search_index = load_or_build_index()
+        self.element_trie = build_element_trie()
+
+        search_layout = QHBoxLayout()
+        self.filter_input = QLineEdit()
+        self.filter_input.setPlaceholderText("Filter by name, symbol or number")
+        self.filter_input.textChanged.connect(self.filter_elements)
+        search_layout.addWidget(self.filter_input)
+
+        self.search_input = QLineEdit()
+        self.search_input.setPlaceholderText("Search elements and reactions (e.g. electrolysis, Cl₂)")
+        self.search_input.returnPressed.connect(self.run_search)
+        self.search_status = QLabel("")
+        search_layout.addWidget(self.search_input)
+        search_layout.addWidget(self.search_status)
+        parent_layout.addLayout(search_layout)
+
+    def run_search(self):
+        """
+        Run the current search query and highlight matching element tiles.
+        
+        An empty query clears the highlighting.
+        
+        Args:
+            None
+            
+        Returns:
+            list: SearchHit results in ranked order
+        """
+        query = self.search_input.text()
+        hits = self.search_index.search(query) if query.strip() else []
+        self.highlight_elements({hit.symbol for hit in hits})
+        self.search_status.setText(f"{len(hits)} match(es)" if query.strip() else "")
+        return hits
 
-    def init_periodic_table_grid(self, parent_layout):
+    def highlight_elements(self, symbols):
         """
-        Create the scrollable periodic table grid with element buttons.
+        Highlight the tiles of the given elements and clear all others.
         
-        Sets up a scroll area containing a grid layout with element buttons
-        positioned according to their standard periodic table locations.
-        Configures scrolling behavior and minimal spacing for compact display.
+        Only the tiles whose highlight state changed are repainted.
         
         Args:
-            parent_layout (QVBoxLayout): The parent layout to add the grid to
+            symbols (set): Symbols of the elements to highlight
             
         Returns:
             None
         """
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
+        self.table_widget.set_highlighted(symbols)
 
-        # Enable horizontal scrollbar to allow scrolling when table is wider than the window
-        scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarAlwaysOn)
+    def filter_elements(self, text):
+        """
+        Dim the tiles that do not match the type-ahead filter.
+        
+        Looks the normalised prefix up in the trie and repaints only the
+        tiles whose match state changed since the previous keystroke. An
+        empty filter shows every tile normally.
+        
+        Args:
+            text (str): Current filter text
+            
+        Returns:
+            frozenset: Symbols of the matching elements (all elements if empty)
+        """
+        prefix = normalize_text(text)
+        if not prefix:
+            self.table_widget.set_dimmed(())
+            return frozenset(positions)
 
-        grid_container = QWidget()
-        self.element_grid = QGridLayout(grid_container)
+        matches = self.element_trie.lookup(prefix)
+        self.table_widget.set_dimmed(symbol for symbol in positions if symbol not in matches)
+        return matches
 
-        # Reduce spacing and margins to minimum for compact display
-        self.element_grid.setSpacing(0)
-        self.element_grid.setContentsMargins(0, 0, 0, 0)
+    def init_timer(self):
+        """
+        Initialize the quiz deadline and countdown display timers.
+        
+        Question time is measured against a monotonic deadline rather than
+        by counting ticks. A single-shot precise timer fires once at the
+        deadline; a second single-shot timer refreshes the countdown label
+        only when the displayed whole second changes.
+        
+        Args:
+            None
+            
+        Returns:
+            None
+        """
+        self.quiz_timer = QTimer(self)
+        self.quiz_timer.setSingleShot(True)
+        self.quiz_timer.setTimerType(Qt.PreciseTimer)
+        self.quiz_timer.timeout.connect(self.handle_timeout)
+        self.display_timer = QTimer(self)
+        self.display_timer.setSingleShot(True)
+        self.display_timer.timeout.connect(self.update_timer)
+
+    def start_countdown(self):
+        """
+        Start the deadline of a newly shown question.
+        
+        Args:
+            None
+            
+        Returns:
+            None
+        """
+        self.question_started = time.monotonic()
+        self.question_deadline = self.question_started + QUESTION_TIME
+        self.quiz_timer.start(QUESTION_TIME * 1000)
+        self.update_timer()
 
-        # Create element buttons using position data
-        for symbol, (row, col) in positions.items():
-            self.create_element_button(symbol, row, col)
+    def stop_countdown(self):
+        """
+        Stop the deadline and display timers of the current question.
+        
+        Args:
+            None
+            
+        Returns:
+            None
+        """
+        self.quiz_timer.stop()
+        self.display_timer.stop()
 
-        scroll_area.setWidget(grid_container)
-        parent_layout.addWidget(scroll_area)
+    def response_time(self):
+        """
+        Seconds elapsed since the current question was shown.
+        
+        Args:
+            None
+            
+        Returns:
+            float: Monotonic elapsed time, capped at the question time
+            (None if no question was shown)
+        """
+        if self.question_started is None:
+            return None
+        return min(time.monotonic() - self.question_started, QUESTION_TIME)
 
-    def create_element_button(self, symbol, row, col):
+    def init_periodic_table_grid(self, parent_layout):
         """
-        Create an individual element button for the periodic table.
+        Create the periodic table view.
         
-        Creates a QPushButton for a specific element with appropriate styling
-        based on the element's family color. Connects the button to show
-        element information when clicked.
+        Adds a single custom-painted widget that draws every element tile
+        at its standard periodic table location and scales with the window.
+        Clicking a tile shows the element information dialog.
         
         Args:
-            symbol (str): The chemical symbol of the element (e.g., "H", "He")
-            row (int): Grid row position for the element
-            col (int): Grid column position for the element
+            parent_layout (QVBoxLayout): The parent layout to add the table to
             
         Returns:
             None
         """
-        element = elements[symbol]
-        btn = QPushButton(symbol)
-        # Reduce button size to make table more compact
-        btn.setFixedSize(40, 40)  # Compact size for better table display
-        btn.setStyleSheet(f"""
-            background-color: {colors[element["famille"]]};
-            border: 1px solid #333;
-            font-weight: bold;
-            font-size: 10px;
-            margin: 0;
-            padding: 0;
-        """)
-        btn.clicked.connect(lambda _, sym=symbol: self.show_element_info(sym))
-        self.element_grid.addWidget(btn, row, col)
+        self.table_widget = PeriodicTableWidget()
+        self.table_widget.elementClicked.connect(self.show_element_info)
+        self.table_widget.elementHovered.connect(self.image_loader.prefetch_neighbours)
+        parent_layout.addWidget(self.table_widget, 1)
 
     def create_legend(self, parent_layout):
         """
-        Create the element family color legend below the periodic table.
+        Create the colour selector and legend below the periodic table.
         
-        Generates a horizontal layout with color-coded indicators and labels
-        for each element family, helping users understand the color coding
-        used in the periodic table display.
+        A combo box chooses between the element family colours and the
+        property heatmaps. The family legend shows color-coded indicators
+        and labels for each element family; heatmaps replace it with a
+        colour scale of the selected property.
         
         Args:
             parent_layout (QVBoxLayout): The parent layout to add the legend to
@@ -320,7 +547,21 @@ class PeriodicTableApp(QMainWindow):
         Returns:
             None
         """
+        legend_row = QHBoxLayout()
+        self.color_selector = QComboBox()
+        self.color_selector.addItem("Colour by family", FAMILY_COLORS)
+        for name, label in PROPERTIES.items():
+            self.color_selector.addItem(label, name)
+        self.color_selector.currentIndexChanged.connect(
+            lambda: self.set_color_property(self.color_selector.currentData()))
+        legend_row.addWidget(self.color_selector)
+        self.nuclide_btn = QPushButton("☢ Chart of Nuclides")
+        self.nuclide_btn.clicked.connect(self.show_nuclide_chart)
+        legend_row.addWidget(self.nuclide_btn)
+
+        self.family_legend = QWidget()
         legend = QHBoxLayout()
+        legend.setContentsMargins(0, 0, 0, 0)
         legend.setSpacing(2)  # Minimal spacing between legend items
 
         for family, color in colors.items():
@@ -331,7 +572,8 @@ class PeriodicTableApp(QMainWindow):
             # Color indicator square
             color_box = QFrame()
             color_box.setFixedSize(12, 12)
-            color_box.setStyleSheet(f"background-color: {color}; border: 1px solid black;")
+            color_box.setObjectName("legendSwatch")
+            color_box.setProperty("family", family_key(family))
 
             # Family name label
             label = QLabel(family)
@@ -343,7 +585,93 @@ class PeriodicTableApp(QMainWindow):
             legend_item.setLayout(item_layout)
             legend.addWidget(legend_item)
 
-        parent_layout.addLayout(legend)
+        self.family_legend.setLayout(legend)
+        legend_row.addWidget(self.family_legend, 1)
+
+        # Colour scale shown instead of the families while a heatmap is displayed
+        self.scale_legend = ColorScaleLegend(COLORMAP)
+        self.scale_legend.hide()
+        legend_row.addWidget(self.scale_legend, 1)
+        parent_layout.addLayout(legend_row)
+
+    def set_color_property(self, name):
+        """
+        Colour the periodic table by element family or by a numeric property.
+        
+        Heatmaps are computed once per property and applied to the table
+        widget in a single repaint, so switching back and forth is instant.
+        
+        Args:
+            name (str): FAMILY_COLORS or a key of PROPERTIES
+            
+        Returns:
+            None
+        """
+        if name == FAMILY_COLORS:
+            self.table_widget.set_overlay({})
+            self.scale_legend.hide()
+            self.family_legend.show()
+        else:
+            heatmap = self.get_heatmap(name)
+            self.table_widget.set_heatmap(SYMBOLS, heatmap.colors, heatmap.known)
+            self.scale_legend.set_scale(heatmap.label, heatmap.vmin, heatmap.vmax)
+            self.family_legend.hide()
+            self.scale_legend.show()
+        self.color_property = name
+
+    def show_nuclide_chart(self):
+        """
+        Open the chart of nuclides, creating its window on first use.
+        
+        Args:
+            None
+            
+        Returns:
+            None
+        """
+        if self.nuclide_window is None:
+            self.nuclide_window = NuclideChartWindow(self)
+        self.nuclide_window.show()
+        self.nuclide_window.raise_()
+
+    def get_heatmap(self, name):
+        """
+        Return a property heatmap, computing it on first use.
+        
+        The quiz error rate is read from the event log after writing any
+        pending events.
+        
+        Args:
+            name (str): Key of PROPERTIES
+            
+        Returns:
+            Heatmap: The coloured property
+        """
+        if name not in self.heatmaps:
+            if name == "error_rate" and self.event_log is not None:
+                try:
+                    self.event_log.flush()
+                except sqlite3.Error as error:
+                    print(f"Quiz events were lost: {error}", file=sys.stderr)
+            self.heatmaps[name] = property_heatmap(name, self.event_log_path())
+        return self.heatmaps[name]
+
+    def refresh_error_rates(self):
+        """
+        Drop the cached quiz error rates, recolouring the table if they are shown.
+        
+        Called when a quiz ends, finished or abandoned, since its answers
+        change the rates.
+        
+        Args:
+            None
+            
+        Returns:
+            None
+        """
+        self.heatmaps.pop("error_rate", None)
+        if self.color_property == "error_rate":
+            self.set_color_property("error_rate")
 
     # ==================================================================================
     # QUIZ FUNCTIONALITY
@@ -351,11 +679,12 @@ class PeriodicTableApp(QMainWindow):
 
     def update_timer(self):
         """
-        Update the quiz timer display and handle timeout conditions.
+        Refresh the countdown display from the monotonic deadline.
         
-        Decrements the time remaining by 1 second, updates the timer display,
-        and triggers timeout handling when time reaches zero. Called every
-        second by the QTimer during quiz questions.
+        Shows the whole seconds remaining and schedules the next refresh for
+        the moment that number changes, so the display never drifts however
+        late a refresh runs. If the deadline has already passed (e.g. the
+        event loop was blocked) the question times out immediately.
         
         Args:
             None
@@ -363,26 +692,40 @@ class PeriodicTableApp(QMainWindow):
         Returns:
             None
         """
-        self.time_remaining -= 1
+        remaining = self.question_deadline - time.monotonic()
+        self.time_remaining = max(0, math.ceil(remaining))
         self.timer_display.setText(f"Time remaining: {self.time_remaining}s")
-        if self.time_remaining <= 0:
-            self.quiz_timer.stop()
+        if remaining <= 0:
+            self.stop_countdown()
             self.handle_timeout()
+        elif self.time_remaining > 1:
+            # The deadline timer takes over for the last second
+            self.display_timer.start(max(1, round((remaining - self.time_remaining + 1) * 1000)))
 
-    def start_quiz(self):
+    def start_quiz(self, mode=QUIZ_STANDARD):
         """
         Initialize and start a new quiz session.
         
         Prompts the user to choose between Multiple Choice or Free Response
         quiz format, then resets quiz state variables and begins the first
-        question. Handles user cancellation gracefully.
+        question. Handles user cancellation gracefully. While a quiz is
+        running the existing quiz dialog is simply brought to the front.
+        A review session loads the student's progress and asks the items
+        that are due, then a few new ones. An adaptive test calibrates the
+        item bank from every recorded answer and asks questions until the
+        student's ability is measured precisely enough.
         
         Args:
-            None
+            mode (str): QUIZ_STANDARD, QUIZ_REVIEW or QUIZ_ADAPTIVE
             
         Returns:
             None (returns early if user cancels format selection)
         """
+        if self.quiz_state == QUIZ_QUESTION and self.quiz_dialog is not None:
+            self.quiz_dialog.raise_()
+            self.quiz_dialog.activateWindow()
+            return
+
         quiz_type, ok = QInputDialog.getItem(
             self, "Quiz Format", "Choose quiz format:",
             ["Multiple Choice", "Free Response"], 0, False
@@ -391,286 +734,353 @@ class PeriodicTableApp(QMainWindow):
             return
 
         self.quiz_type = quiz_type
+        self.quiz_mode = mode
+        self.quiz_session = uuid.uuid4().hex
+        if mode == QUIZ_REVIEW:
+            self.review_scheduler = ReviewScheduler(self.get_progress_store(), self.student,
+                                                    self.quiz_engine.pool)
+        elif mode == QUIZ_ADAPTIVE:
+            bank = ItemBank.from_engine(self.quiz_engine).calibrate(self.get_progress_store().history())
+            self.adaptive_session = AdaptiveSession(bank)
         self.score = 0
         self.question_count = 0
         self.quiz_active = True
         self.update_score_display()
-        self.time_remaining = 30
+        self.time_remaining = QUESTION_TIME
         self.ask_question()
 
+    def get_quiz_dialog(self):
+        """
+        Return the persistent quiz dialog, creating it on first use.
+        
+        The dialog's signals drive the quiz state machine: answers go to
+        submit_answer, "New Question" to skip_question and closing the
+        dialog or "Exit Quiz" to exit_quiz.
+        
+        Args:
+            None
+            
+        Returns:
+            QuizDialog: The session's quiz dialog
+        """
+        if self.quiz_dialog is None:
+            self.quiz_dialog = QuizDialog(self)
+            self.quiz_dialog.answerSubmitted.connect(self.submit_answer)
+            self.quiz_dialog.skipRequested.connect(self.skip_question)
+            self.quiz_dialog.exitRequested.connect(self.exit_quiz)
+        return self.quiz_dialog
+
     def ask_question(self):
         """
-        Present a new quiz question to the user.
+        Present the next quiz question in the persistent quiz dialog.
         
-        Generates a random question from available question types, creates
-        the appropriate dialog interface (multiple choice or free response),
-        starts the timer, and handles user interactions. Manages quiz
-        completion and question progression.
+        Takes the next question from the headless quiz engine, repopulates
+        the quiz dialog, restarts the countdown and returns immediately. The answer, skip,
+        exit and timeout signals then move the quiz to the next state, so
+        the call stack does not grow with the length of the session.
         
         Args:
             None
             
         Returns:
-            None (returns early if quiz is complete or inactive)
+            None (finishes the quiz if it is complete or inactive)
         """
-        if not self.quiz_active or self.question_count >= 10:
-            if self.quiz_active:
-                QMessageBox.information(self, "Quiz Complete! 🎉",
-                                      f"Final Score: {self.score}/10")
-            self.quiz_active = False
+        if not self.quiz_active:
+            self.finish_quiz()
             return
 
         self.user_answer = None
+        self.quiz_engine.multiple_choice = self.quiz_type == "Multiple Choice"
+        self.current_question = self.next_quiz_question()
+        if self.current_question is None:
+            self.finish_quiz()
+            return
+        self.current_answer = self.current_question.answer
 
-        # Filter elements excluding complex transition metals and rare earths
-        allowed_symbols = [
-            sym for sym in elements
-            if elements[sym]["famille"] not in ['Transition Metal', 'Lanthanide', 'Actinide']
-        ]
-        symbol = random.choice(allowed_symbols)
-        element = elements[symbol]
+        # Reset timer and start countdown
+        self.quiz_state = QUIZ_QUESTION
+        self.start_countdown()
 
-        # Random question type selection
-        question_type = random.choice(["symbol", "atomic_number","electron_config", "electron_config_reverse","production", "production_reverse"])
+        dialog = self.get_quiz_dialog()
+        dialog.show_question(self.current_question.prompt, self.current_question.options)
+        dialog.show()
+        dialog.raise_()
+
+    def next_quiz_question(self):
+        """
+        Draw the next question of the session.
+        
+        Standard quizzes draw random questions; review sessions ask the
+        student's due items first, then new ones, until nothing is left
+        to review; adaptive tests ask the most informative item until the
+        ability estimate reaches its target precision.
+        
+        Args:
+            None
+            
+        Returns:
+            Question: The next question, or None when the session is over
+        """
+        if self.quiz_mode == QUIZ_REVIEW:
+            if self.question_count >= REVIEW_SESSION_SIZE:
+                return None
+            item = self.review_scheduler.next_item()
+            return None if item is None else self.quiz_engine.generate(*item)
+        if self.quiz_mode == QUIZ_ADAPTIVE:
+            item = self.adaptive_session.next_item()
+            return None if item is None else self.quiz_engine.generate(*item)
+        if self.question_count >= QUIZ_LENGTH:
+            return None
+        return self.quiz_engine.next_question()
+
+    def record_result(self, correct, quality, outcome, response_time):
+        """
+        Record the result of the current question.
+        
+        Every result is queued on the event log. Review sessions also
+        reschedule the item; adaptive tests update the ability estimate and
+        add the answer to the history used to calibrate item difficulties.
+        
+        Args:
+            correct (bool): Whether the question was answered correctly
+            quality (int): SM-2 quality of the answer
+            outcome (str): 'answer', 'skip' or 'timeout'
+            response_time (float): Seconds taken, measured before any feedback was shown
+            
+        Returns:
+            None
+        """
+        self.last_response_time = response_time
+        if self.current_question is None:
+            return
+        item = (self.current_question.symbol, self.current_question.type)
+        event_log = self.get_event_log()
+        if event_log is not None:
+            event_log.log(AnswerEvent(self.quiz_session or "", self.student, *item,
+                                      self.quiz_mode, outcome, correct, response_time,
+                                      time.time()))
+        if self.quiz_mode == QUIZ_REVIEW:
+            self.review_scheduler.record(item, correct, quality)
+        elif self.quiz_mode == QUIZ_ADAPTIVE:
+            self.adaptive_session.record(item, correct)
+            self.progress_store.record_answer(self.student, *item, correct, quality, time.time())
+
+    def get_event_log(self):
+        """
+        Return the quiz event log, opening it on first use.
+        
+        The log path can be overridden with the PERIODICTABLE_EVENT_LOG
+        environment variable. If the database cannot be opened, logging is
+        disabled for the rest of the session.
+        
+        Args:
+            None
+            
+        Returns:
+            EventLog: The open event log, or None if it could not be opened
+        """
+        if self.event_log is None and self.event_log_error is None:
+            try:
+                self.event_log = EventLog(self.event_log_path())
+            except (sqlite3.Error, OSError) as error:
+                self.event_log_error = error
+                print(f"Quiz events are not logged: {error}", file=sys.stderr)
+        return self.event_log
+
+    def event_log_path(self):
+        """
+        Return the event log path (PERIODICTABLE_EVENT_LOG or the default).
+        
+        Args:
+            None
+            
+        Returns:
+            str: Database file of the event log
+        """
+        return os.environ.get("PERIODICTABLE_EVENT_LOG", DEFAULT_EVENT_LOG)
 
-        # Generate question based on type
-        if question_type == "symbol":
-            question = f"What is the name of the element with symbol <b>{symbol}</b>?"
-            self.current_answer = element["nom"]
+    def get_progress_store(self):
+        """
+        Return the review progress database, opening it on first use.
+        
+        The database path can be overridden with the
+        PERIODICTABLE_PROGRESS_DB environment variable.
+        
+        Args:
+            None
+            
+        Returns:
+            ProgressStore: The open progress store
+        """
+        if self.progress_store is None:
+            path = os.environ.get("PERIODICTABLE_PROGRESS_DB", DEFAULT_DB_PATH)
+            self.progress_store = ProgressStore(path)
+        return self.progress_store
 
-        elif question_type == "atomic_number":
-            question = f"What is the name of the element with atomic number <b>{element['num']}</b>?"
-            self.current_answer = element["nom"]
+    def submit_answer(self, answer):
+        """
+        Grade the answer to the current question and move on.
+        
+        Ignored unless a question is awaiting an answer, so late clicks or a
+        timeout racing an answer cannot grade the same question twice. An
+        empty free response keeps the current question open.
+        
+        Args:
+            answer (str): The user's answer
+            
+        Returns:
+            None
+        """
+        if self.quiz_state != QUIZ_QUESTION:
+            return
+        if not answer:
+            self.check_answer(answer)
+            return
+        response_time = self.response_time()
+        self.quiz_state = QUIZ_FEEDBACK
+        self.stop_countdown()
+        self.user_answer = answer
+        correct = self.check_answer(answer)
+        self.record_result(correct, PERFECT if correct else WRONG, "answer", response_time)
+        self.question_count += 1
+        self.ask_question()
 
-        elif question_type == "electron_config":
-            if "electron_config" in element:
-                question = f"Which element has the electron configuration <b>{element['electron_config']}</b>?"
-                self.current_answer = element["nom"]
-            else:
-                return self.ask_question()  # Skip if electron config not defined
-
-        elif question_type == "production":
-            methods = production_methods.get(symbol, [])
-            if methods:
-                method = random.choice(methods) if isinstance(methods, list) else list(methods.values())[0]
-                question = f"Which element is produced by the following method?<br><b>{method}</b>"
-                self.current_answer = element["nom"]
-            else:
-                return self.ask_question()  # Skip if no production method available
+    def skip_question(self):
+        """
+        Skip the current question, counting it as unanswered.
+        
+        Args:
+            None
             
-        elif question_type == "electron_config_reverse":
-            if "electron_config" in element:
-                question = f"What is the electron configuration of <b>{element['nom']}</b>?"
-                self.current_answer = element["electron_config"]
-            else:
-                return self.ask_question()
-
-        elif question_type == "production_reverse":
-            methods = production_methods.get(symbol, [])
-            if methods:
-                method = random.choice(methods) if isinstance(methods, list) else list(methods.values())[0]
-                question = f"Which production method corresponds to <b>{element['nom']}</b>?"
-                self.current_answer = method
-            else:
-                return self.ask_question()
+        Returns:
+            None
+        """
+        if self.quiz_state != QUIZ_QUESTION:
+            return
+        response_time = self.response_time()
+        self.stop_countdown()
+        self.record_result(False, BLACKOUT, "skip", response_time)
+        self.question_count += 1
+        self.ask_question()
 
-        # Set correct answer for name-based questions
-        if question_type in ["symbol", "atomic_number", "electron_config", "production"]:
-            self.current_answer = element["nom"]
+    def exit_quiz(self):
+        """
+        Abandon the running quiz and hide the quiz dialog.
+        
+        Args:
+            None
             
-        # Reset timer and start countdown
-        self.time_remaining = 30
-        self.quiz_timer.start()
-
-        # Create question dialog
-        quiz_dialog = QDialog(self)
-        quiz_dialog.setWindowTitle("Element Quiz 🎲 (30s)")
-        quiz_dialog.setMinimumSize(400, 200)
-        dialog_layout = QVBoxLayout(quiz_dialog)
-
-        # Question display
-        question_label = QLabel(question)
-        question_label.setStyleSheet("font-size: 16px; color: black; padding: 10px;")
-        question_label.setAlignment(Qt.AlignCenter)
-        dialog_layout.addWidget(question_label)
-
-        # Answer section - Multiple Choice or Free Response
-        if self.quiz_type == "Multiple Choice":
-            # Generate multiple choice options
-            options = [self.current_answer]
-            seen = set(options)
-            attempts = 0
-            max_attempts = 100
-
-            # Generate 3 additional incorrect options
-            while len(options) < 4 and attempts < max_attempts:
-                attempts += 1
-                other_symbol = random.choice(allowed_symbols)
-                other_element = elements[other_symbol]
-
-                # Generate candidate answer based on question type
-                if question_type in ["symbol", "atomic_number", "electron_config", "production"]:
-                    candidate = other_element["nom"]
-
-                elif question_type == "electron_config_reverse":
-                    candidate = other_element.get("electron_config", None)
-
-                elif question_type == "production_reverse":
-                    methods = production_methods.get(other_symbol)
-                    if isinstance(methods, list) and methods:
-                        candidate = random.choice(methods)
-                    elif isinstance(methods, dict) and methods:
-                        candidate = list(methods.values())[0]
-                    else:
-                        candidate = None
-                else:
-                    candidate = None
-
-                # Add unique valid candidates
-                if candidate and candidate not in seen:
-                    options.append(candidate)
-                    seen.add(candidate)
-
-            # Fill remaining slots if needed
-            while len(options) < 4:
-                options.append("N/A")
-
-            random.shuffle(options)
-
-            # Create option buttons
-            for option in options:
-                btn = QPushButton(option)
-                btn.setStyleSheet("""
-                    QPushButton {
-                        padding: 10px;
-                        margin: 5px;
-                        background-color: #CF9FFF;
-                        border: 1px solid #ccc;
-                    }
-                    QPushButton:hover {
-                        background-color: #7F00FF;
-                    }
-                """)
-                btn.clicked.connect(lambda _, opt=option: self.mc_answer_selected(opt, quiz_dialog))
-                dialog_layout.addWidget(btn)
-        else:
-            # Free response input field
-            self.answer_input = QLineEdit()
-            self.answer_input.setStyleSheet("font-size: 14px; margin: 10px;")
-            dialog_layout.addWidget(self.answer_input)
-
-        # Control buttons layout
-        control_layout = QHBoxLayout()
-
-        # Exit quiz button
-        exit_btn = QPushButton("Exit Quiz")
-        exit_btn.setStyleSheet(
-            "QPushButton { padding: 8px 16px; margin: 5px; "
-            "background-color: #f44336; color: white; }"
-            "QPushButton:hover { background-color: #d32f2f; }"
-        )
-        exit_btn.clicked.connect(lambda: quiz_dialog.done(2))
-
-        # New question button
-        new_btn = QPushButton("New Question")
-        new_btn.setStyleSheet(
-            "QPushButton { padding: 8px 16px; margin: 5px; "
-            "background-color: #2196F3; color: white; }"
-            "QPushButton:hover { background-color: #1976D2; }"
-        )
-        new_btn.clicked.connect(quiz_dialog.reject)
-
-        # Submit button for free response
-        if self.quiz_type != "Multiple Choice":
-            submit_btn = QPushButton("Submit")
-            submit_btn.setStyleSheet(
-                "QPushButton { padding: 8px 24px; margin: 5px; "
-                "background-color: #4CAF50; color: white; }"
-                "QPushButton:hover { background-color: #388E3C; }"
-            )
-            submit_btn.clicked.connect(quiz_dialog.accept)
-            control_layout.addWidget(submit_btn)
-
-        control_layout.addWidget(exit_btn)
-        control_layout.addWidget(new_btn)
-        control_layout.addStretch()
-        dialog_layout.addLayout(control_layout)
-
-        # Display dialog and handle events
-        self.current_dialog = quiz_dialog
-        event_loop = QEventLoop()
-        quiz_dialog.finished.connect(event_loop.quit)
-        quiz_dialog.show()
-        event_loop.exec_()
-
-        # Process dialog results
-        self.quiz_timer.stop()
-        result = quiz_dialog.result()
-
-        if result == QDialog.Accepted:
-            # User submitted an answer
-            answer = (self.user_answer if self.quiz_type == "Multiple Choice"
-                     else self.answer_input.text())
-            if answer:
-                self.check_answer(answer)
-                self.question_count += 1
-            self.ask_question()
-        elif result == 2:
-            # User exited quiz
+        Returns:
+            None
+        """
+        self.stop_countdown()
+        if self.quiz_dialog is not None:
+            self.quiz_dialog.hide()
+        if self.progress_store is not None:
+            self.progress_store.flush()
+        if self.quiz_state != QUIZ_IDLE:
+            self.quiz_state = QUIZ_IDLE
             self.quiz_active = False
-            QMessageBox.information(self, "Quiz Abandoned", f"Current Score: {self.score}/10")
-        else:
-            # User requested new question (skip current)
-            self.question_count += 1
-            self.ask_question()
+            QMessageBox.information(self, "Quiz Abandoned",
+                                  f"Current Score: {self.score}/{self.question_count}")
+        self.refresh_error_rates()
 
-    def mc_answer_selected(self, answer, dialog):
+    def finish_quiz(self):
+        """
+        End the quiz, hide the quiz dialog and show the final score.
+        
+        Review sessions also report how many items are still due, adaptive
+        tests the ability estimate; both write the session's answers to the
+        progress store.
+        
+        Args:
+            None
+            
+        Returns:
+            None
+        """
+        self.stop_countdown()
+        if self.quiz_dialog is not None:
+            self.quiz_dialog.hide()
+        if self.quiz_mode == QUIZ_REVIEW and self.review_scheduler is not None:
+            self.progress_store.flush()
+            if self.quiz_active:
+                QMessageBox.information(self, "Review Complete! 🔁",
+                                      f"Reviewed: {self.question_count} items\n"
+                                      f"Correct: {self.score}\n"
+                                      f"Still due: {self.review_scheduler.due_count()}")
+        elif self.quiz_mode == QUIZ_ADAPTIVE and self.adaptive_session is not None:
+            self.progress_store.flush()
+            if self.quiz_active:
+                session = self.adaptive_session
+                QMessageBox.information(self, "Adaptive Test Complete! 🎯",
+                                      f"Questions: {len(session.responses)}\n"
+                                      f"Correct: {self.score}\n"
+                                      f"Ability: {session.theta:+.2f} ± {session.standard_error:.2f}")
+        elif self.quiz_active:
+            QMessageBox.information(self, "Quiz Complete! 🎉",
+                                  f"Final Score: {self.score}/{self.question_count}")
+        self.quiz_active = False
+        self.quiz_state = QUIZ_IDLE
+        self.refresh_error_rates()
+
+    def mc_answer_selected(self, answer):
         """
         Handle multiple choice answer selection.
         
-        Called when user clicks on a multiple choice option button.
-        Stores the selected answer and closes the dialog to proceed
-        with answer checking.
+        Stores the selected answer and grades it, exactly as if the option
+        button had been clicked in the quiz dialog.
         
         Args:
             answer (str): The selected answer text
-            dialog (QDialog): The quiz dialog to close
             
         Returns:
             None
         """
         self.user_answer = answer
-        dialog.accept()
+        self.submit_answer(answer)
 
     def check_answer(self, answer):
         """
         Validate user's answer against the correct answer and update score.
         
-        Normalizes both the user's answer and correct answer for comparison,
-        updates the score if correct, and displays appropriate feedback
+        Multiple choice answers must match exactly after normalization;
+        free responses go through the engine's fuzzy matcher, which accepts
+        small typos and names the element a wrong answer was closest to.
+        Updates the score if correct and displays appropriate feedback
         messages with the correct answer information.
         
         Args:
             answer (str): The user's submitted answer
             
         Returns:
-            None (returns early if no answer provided)
+            bool: True if the answer was correct (False if no answer provided)
         """
         if not answer:
             QMessageBox.warning(self, "No Answer", "Please provide an answer!")
-            return
+            return False
 
-        normalized_answer = self.normalize_text(answer)
-        normalized_correct = self.normalize_text(self.current_answer)
+        if self.quiz_type == "Multiple Choice":
+            result = None
+            correct = answers_match(answer, self.current_answer)
+        else:
+            result = self.quiz_engine.check(answer, self.current_answer)
+            correct = result.correct
 
-        if normalized_answer == normalized_correct:
+        if correct:
             self.score += 1
             self.update_score_display()
+            # The question being graded is counted once this returns
+            spelling = "" if result is None or result.exact else "\n(accepted despite a small typo)"
             QMessageBox.information(self, "Correct! 🎉",
-                                  f"Correct answer! ✔️\nAnswer was: {self.current_answer}\nCurrent Score: {self.score}/10")
+                                  f"Correct answer! ✔️{spelling}\nAnswer was: {self.current_answer}\nCurrent Score: {self.score}/{self.question_count + 1}")
         else:
+            closest = ""
+            if result is not None and result.closest_symbol and result.closest_answer != self.current_answer:
+                closest = f"\nYour answer is closest to: {result.closest_answer} ({result.closest_symbol})"
             QMessageBox.warning(self, "Incorrect 😢",
-                              f"Wrong answer! ❌\nCorrect answer: {self.current_answer}")
+                              f"Wrong answer! ❌\nCorrect answer: {self.current_answer}{closest}")
+        return correct
 
     def normalize_text(self, text):
         """
@@ -686,16 +1096,17 @@ class PeriodicTableApp(QMainWindow):
         Returns:
             str: Normalized text with accents removed, lowercase, no spaces
         """
-        return ''.join(c for c in unicodedata.normalize('NFD', text)
-                     if unicodedata.category(c) != 'Mn').lower().replace(" ", "")
+        return normalize_text(text)
 
     def handle_timeout(self):
         """
-        Handle quiz question timeout when timer reaches zero.
+        Handle quiz question timeout when the deadline timer fires.
         
-        Stops the timer, displays timeout message with correct answer,
-        increments question count, closes current dialog, and proceeds
-        to the next question automatically.
+        Stops the countdown before the modal timeout message is shown, so
+        no timer can fire again underneath it, records the full question
+        time as the response time, increments question count and shows the
+        next question in the same dialog. Ignored unless a question is
+        awaiting an answer.
         
         Args:
             None
@@ -703,15 +1114,15 @@ class PeriodicTableApp(QMainWindow):
         Returns:
             None
         """
-        self.quiz_timer.stop()
+        self.stop_countdown()
+        if self.quiz_state != QUIZ_QUESTION:
+            return
+        self.quiz_state = QUIZ_FEEDBACK
+        self.record_result(False, BLACKOUT, "timeout", QUESTION_TIME)
         QMessageBox.warning(self, "⏰ Time's Up!",
                         f"Time expired! Correct answer was: {self.current_answer}")
 
         self.question_count += 1
-
-        if self.current_dialog:
-            self.current_dialog.close()
-
         self.ask_question()
 
     # ==================================================================================
@@ -759,83 +1170,47 @@ class PeriodicTableApp(QMainWindow):
         
         return "<br>".join(content)
     
-    def add_production_info(self, layout, symbol):
+    def get_network_content(self, symbol):
         """
-        Add production methods section to element information dialog.
+        Generate formatted HTML listing reactions that make or use an element.
         
-        Creates and adds widgets displaying production method information
-        to the provided layout, including a section header and formatted
-        content with proper styling.
+        Queries the cached reaction network for reactions producing the
+        element in its elemental form ("made from") and reactions consuming
+        it ("used to make").
         
         Args:
-            layout (QVBoxLayout): The layout to add production info widgets to
             symbol (str): Chemical symbol of the element
             
         Returns:
-            None
+            str: HTML-formatted string, empty if the element appears in no reaction
         """
-        print(f"Adding production info for {symbol}")  # Debug print
-        print(f"Production methods: {production_methods.get(symbol)}")  # Debug print
-    
-        # Section header
-        section_header = QLabel("<b>Production Methods:</b>")
-        section_header.setStyleSheet("font-size: 14px; padding-top: 15px;")
-        layout.addWidget(section_header)
-    
-        # Content with formatting
-        content = self.get_production_content(symbol)
-        print(f"Production content: {content}")  # Debug print
-    
-        content_label = QLabel(content)
-        content_label.setStyleSheet("font-size: 12px; color: black; margin-left: 10px;")
-        content_label.setWordWrap(True)
-        layout.addWidget(content_label)
-    
-    def show_element_info(self, symbol):
+        network = reaction_network()
+        content = []
+        for title, reactions in (("Made from", network.made_from(symbol)),
+                                 ("Used to make", network.used_to_make(symbol))):
+            if reactions:
+                content.append(f"<b>{title}:</b>")
+                content.extend(f"• {reaction}" for reaction in reactions)
+        return "<br>".join(content)
+
+    def prepare_element_content(self, symbol):
         """
-        Display detailed information dialog for a selected element.
+        Build the content bundle displayed by the element information dialog.
         
-        Creates a modal dialog showing comprehensive element information
-        including atomic structure image, basic properties, electron
-        configuration, isotopes, and production methods. Handles missing
-        images gracefully with fallback text.
+        Formats the element properties and production HTML. The atomic
+        structure image is not part of the bundle; it is decoded in the
+        background by the image loader.
         
         Args:
-            symbol (str): Chemical symbol of the element to display
+            symbol (str): Chemical symbol of the element
             
         Returns:
-            None
+            ElementContent: Prepared HTML for the element
         """
         element = elements[symbol]
-        info_dialog = QDialog(self)
-        info_dialog.setWindowTitle(f"Atomic Structure - {element['nom']}")
-        info_dialog.setFixedSize(600, 700)
-        layout = QVBoxLayout(info_dialog)
-    
-        # Atomic structure image display
-        img_label = QLabel()
-        try:
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            img_path = os.path.join(current_dir, "..", "..", "scientific_structures",
-                                  f"{symbol}_scientific.png")
-    
-            if os.path.exists(img_path):
-                pixmap = QPixmap(img_path)
-                img_label.setPixmap(pixmap.scaled(400, 400,
-                                                Qt.KeepAspectRatio,
-                                                Qt.SmoothTransformation))
-            else:
-                raise FileNotFoundError
-        except Exception as e:
-            # Fallback for missing images
-            img_label.setText(f"<i>Atomic structure for {symbol} not available</i>")
-            img_label.setStyleSheet("color: #666; font-size: 14px;")
-    
-        img_label.setAlignment(Qt.AlignCenter)
-        layout.addWidget(img_label)
-    
+
         # Element properties information
-        info_text = QLabel(
+        info_html = (
             f"<b>{element['nom']} ({symbol})</b><br>"
             f"Atomic Number: {element['num']}<br>"
             f"Atomic Weight: {element['masse']} u<br>"
@@ -844,14 +1219,63 @@ class PeriodicTableApp(QMainWindow):
             f"Electron Configuration: {element['electron_config']}<br>"
             f"Isotopes: {', '.join(element['isotopes'])}<br><br>"
         )
-        info_text.setStyleSheet("font-size: 14px; padding: 15px;")
-        layout.addWidget(info_text)
-    
-        # Add production methods if available
+
+        # Production methods if available, then reactions from the whole dataset
+        sections = []
         if production_methods.get(symbol):
-            self.add_production_info(layout, symbol)
-    
-        info_dialog.exec_()
+            sections.append(self.get_production_content(symbol))
+        network = self.get_network_content(symbol)
+        if network:
+            sections.append(network)
+        production_html = "<br><br>".join(sections)
+
+        return ElementContent(symbol, f"Atomic Structure - {element['nom']}",
+                              info_html, production_html)
+
+    def show_element_info(self, symbol):
+        """
+        Display detailed information dialog for a selected element.
+        
+        Reuses one persistent dialog and fills it from the LRU content
+        cache, preparing the element's bundle only on a cache miss. The
+        cache holds at most INFO_CACHE_SIZE bundles, so browsing many
+        elements does not grow memory. The structure image comes from the
+        pixmap cache or is requested from the background loader, and the
+        neighbouring tiles are prefetched.
+        
+        Args:
+            symbol (str): Chemical symbol of the element to display
+            
+        Returns:
+            None
+        """
+        content = self.element_content_cache.get(symbol)
+        if content is None:
+            content = self.prepare_element_content(symbol)
+            self.element_content_cache.put(symbol, content)
+
+        if self.info_dialog is None:
+            self.info_dialog = ElementInfoDialog(self)
+        self.info_dialog.show_content(content, self.image_loader.cached(symbol))
+        self.image_loader.request(symbol)
+        self.image_loader.prefetch_neighbours(symbol)
+        self.info_dialog.exec_()
+
+    def on_structure_image(self, symbol, pixmap):
+        """
+        Hand a decoded structure image to the element dialog.
+        
+        The dialog ignores images of elements it is no longer showing.
+        
+        Args:
+            symbol (str): Element symbol the image belongs to
+            pixmap (QPixmap): Decoded image, null if the element has none
+            
+        Returns:
+            None
+        """
+        if self.info_dialog is not None:
+            self.info_dialog.set_pixmap(symbol, pixmap)
 
     def update_score_display(self):
         """
@@ -868,6 +1292,27 @@ class PeriodicTableApp(QMainWindow):
         """
         self.score_display.setText(f"Score: {self.score}")
 
+    def closeEvent(self, event):
+        """
+        Save pending review progress and quiz events before the window closes.
+        
+        Args:
+            event (QCloseEvent): The close event
+            
+        Returns:
+            None
+        """
+        if self.progress_store is not None:
+            self.progress_store.close()
+            self.progress_store = None
+        if self.event_log is not None:
+            try:
+                self.event_log.close()
+            except sqlite3.Error as error:
+                print(f"Quiz events were lost: {error}", file=sys.stderr)
+            self.event_log = None
+        super().closeEvent(event)
+
 # ======================================================================================
 # APPLICATION ENTRY POINT
 # ======================================================================================